@@ -4,12 +4,18 @@
 // @ts-nocheck
 
 import {
+  BatchSearchTheoremRequest,
+  BatchSearchTheoremResponse,
   CallRequest,
   CallResponse,
+  CheckReachabilityRequest,
+  CheckReachabilityResponse,
   ClickRequest,
   ClickResponse,
   FeedbackRequest,
   FeedbackResponse,
+  FindDependencyPathsRequest,
+  FindDependencyPathsResponse,
   GetAllRevRequest,
   GetAllRevResponse,
   GetDependencyNodesAndEdgesRequest,
@@ -18,8 +24,14 @@ import {
   GetDependentNodesAndEdgesResponse,
   GetNodeSuggestionsRequest,
   GetNodeSuggestionsResponse,
+  MultiRevSearchTheoremRequest,
+  MultiRevSearchTheoremResponse,
   SearchTheoremRequest,
   SearchTheoremResponse,
+  SearchTheoremStreamRequest,
+  SearchTheoremStreamResponse,
+  TraverseGraphRequest,
+  TraverseGraphResponse,
 } from "./state_search_pb.ts";
 import { MethodKind } from "@bufbuild/protobuf";
 
@@ -53,6 +65,39 @@ export const LeanStateSearchService = {
       O: SearchTheoremResponse,
       kind: MethodKind.Unary,
     },
+    /**
+     * Search theorem according to the query, streaming the hits in rank order.
+     *
+     * @generated from rpc state_search.v1.LeanStateSearchService.SearchTheoremStream
+     */
+    searchTheoremStream: {
+      name: "SearchTheoremStream",
+      I: SearchTheoremStreamRequest,
+      O: SearchTheoremStreamResponse,
+      kind: MethodKind.ServerStreaming,
+    },
+    /**
+     * Search theorems for many queries against the same rev at once.
+     *
+     * @generated from rpc state_search.v1.LeanStateSearchService.BatchSearchTheorem
+     */
+    batchSearchTheorem: {
+      name: "BatchSearchTheorem",
+      I: BatchSearchTheoremRequest,
+      O: BatchSearchTheoremResponse,
+      kind: MethodKind.Unary,
+    },
+    /**
+     * Search theorem according to the query in several revs at once.
+     *
+     * @generated from rpc state_search.v1.LeanStateSearchService.MultiRevSearchTheorem
+     */
+    multiRevSearchTheorem: {
+      name: "MultiRevSearchTheorem",
+      I: MultiRevSearchTheoremRequest,
+      O: MultiRevSearchTheoremResponse,
+      kind: MethodKind.Unary,
+    },
     /**
      * Collect feedbacks from user.
      *
@@ -120,5 +165,38 @@ export const LeanGraphService = {
       O: GetNodeSuggestionsResponse,
       kind: MethodKind.Unary,
     },
+    /**
+     * Breadth-first traversal of dependencies or dependents, bounded in depth and size.
+     *
+     * @generated from rpc state_search.v1.LeanGraphService.TraverseGraph
+     */
+    traverseGraph: {
+      name: "TraverseGraph",
+      I: TraverseGraphRequest,
+      O: TraverseGraphResponse,
+      kind: MethodKind.Unary,
+    },
+    /**
+     * Shortest chains of dependencies leading from one node to another.
+     *
+     * @generated from rpc state_search.v1.LeanGraphService.FindDependencyPaths
+     */
+    findDependencyPaths: {
+      name: "FindDependencyPaths",
+      I: FindDependencyPathsRequest,
+      O: FindDependencyPathsResponse,
+      kind: MethodKind.Unary,
+    },
+    /**
+     * Whether nodes transitively depend on others, for many pairs at once.
+     *
+     * @generated from rpc state_search.v1.LeanGraphService.CheckReachability
+     */
+    checkReachability: {
+      name: "CheckReachability",
+      I: CheckReachabilityRequest,
+      O: CheckReachabilityResponse,
+      kind: MethodKind.Unary,
+    },
   },
 } as const;
@@ -13,6 +13,38 @@ import type {
 } from "@bufbuild/protobuf";
 import { Message, proto3 } from "@bufbuild/protobuf";
 
+/**
+ * @generated from enum state_search.v1.TraversalDirection
+ */
+export enum TraversalDirection {
+  /**
+   * Treated as dependencies.
+   *
+   * @generated from enum value: TRAVERSAL_DIRECTION_UNSPECIFIED = 0;
+   */
+  UNSPECIFIED = 0,
+
+  /**
+   * @generated from enum value: TRAVERSAL_DIRECTION_DEPENDENCIES = 1;
+   */
+  DEPENDENCIES = 1,
+
+  /**
+   * @generated from enum value: TRAVERSAL_DIRECTION_DEPENDENTS = 2;
+   */
+  DEPENDENTS = 2,
+}
+// Retrieve enum metadata with: proto3.getEnumType(TraversalDirection)
+proto3.util.setEnumType(
+  TraversalDirection,
+  "state_search.v1.TraversalDirection",
+  [
+    { no: 0, name: "TRAVERSAL_DIRECTION_UNSPECIFIED" },
+    { no: 1, name: "TRAVERSAL_DIRECTION_DEPENDENCIES" },
+    { no: 2, name: "TRAVERSAL_DIRECTION_DEPENDENTS" },
+  ],
+);
+
 /**
  * A theorem from Mathlib
  *
@@ -307,659 +339,1976 @@ export class SearchTheoremResponse extends Message<SearchTheoremResponse> {
 }
 
 /**
- * @generated from message state_search.v1.FeedbackRequest
+ * @generated from message state_search.v1.SearchTheoremStreamRequest
  */
-export class FeedbackRequest extends Message<FeedbackRequest> {
+export class SearchTheoremStreamRequest extends Message<SearchTheoremStreamRequest> {
   /**
    * @generated from field: string query = 1;
    */
   query = "";
 
   /**
-   * @generated from field: string theorem_id = 2;
-   */
-  theoremId = "";
-
-  /**
-   * @generated from field: bool relevant = 3;
-   */
-  relevant = false;
-
-  /**
-   * @generated from field: bool update = 4;
+   * @generated from field: int32 nresult = 2;
    */
-  update = false;
+  nresult = 0;
 
   /**
-   * @generated from field: int32 rank = 5;
+   * @generated from field: string rev = 3;
    */
-  rank = 0;
+  rev = "";
 
-  constructor(data?: PartialMessage<FeedbackRequest>) {
+  constructor(data?: PartialMessage<SearchTheoremStreamRequest>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.FeedbackRequest";
+  static readonly typeName = "state_search.v1.SearchTheoremStreamRequest";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
     { no: 1, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 2, name: "theorem_id", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 3, name: "relevant", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
-    { no: 4, name: "update", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
-    { no: 5, name: "rank", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 2, name: "nresult", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 3, name: "rev", kind: "scalar", T: 9 /* ScalarType.STRING */ },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): FeedbackRequest {
-    return new FeedbackRequest().fromBinary(bytes, options);
+  ): SearchTheoremStreamRequest {
+    return new SearchTheoremStreamRequest().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): FeedbackRequest {
-    return new FeedbackRequest().fromJson(jsonValue, options);
+  ): SearchTheoremStreamRequest {
+    return new SearchTheoremStreamRequest().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): FeedbackRequest {
-    return new FeedbackRequest().fromJsonString(jsonString, options);
+  ): SearchTheoremStreamRequest {
+    return new SearchTheoremStreamRequest().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a: FeedbackRequest | PlainMessage<FeedbackRequest> | undefined,
-    b: FeedbackRequest | PlainMessage<FeedbackRequest> | undefined,
+    a:
+      | SearchTheoremStreamRequest
+      | PlainMessage<SearchTheoremStreamRequest>
+      | undefined,
+    b:
+      | SearchTheoremStreamRequest
+      | PlainMessage<SearchTheoremStreamRequest>
+      | undefined,
   ): boolean {
-    return proto3.util.equals(FeedbackRequest, a, b);
+    return proto3.util.equals(SearchTheoremStreamRequest, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.FeedbackResponse
+ * @generated from message state_search.v1.SearchTheoremStreamResponse
  */
-export class FeedbackResponse extends Message<FeedbackResponse> {
-  constructor(data?: PartialMessage<FeedbackResponse>) {
+export class SearchTheoremStreamResponse extends Message<SearchTheoremStreamResponse> {
+  /**
+   * The next hits in rank order.
+   *
+   * @generated from field: repeated state_search.v1.Theorem results = 1;
+   */
+  results: Theorem[] = [];
+
+  constructor(data?: PartialMessage<SearchTheoremStreamResponse>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.FeedbackResponse";
-  static readonly fields: FieldList = proto3.util.newFieldList(() => []);
+  static readonly typeName = "state_search.v1.SearchTheoremStreamResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "results", kind: "message", T: Theorem, repeated: true },
+  ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): FeedbackResponse {
-    return new FeedbackResponse().fromBinary(bytes, options);
+  ): SearchTheoremStreamResponse {
+    return new SearchTheoremStreamResponse().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): FeedbackResponse {
-    return new FeedbackResponse().fromJson(jsonValue, options);
+  ): SearchTheoremStreamResponse {
+    return new SearchTheoremStreamResponse().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): FeedbackResponse {
-    return new FeedbackResponse().fromJsonString(jsonString, options);
+  ): SearchTheoremStreamResponse {
+    return new SearchTheoremStreamResponse().fromJsonString(
+      jsonString,
+      options,
+    );
   }
 
   static equals(
-    a: FeedbackResponse | PlainMessage<FeedbackResponse> | undefined,
-    b: FeedbackResponse | PlainMessage<FeedbackResponse> | undefined,
+    a:
+      | SearchTheoremStreamResponse
+      | PlainMessage<SearchTheoremStreamResponse>
+      | undefined,
+    b:
+      | SearchTheoremStreamResponse
+      | PlainMessage<SearchTheoremStreamResponse>
+      | undefined,
   ): boolean {
-    return proto3.util.equals(FeedbackResponse, a, b);
+    return proto3.util.equals(SearchTheoremStreamResponse, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.ClickRequest
+ * @generated from message state_search.v1.BatchSearchTheoremRequest
  */
-export class ClickRequest extends Message<ClickRequest> {
+export class BatchSearchTheoremRequest extends Message<BatchSearchTheoremRequest> {
   /**
-   * @generated from field: string query = 1;
+   * @generated from field: repeated string queries = 1;
    */
-  query = "";
+  queries: string[] = [];
 
   /**
-   * @generated from field: string theorem_id = 2;
+   * @generated from field: int32 nresult = 2;
    */
-  theoremId = "";
+  nresult = 0;
 
   /**
-   * @generated from field: int32 rank = 3;
+   * @generated from field: string rev = 3;
    */
-  rank = 0;
+  rev = "";
 
-  constructor(data?: PartialMessage<ClickRequest>) {
+  constructor(data?: PartialMessage<BatchSearchTheoremRequest>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.ClickRequest";
+  static readonly typeName = "state_search.v1.BatchSearchTheoremRequest";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 2, name: "theorem_id", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 3, name: "rank", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    {
+      no: 1,
+      name: "queries",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+      repeated: true,
+    },
+    { no: 2, name: "nresult", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 3, name: "rev", kind: "scalar", T: 9 /* ScalarType.STRING */ },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): ClickRequest {
-    return new ClickRequest().fromBinary(bytes, options);
+  ): BatchSearchTheoremRequest {
+    return new BatchSearchTheoremRequest().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): ClickRequest {
-    return new ClickRequest().fromJson(jsonValue, options);
+  ): BatchSearchTheoremRequest {
+    return new BatchSearchTheoremRequest().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): ClickRequest {
-    return new ClickRequest().fromJsonString(jsonString, options);
+  ): BatchSearchTheoremRequest {
+    return new BatchSearchTheoremRequest().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a: ClickRequest | PlainMessage<ClickRequest> | undefined,
-    b: ClickRequest | PlainMessage<ClickRequest> | undefined,
+    a:
+      | BatchSearchTheoremRequest
+      | PlainMessage<BatchSearchTheoremRequest>
+      | undefined,
+    b:
+      | BatchSearchTheoremRequest
+      | PlainMessage<BatchSearchTheoremRequest>
+      | undefined,
   ): boolean {
-    return proto3.util.equals(ClickRequest, a, b);
+    return proto3.util.equals(BatchSearchTheoremRequest, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.ClickResponse
+ * @generated from message state_search.v1.BatchSearchTheoremResponse
  */
-export class ClickResponse extends Message<ClickResponse> {
-  constructor(data?: PartialMessage<ClickResponse>) {
+export class BatchSearchTheoremResponse extends Message<BatchSearchTheoremResponse> {
+  /**
+   * One response per query, in request order.
+   *
+   * @generated from field: repeated state_search.v1.SearchTheoremResponse results = 1;
+   */
+  results: SearchTheoremResponse[] = [];
+
+  constructor(data?: PartialMessage<BatchSearchTheoremResponse>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.ClickResponse";
-  static readonly fields: FieldList = proto3.util.newFieldList(() => []);
+  static readonly typeName = "state_search.v1.BatchSearchTheoremResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    {
+      no: 1,
+      name: "results",
+      kind: "message",
+      T: SearchTheoremResponse,
+      repeated: true,
+    },
+  ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): ClickResponse {
-    return new ClickResponse().fromBinary(bytes, options);
+  ): BatchSearchTheoremResponse {
+    return new BatchSearchTheoremResponse().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): ClickResponse {
-    return new ClickResponse().fromJson(jsonValue, options);
+  ): BatchSearchTheoremResponse {
+    return new BatchSearchTheoremResponse().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): ClickResponse {
-    return new ClickResponse().fromJsonString(jsonString, options);
+  ): BatchSearchTheoremResponse {
+    return new BatchSearchTheoremResponse().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a: ClickResponse | PlainMessage<ClickResponse> | undefined,
-    b: ClickResponse | PlainMessage<ClickResponse> | undefined,
+    a:
+      | BatchSearchTheoremResponse
+      | PlainMessage<BatchSearchTheoremResponse>
+      | undefined,
+    b:
+      | BatchSearchTheoremResponse
+      | PlainMessage<BatchSearchTheoremResponse>
+      | undefined,
   ): boolean {
-    return proto3.util.equals(ClickResponse, a, b);
+    return proto3.util.equals(BatchSearchTheoremResponse, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.CallRequest
+ * @generated from message state_search.v1.MultiRevSearchTheoremRequest
  */
-export class CallRequest extends Message<CallRequest> {
+export class MultiRevSearchTheoremRequest extends Message<MultiRevSearchTheoremRequest> {
   /**
-   * @generated from field: int32 call_type = 1;
+   * @generated from field: string query = 1;
    */
-  callType = 0;
+  query = "";
 
   /**
-   * @generated from field: string query = 2;
+   * @generated from field: int32 nresult = 2;
    */
-  query = "";
+  nresult = 0;
 
-  constructor(data?: PartialMessage<CallRequest>) {
+  /**
+   * @generated from field: repeated string revs = 3;
+   */
+  revs: string[] = [];
+
+  /**
+   * Also merge the hits of all revs into one list, deduplicated by name.
+   *
+   * @generated from field: bool merge = 4;
+   */
+  merge = false;
+
+  constructor(data?: PartialMessage<MultiRevSearchTheoremRequest>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.CallRequest";
+  static readonly typeName = "state_search.v1.MultiRevSearchTheoremRequest";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "call_type", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
-    { no: 2, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 1, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "nresult", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    {
+      no: 3,
+      name: "revs",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+      repeated: true,
+    },
+    { no: 4, name: "merge", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): CallRequest {
-    return new CallRequest().fromBinary(bytes, options);
+  ): MultiRevSearchTheoremRequest {
+    return new MultiRevSearchTheoremRequest().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): CallRequest {
-    return new CallRequest().fromJson(jsonValue, options);
+  ): MultiRevSearchTheoremRequest {
+    return new MultiRevSearchTheoremRequest().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): CallRequest {
-    return new CallRequest().fromJsonString(jsonString, options);
+  ): MultiRevSearchTheoremRequest {
+    return new MultiRevSearchTheoremRequest().fromJsonString(
+      jsonString,
+      options,
+    );
   }
 
   static equals(
-    a: CallRequest | PlainMessage<CallRequest> | undefined,
-    b: CallRequest | PlainMessage<CallRequest> | undefined,
+    a:
+      | MultiRevSearchTheoremRequest
+      | PlainMessage<MultiRevSearchTheoremRequest>
+      | undefined,
+    b:
+      | MultiRevSearchTheoremRequest
+      | PlainMessage<MultiRevSearchTheoremRequest>
+      | undefined,
   ): boolean {
-    return proto3.util.equals(CallRequest, a, b);
+    return proto3.util.equals(MultiRevSearchTheoremRequest, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.CallResponse
+ * @generated from message state_search.v1.ScoredTheorem
  */
-export class CallResponse extends Message<CallResponse> {
-  constructor(data?: PartialMessage<CallResponse>) {
+export class ScoredTheorem extends Message<ScoredTheorem> {
+  /**
+   * @generated from field: state_search.v1.Theorem theorem = 1;
+   */
+  theorem?: Theorem;
+
+  /**
+   * @generated from field: float score = 2;
+   */
+  score = 0;
+
+  /**
+   * Revs with a hit of the same name, only set on merged results.
+   *
+   * @generated from field: repeated string revs = 3;
+   */
+  revs: string[] = [];
+
+  constructor(data?: PartialMessage<ScoredTheorem>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.CallResponse";
-  static readonly fields: FieldList = proto3.util.newFieldList(() => []);
+  static readonly typeName = "state_search.v1.ScoredTheorem";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "theorem", kind: "message", T: Theorem },
+    { no: 2, name: "score", kind: "scalar", T: 2 /* ScalarType.FLOAT */ },
+    {
+      no: 3,
+      name: "revs",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+      repeated: true,
+    },
+  ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): CallResponse {
-    return new CallResponse().fromBinary(bytes, options);
+  ): ScoredTheorem {
+    return new ScoredTheorem().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): CallResponse {
-    return new CallResponse().fromJson(jsonValue, options);
+  ): ScoredTheorem {
+    return new ScoredTheorem().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): CallResponse {
-    return new CallResponse().fromJsonString(jsonString, options);
+  ): ScoredTheorem {
+    return new ScoredTheorem().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a: CallResponse | PlainMessage<CallResponse> | undefined,
-    b: CallResponse | PlainMessage<CallResponse> | undefined,
+    a: ScoredTheorem | PlainMessage<ScoredTheorem> | undefined,
+    b: ScoredTheorem | PlainMessage<ScoredTheorem> | undefined,
   ): boolean {
-    return proto3.util.equals(CallResponse, a, b);
+    return proto3.util.equals(ScoredTheorem, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.LeanNode
+ * @generated from message state_search.v1.RevSearchResult
  */
-export class LeanNode extends Message<LeanNode> {
-  /**
-   * @generated from field: string name = 1;
-   */
-  name = "";
-
+export class RevSearchResult extends Message<RevSearchResult> {
   /**
-   * @generated from field: string const_category = 2;
+   * @generated from field: string rev = 1;
    */
-  constCategory = "";
+  rev = "";
 
   /**
-   * @generated from field: string const_type = 3;
+   * @generated from field: repeated state_search.v1.ScoredTheorem results = 2;
    */
-  constType = "";
+  results: ScoredTheorem[] = [];
 
-  /**
-   * @generated from field: string module = 4;
-   */
-  module = "";
+  constructor(data?: PartialMessage<RevSearchResult>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
 
-  /**
-   * @generated from field: string doc_string = 5;
-   */
-  docString = "";
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.RevSearchResult";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "rev", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    {
+      no: 2,
+      name: "results",
+      kind: "message",
+      T: ScoredTheorem,
+      repeated: true,
+    },
+  ]);
 
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): RevSearchResult {
+    return new RevSearchResult().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): RevSearchResult {
+    return new RevSearchResult().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): RevSearchResult {
+    return new RevSearchResult().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: RevSearchResult | PlainMessage<RevSearchResult> | undefined,
+    b: RevSearchResult | PlainMessage<RevSearchResult> | undefined,
+  ): boolean {
+    return proto3.util.equals(RevSearchResult, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.MultiRevSearchTheoremResponse
+ */
+export class MultiRevSearchTheoremResponse extends Message<MultiRevSearchTheoremResponse> {
+  /**
+   * One result per requested rev, in request order.
+   *
+   * @generated from field: repeated state_search.v1.RevSearchResult revs = 1;
+   */
+  revs: RevSearchResult[] = [];
+
+  /**
+   * The best `nresult` hits over all revs, set if `merge` was requested.
+   *
+   * @generated from field: repeated state_search.v1.ScoredTheorem merged = 2;
+   */
+  merged: ScoredTheorem[] = [];
+
+  constructor(data?: PartialMessage<MultiRevSearchTheoremResponse>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.MultiRevSearchTheoremResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    {
+      no: 1,
+      name: "revs",
+      kind: "message",
+      T: RevSearchResult,
+      repeated: true,
+    },
+    {
+      no: 2,
+      name: "merged",
+      kind: "message",
+      T: ScoredTheorem,
+      repeated: true,
+    },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): MultiRevSearchTheoremResponse {
+    return new MultiRevSearchTheoremResponse().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): MultiRevSearchTheoremResponse {
+    return new MultiRevSearchTheoremResponse().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): MultiRevSearchTheoremResponse {
+    return new MultiRevSearchTheoremResponse().fromJsonString(
+      jsonString,
+      options,
+    );
+  }
+
+  static equals(
+    a:
+      | MultiRevSearchTheoremResponse
+      | PlainMessage<MultiRevSearchTheoremResponse>
+      | undefined,
+    b:
+      | MultiRevSearchTheoremResponse
+      | PlainMessage<MultiRevSearchTheoremResponse>
+      | undefined,
+  ): boolean {
+    return proto3.util.equals(MultiRevSearchTheoremResponse, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.FeedbackRequest
+ */
+export class FeedbackRequest extends Message<FeedbackRequest> {
+  /**
+   * @generated from field: string query = 1;
+   */
+  query = "";
+
+  /**
+   * @generated from field: string theorem_id = 2;
+   */
+  theoremId = "";
+
+  /**
+   * @generated from field: bool relevant = 3;
+   */
+  relevant = false;
+
+  /**
+   * @generated from field: bool update = 4;
+   */
+  update = false;
+
+  /**
+   * @generated from field: int32 rank = 5;
+   */
+  rank = 0;
+
+  constructor(data?: PartialMessage<FeedbackRequest>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.FeedbackRequest";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "theorem_id", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 3, name: "relevant", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
+    { no: 4, name: "update", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
+    { no: 5, name: "rank", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): FeedbackRequest {
+    return new FeedbackRequest().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): FeedbackRequest {
+    return new FeedbackRequest().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): FeedbackRequest {
+    return new FeedbackRequest().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: FeedbackRequest | PlainMessage<FeedbackRequest> | undefined,
+    b: FeedbackRequest | PlainMessage<FeedbackRequest> | undefined,
+  ): boolean {
+    return proto3.util.equals(FeedbackRequest, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.FeedbackResponse
+ */
+export class FeedbackResponse extends Message<FeedbackResponse> {
+  constructor(data?: PartialMessage<FeedbackResponse>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.FeedbackResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => []);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): FeedbackResponse {
+    return new FeedbackResponse().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): FeedbackResponse {
+    return new FeedbackResponse().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): FeedbackResponse {
+    return new FeedbackResponse().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: FeedbackResponse | PlainMessage<FeedbackResponse> | undefined,
+    b: FeedbackResponse | PlainMessage<FeedbackResponse> | undefined,
+  ): boolean {
+    return proto3.util.equals(FeedbackResponse, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.ClickRequest
+ */
+export class ClickRequest extends Message<ClickRequest> {
+  /**
+   * @generated from field: string query = 1;
+   */
+  query = "";
+
+  /**
+   * @generated from field: string theorem_id = 2;
+   */
+  theoremId = "";
+
+  /**
+   * @generated from field: int32 rank = 3;
+   */
+  rank = 0;
+
+  constructor(data?: PartialMessage<ClickRequest>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.ClickRequest";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "theorem_id", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 3, name: "rank", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): ClickRequest {
+    return new ClickRequest().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): ClickRequest {
+    return new ClickRequest().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): ClickRequest {
+    return new ClickRequest().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: ClickRequest | PlainMessage<ClickRequest> | undefined,
+    b: ClickRequest | PlainMessage<ClickRequest> | undefined,
+  ): boolean {
+    return proto3.util.equals(ClickRequest, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.ClickResponse
+ */
+export class ClickResponse extends Message<ClickResponse> {
+  constructor(data?: PartialMessage<ClickResponse>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.ClickResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => []);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): ClickResponse {
+    return new ClickResponse().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): ClickResponse {
+    return new ClickResponse().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): ClickResponse {
+    return new ClickResponse().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: ClickResponse | PlainMessage<ClickResponse> | undefined,
+    b: ClickResponse | PlainMessage<ClickResponse> | undefined,
+  ): boolean {
+    return proto3.util.equals(ClickResponse, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.CallRequest
+ */
+export class CallRequest extends Message<CallRequest> {
+  /**
+   * @generated from field: int32 call_type = 1;
+   */
+  callType = 0;
+
+  /**
+   * @generated from field: string query = 2;
+   */
+  query = "";
+
+  constructor(data?: PartialMessage<CallRequest>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.CallRequest";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "call_type", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 2, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): CallRequest {
+    return new CallRequest().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): CallRequest {
+    return new CallRequest().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): CallRequest {
+    return new CallRequest().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: CallRequest | PlainMessage<CallRequest> | undefined,
+    b: CallRequest | PlainMessage<CallRequest> | undefined,
+  ): boolean {
+    return proto3.util.equals(CallRequest, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.CallResponse
+ */
+export class CallResponse extends Message<CallResponse> {
+  constructor(data?: PartialMessage<CallResponse>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.CallResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => []);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): CallResponse {
+    return new CallResponse().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): CallResponse {
+    return new CallResponse().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): CallResponse {
+    return new CallResponse().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: CallResponse | PlainMessage<CallResponse> | undefined,
+    b: CallResponse | PlainMessage<CallResponse> | undefined,
+  ): boolean {
+    return proto3.util.equals(CallResponse, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.LeanNode
+ */
+export class LeanNode extends Message<LeanNode> {
+  /**
+   * @generated from field: string name = 1;
+   */
+  name = "";
+
+  /**
+   * @generated from field: string const_category = 2;
+   */
+  constCategory = "";
+
+  /**
+   * @generated from field: string const_type = 3;
+   */
+  constType = "";
+
+  /**
+   * @generated from field: string module = 4;
+   */
+  module = "";
+
+  /**
+   * @generated from field: string doc_string = 5;
+   */
+  docString = "";
+
+  /**
+   * @generated from field: string informal_name = 6;
+   */
+  informalName = "";
+
+  /**
+   * @generated from field: string informal_statement = 7;
+   */
+  informalStatement = "";
+
+  constructor(data?: PartialMessage<LeanNode>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.LeanNode";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "name", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    {
+      no: 2,
+      name: "const_category",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+    },
+    { no: 3, name: "const_type", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 4, name: "module", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 5, name: "doc_string", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    {
+      no: 6,
+      name: "informal_name",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+    },
+    {
+      no: 7,
+      name: "informal_statement",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+    },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): LeanNode {
+    return new LeanNode().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): LeanNode {
+    return new LeanNode().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): LeanNode {
+    return new LeanNode().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: LeanNode | PlainMessage<LeanNode> | undefined,
+    b: LeanNode | PlainMessage<LeanNode> | undefined,
+  ): boolean {
+    return proto3.util.equals(LeanNode, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.LeanEdge
+ */
+export class LeanEdge extends Message<LeanEdge> {
+  /**
+   * @generated from field: string id = 1;
+   */
+  id = "";
+
+  /**
+   * @generated from field: string source = 2;
+   */
+  source = "";
+
+  /**
+   * @generated from field: string target = 3;
+   */
+  target = "";
+
+  /**
+   * @generated from field: string edge_type = 4;
+   */
+  edgeType = "";
+
+  constructor(data?: PartialMessage<LeanEdge>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.LeanEdge";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "id", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "source", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 3, name: "target", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 4, name: "edge_type", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): LeanEdge {
+    return new LeanEdge().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): LeanEdge {
+    return new LeanEdge().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): LeanEdge {
+    return new LeanEdge().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: LeanEdge | PlainMessage<LeanEdge> | undefined,
+    b: LeanEdge | PlainMessage<LeanEdge> | undefined,
+  ): boolean {
+    return proto3.util.equals(LeanEdge, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.GetDependencyNodesAndEdgesRequest
+ */
+export class GetDependencyNodesAndEdgesRequest extends Message<GetDependencyNodesAndEdgesRequest> {
+  /**
+   * @generated from field: string name = 1;
+   */
+  name = "";
+
+  /**
+   * Picks which neighbors a sampled response keeps; the same seed always
+   * keeps the same ones.
+   *
+   * @generated from field: int32 sample_seed = 2;
+   */
+  sampleSeed = 0;
+
+  /**
+   * Page through all neighbors in name order instead of sampling them, this
+   * many per response. Capped by the server.
+   *
+   * @generated from field: int32 page_size = 3;
+   */
+  pageSize = 0;
+
+  /**
+   * `next_page_token` of the previous page; empty for the first page.
+   *
+   * @generated from field: string page_token = 4;
+   */
+  pageToken = "";
+
+  constructor(data?: PartialMessage<GetDependencyNodesAndEdgesRequest>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName =
+    "state_search.v1.GetDependencyNodesAndEdgesRequest";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "name", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "sample_seed", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 3, name: "page_size", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 4, name: "page_token", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): GetDependencyNodesAndEdgesRequest {
+    return new GetDependencyNodesAndEdgesRequest().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependencyNodesAndEdgesRequest {
+    return new GetDependencyNodesAndEdgesRequest().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependencyNodesAndEdgesRequest {
+    return new GetDependencyNodesAndEdgesRequest().fromJsonString(
+      jsonString,
+      options,
+    );
+  }
+
+  static equals(
+    a:
+      | GetDependencyNodesAndEdgesRequest
+      | PlainMessage<GetDependencyNodesAndEdgesRequest>
+      | undefined,
+    b:
+      | GetDependencyNodesAndEdgesRequest
+      | PlainMessage<GetDependencyNodesAndEdgesRequest>
+      | undefined,
+  ): boolean {
+    return proto3.util.equals(GetDependencyNodesAndEdgesRequest, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.GetDependencyNodesAndEdgesResponse
+ */
+export class GetDependencyNodesAndEdgesResponse extends Message<GetDependencyNodesAndEdgesResponse> {
+  /**
+   * @generated from field: repeated state_search.v1.LeanNode nodes = 1;
+   */
+  nodes: LeanNode[] = [];
+
+  /**
+   * @generated from field: repeated state_search.v1.LeanEdge edges = 2;
+   */
+  edges: LeanEdge[] = [];
+
+  /**
+   * Unset for paged requests.
+   *
+   * @generated from field: state_search.v1.SamplingInfo sampling_info = 3;
+   */
+  samplingInfo?: SamplingInfo;
+
+  /**
+   * Token of the next page of a paged request; empty on the last page.
+   *
+   * @generated from field: string next_page_token = 4;
+   */
+  nextPageToken = "";
+
+  constructor(data?: PartialMessage<GetDependencyNodesAndEdgesResponse>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName =
+    "state_search.v1.GetDependencyNodesAndEdgesResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "nodes", kind: "message", T: LeanNode, repeated: true },
+    { no: 2, name: "edges", kind: "message", T: LeanEdge, repeated: true },
+    { no: 3, name: "sampling_info", kind: "message", T: SamplingInfo },
+    {
+      no: 4,
+      name: "next_page_token",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+    },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): GetDependencyNodesAndEdgesResponse {
+    return new GetDependencyNodesAndEdgesResponse().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependencyNodesAndEdgesResponse {
+    return new GetDependencyNodesAndEdgesResponse().fromJson(
+      jsonValue,
+      options,
+    );
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependencyNodesAndEdgesResponse {
+    return new GetDependencyNodesAndEdgesResponse().fromJsonString(
+      jsonString,
+      options,
+    );
+  }
+
+  static equals(
+    a:
+      | GetDependencyNodesAndEdgesResponse
+      | PlainMessage<GetDependencyNodesAndEdgesResponse>
+      | undefined,
+    b:
+      | GetDependencyNodesAndEdgesResponse
+      | PlainMessage<GetDependencyNodesAndEdgesResponse>
+      | undefined,
+  ): boolean {
+    return proto3.util.equals(GetDependencyNodesAndEdgesResponse, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.GetDependentNodesAndEdgesRequest
+ */
+export class GetDependentNodesAndEdgesRequest extends Message<GetDependentNodesAndEdgesRequest> {
+  /**
+   * @generated from field: string name = 1;
+   */
+  name = "";
+
+  /**
+   * Picks which neighbors a sampled response keeps; the same seed always
+   * keeps the same ones.
+   *
+   * @generated from field: int32 sample_seed = 2;
+   */
+  sampleSeed = 0;
+
+  /**
+   * Page through all neighbors in name order instead of sampling them, this
+   * many per response. Capped by the server.
+   *
+   * @generated from field: int32 page_size = 3;
+   */
+  pageSize = 0;
+
+  /**
+   * `next_page_token` of the previous page; empty for the first page.
+   *
+   * @generated from field: string page_token = 4;
+   */
+  pageToken = "";
+
+  constructor(data?: PartialMessage<GetDependentNodesAndEdgesRequest>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.GetDependentNodesAndEdgesRequest";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "name", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "sample_seed", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 3, name: "page_size", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 4, name: "page_token", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): GetDependentNodesAndEdgesRequest {
+    return new GetDependentNodesAndEdgesRequest().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependentNodesAndEdgesRequest {
+    return new GetDependentNodesAndEdgesRequest().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependentNodesAndEdgesRequest {
+    return new GetDependentNodesAndEdgesRequest().fromJsonString(
+      jsonString,
+      options,
+    );
+  }
+
+  static equals(
+    a:
+      | GetDependentNodesAndEdgesRequest
+      | PlainMessage<GetDependentNodesAndEdgesRequest>
+      | undefined,
+    b:
+      | GetDependentNodesAndEdgesRequest
+      | PlainMessage<GetDependentNodesAndEdgesRequest>
+      | undefined,
+  ): boolean {
+    return proto3.util.equals(GetDependentNodesAndEdgesRequest, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.GetDependentNodesAndEdgesResponse
+ */
+export class GetDependentNodesAndEdgesResponse extends Message<GetDependentNodesAndEdgesResponse> {
+  /**
+   * @generated from field: repeated state_search.v1.LeanNode nodes = 1;
+   */
+  nodes: LeanNode[] = [];
+
+  /**
+   * @generated from field: repeated state_search.v1.LeanEdge edges = 2;
+   */
+  edges: LeanEdge[] = [];
+
+  /**
+   * Unset for paged requests.
+   *
+   * @generated from field: state_search.v1.SamplingInfo sampling_info = 3;
+   */
+  samplingInfo?: SamplingInfo;
+
+  /**
+   * Token of the next page of a paged request; empty on the last page.
+   *
+   * @generated from field: string next_page_token = 4;
+   */
+  nextPageToken = "";
+
+  constructor(data?: PartialMessage<GetDependentNodesAndEdgesResponse>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName =
+    "state_search.v1.GetDependentNodesAndEdgesResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "nodes", kind: "message", T: LeanNode, repeated: true },
+    { no: 2, name: "edges", kind: "message", T: LeanEdge, repeated: true },
+    { no: 3, name: "sampling_info", kind: "message", T: SamplingInfo },
+    {
+      no: 4,
+      name: "next_page_token",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+    },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): GetDependentNodesAndEdgesResponse {
+    return new GetDependentNodesAndEdgesResponse().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependentNodesAndEdgesResponse {
+    return new GetDependentNodesAndEdgesResponse().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): GetDependentNodesAndEdgesResponse {
+    return new GetDependentNodesAndEdgesResponse().fromJsonString(
+      jsonString,
+      options,
+    );
+  }
+
+  static equals(
+    a:
+      | GetDependentNodesAndEdgesResponse
+      | PlainMessage<GetDependentNodesAndEdgesResponse>
+      | undefined,
+    b:
+      | GetDependentNodesAndEdgesResponse
+      | PlainMessage<GetDependentNodesAndEdgesResponse>
+      | undefined,
+  ): boolean {
+    return proto3.util.equals(GetDependentNodesAndEdgesResponse, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.SamplingInfo
+ */
+export class SamplingInfo extends Message<SamplingInfo> {
   /**
-   * @generated from field: string informal_name = 6;
+   * @generated from field: bool was_sampled = 1;
    */
-  informalName = "";
+  wasSampled = false;
 
   /**
-   * @generated from field: string informal_statement = 7;
+   * The requested node and its distinct neighbors.
+   *
+   * @generated from field: int32 original_node_count = 2;
    */
-  informalStatement = "";
+  originalNodeCount = 0;
 
-  constructor(data?: PartialMessage<LeanNode>) {
+  /**
+   * @generated from field: int32 sampled_node_count = 3;
+   */
+  sampledNodeCount = 0;
+
+  /**
+   * Edges of the requested node in the requested direction.
+   *
+   * @generated from field: int32 original_edge_count = 4;
+   */
+  originalEdgeCount = 0;
+
+  constructor(data?: PartialMessage<SamplingInfo>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.LeanNode";
+  static readonly typeName = "state_search.v1.SamplingInfo";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "name", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 1, name: "was_sampled", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
     {
       no: 2,
-      name: "const_category",
+      name: "original_node_count",
       kind: "scalar",
-      T: 9 /* ScalarType.STRING */,
+      T: 5 /* ScalarType.INT32 */,
     },
-    { no: 3, name: "const_type", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 4, name: "module", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 5, name: "doc_string", kind: "scalar", T: 9 /* ScalarType.STRING */ },
     {
-      no: 6,
-      name: "informal_name",
+      no: 3,
+      name: "sampled_node_count",
+      kind: "scalar",
+      T: 5 /* ScalarType.INT32 */,
+    },
+    {
+      no: 4,
+      name: "original_edge_count",
+      kind: "scalar",
+      T: 5 /* ScalarType.INT32 */,
+    },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): SamplingInfo {
+    return new SamplingInfo().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): SamplingInfo {
+    return new SamplingInfo().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): SamplingInfo {
+    return new SamplingInfo().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a: SamplingInfo | PlainMessage<SamplingInfo> | undefined,
+    b: SamplingInfo | PlainMessage<SamplingInfo> | undefined,
+  ): boolean {
+    return proto3.util.equals(SamplingInfo, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.GetNodeSuggestionsRequest
+ */
+export class GetNodeSuggestionsRequest extends Message<GetNodeSuggestionsRequest> {
+  /**
+   * @generated from field: string query = 1;
+   */
+  query = "";
+
+  /**
+   * @generated from field: int32 max_suggestions = 2;
+   */
+  maxSuggestions = 0;
+
+  constructor(data?: PartialMessage<GetNodeSuggestionsRequest>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.GetNodeSuggestionsRequest";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    {
+      no: 2,
+      name: "max_suggestions",
+      kind: "scalar",
+      T: 5 /* ScalarType.INT32 */,
+    },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): GetNodeSuggestionsRequest {
+    return new GetNodeSuggestionsRequest().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): GetNodeSuggestionsRequest {
+    return new GetNodeSuggestionsRequest().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): GetNodeSuggestionsRequest {
+    return new GetNodeSuggestionsRequest().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a:
+      | GetNodeSuggestionsRequest
+      | PlainMessage<GetNodeSuggestionsRequest>
+      | undefined,
+    b:
+      | GetNodeSuggestionsRequest
+      | PlainMessage<GetNodeSuggestionsRequest>
+      | undefined,
+  ): boolean {
+    return proto3.util.equals(GetNodeSuggestionsRequest, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.GetNodeSuggestionsResponse
+ */
+export class GetNodeSuggestionsResponse extends Message<GetNodeSuggestionsResponse> {
+  /**
+   * @generated from field: repeated string suggestions = 1;
+   */
+  suggestions: string[] = [];
+
+  constructor(data?: PartialMessage<GetNodeSuggestionsResponse>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.GetNodeSuggestionsResponse";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    {
+      no: 1,
+      name: "suggestions",
       kind: "scalar",
       T: 9 /* ScalarType.STRING */,
+      repeated: true,
+    },
+  ]);
+
+  static fromBinary(
+    bytes: Uint8Array,
+    options?: Partial<BinaryReadOptions>,
+  ): GetNodeSuggestionsResponse {
+    return new GetNodeSuggestionsResponse().fromBinary(bytes, options);
+  }
+
+  static fromJson(
+    jsonValue: JsonValue,
+    options?: Partial<JsonReadOptions>,
+  ): GetNodeSuggestionsResponse {
+    return new GetNodeSuggestionsResponse().fromJson(jsonValue, options);
+  }
+
+  static fromJsonString(
+    jsonString: string,
+    options?: Partial<JsonReadOptions>,
+  ): GetNodeSuggestionsResponse {
+    return new GetNodeSuggestionsResponse().fromJsonString(jsonString, options);
+  }
+
+  static equals(
+    a:
+      | GetNodeSuggestionsResponse
+      | PlainMessage<GetNodeSuggestionsResponse>
+      | undefined,
+    b:
+      | GetNodeSuggestionsResponse
+      | PlainMessage<GetNodeSuggestionsResponse>
+      | undefined,
+  ): boolean {
+    return proto3.util.equals(GetNodeSuggestionsResponse, a, b);
+  }
+}
+
+/**
+ * @generated from message state_search.v1.TraverseGraphRequest
+ */
+export class TraverseGraphRequest extends Message<TraverseGraphRequest> {
+  /**
+   * @generated from field: string name = 1;
+   */
+  name = "";
+
+  /**
+   * @generated from field: state_search.v1.TraversalDirection direction = 2;
+   */
+  direction = TraversalDirection.UNSPECIFIED;
+
+  /**
+   * Levels to expand; 0 or more than the server limit uses the limit.
+   *
+   * @generated from field: int32 max_depth = 3;
+   */
+  maxDepth = 0;
+
+  /**
+   * Nodes to visit, including the start node; 0 or more than the server limit
+   * uses the limit.
+   *
+   * @generated from field: int32 max_nodes = 4;
+   */
+  maxNodes = 0;
+
+  /**
+   * Only follow edges of these types; all edges if empty.
+   *
+   * @generated from field: repeated string edge_types = 5;
+   */
+  edgeTypes: string[] = [];
+
+  constructor(data?: PartialMessage<TraverseGraphRequest>) {
+    super();
+    proto3.util.initPartial(data, this);
+  }
+
+  static readonly runtime: typeof proto3 = proto3;
+  static readonly typeName = "state_search.v1.TraverseGraphRequest";
+  static readonly fields: FieldList = proto3.util.newFieldList(() => [
+    { no: 1, name: "name", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    {
+      no: 2,
+      name: "direction",
+      kind: "enum",
+      T: proto3.getEnumType(TraversalDirection),
     },
+    { no: 3, name: "max_depth", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    { no: 4, name: "max_nodes", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
     {
-      no: 7,
-      name: "informal_statement",
+      no: 5,
+      name: "edge_types",
       kind: "scalar",
       T: 9 /* ScalarType.STRING */,
+      repeated: true,
     },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): LeanNode {
-    return new LeanNode().fromBinary(bytes, options);
+  ): TraverseGraphRequest {
+    return new TraverseGraphRequest().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): LeanNode {
-    return new LeanNode().fromJson(jsonValue, options);
+  ): TraverseGraphRequest {
+    return new TraverseGraphRequest().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): LeanNode {
-    return new LeanNode().fromJsonString(jsonString, options);
+  ): TraverseGraphRequest {
+    return new TraverseGraphRequest().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a: LeanNode | PlainMessage<LeanNode> | undefined,
-    b: LeanNode | PlainMessage<LeanNode> | undefined,
+    a: TraverseGraphRequest | PlainMessage<TraverseGraphRequest> | undefined,
+    b: TraverseGraphRequest | PlainMessage<TraverseGraphRequest> | undefined,
   ): boolean {
-    return proto3.util.equals(LeanNode, a, b);
+    return proto3.util.equals(TraverseGraphRequest, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.LeanEdge
+ * @generated from message state_search.v1.TraverseGraphResponse
  */
-export class LeanEdge extends Message<LeanEdge> {
+export class TraverseGraphResponse extends Message<TraverseGraphResponse> {
   /**
-   * @generated from field: string id = 1;
+   * Visited nodes in visiting order, starting with the requested node.
+   *
+   * @generated from field: repeated state_search.v1.LeanNode nodes = 1;
    */
-  id = "";
+  nodes: LeanNode[] = [];
 
   /**
-   * @generated from field: string source = 2;
+   * Edges between the visited nodes.
+   *
+   * @generated from field: repeated state_search.v1.LeanEdge edges = 2;
    */
-  source = "";
+  edges: LeanEdge[] = [];
 
   /**
-   * @generated from field: string target = 3;
+   * Depth of each node in `nodes`.
+   *
+   * @generated from field: repeated int32 depths = 3;
    */
-  target = "";
+  depths: number[] = [];
 
   /**
-   * @generated from field: string edge_type = 4;
+   * Whether `max_nodes` stopped the traversal before it was exhausted.
+   *
+   * @generated from field: bool truncated = 4;
    */
-  edgeType = "";
+  truncated = false;
 
-  constructor(data?: PartialMessage<LeanEdge>) {
+  constructor(data?: PartialMessage<TraverseGraphResponse>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.LeanEdge";
+  static readonly typeName = "state_search.v1.TraverseGraphResponse";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "id", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 2, name: "source", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 3, name: "target", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    { no: 4, name: "edge_type", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 1, name: "nodes", kind: "message", T: LeanNode, repeated: true },
+    { no: 2, name: "edges", kind: "message", T: LeanEdge, repeated: true },
+    {
+      no: 3,
+      name: "depths",
+      kind: "scalar",
+      T: 5 /* ScalarType.INT32 */,
+      repeated: true,
+    },
+    { no: 4, name: "truncated", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): LeanEdge {
-    return new LeanEdge().fromBinary(bytes, options);
+  ): TraverseGraphResponse {
+    return new TraverseGraphResponse().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): LeanEdge {
-    return new LeanEdge().fromJson(jsonValue, options);
+  ): TraverseGraphResponse {
+    return new TraverseGraphResponse().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): LeanEdge {
-    return new LeanEdge().fromJsonString(jsonString, options);
+  ): TraverseGraphResponse {
+    return new TraverseGraphResponse().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a: LeanEdge | PlainMessage<LeanEdge> | undefined,
-    b: LeanEdge | PlainMessage<LeanEdge> | undefined,
+    a: TraverseGraphResponse | PlainMessage<TraverseGraphResponse> | undefined,
+    b: TraverseGraphResponse | PlainMessage<TraverseGraphResponse> | undefined,
   ): boolean {
-    return proto3.util.equals(LeanEdge, a, b);
+    return proto3.util.equals(TraverseGraphResponse, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.GetDependencyNodesAndEdgesRequest
+ * @generated from message state_search.v1.FindDependencyPathsRequest
  */
-export class GetDependencyNodesAndEdgesRequest extends Message<GetDependencyNodesAndEdgesRequest> {
+export class FindDependencyPathsRequest extends Message<FindDependencyPathsRequest> {
   /**
-   * @generated from field: string name = 1;
+   * Node whose dependencies are followed.
+   *
+   * @generated from field: string source = 1;
    */
-  name = "";
+  source = "";
 
-  constructor(data?: PartialMessage<GetDependencyNodesAndEdgesRequest>) {
+  /**
+   * Node the paths end at.
+   *
+   * @generated from field: string target = 2;
+   */
+  target = "";
+
+  /**
+   * Number of shortest paths to return; 0 returns the shortest one. Capped by
+   * the server.
+   *
+   * @generated from field: int32 k = 3;
+   */
+  k = 0;
+
+  /**
+   * Only follow edges of these types; all edges if empty.
+   *
+   * @generated from field: repeated string edge_types = 4;
+   */
+  edgeTypes: string[] = [];
+
+  constructor(data?: PartialMessage<FindDependencyPathsRequest>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName =
-    "state_search.v1.GetDependencyNodesAndEdgesRequest";
+  static readonly typeName = "state_search.v1.FindDependencyPathsRequest";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "name", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 1, name: "source", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "target", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 3, name: "k", kind: "scalar", T: 5 /* ScalarType.INT32 */ },
+    {
+      no: 4,
+      name: "edge_types",
+      kind: "scalar",
+      T: 9 /* ScalarType.STRING */,
+      repeated: true,
+    },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): GetDependencyNodesAndEdgesRequest {
-    return new GetDependencyNodesAndEdgesRequest().fromBinary(bytes, options);
+  ): FindDependencyPathsRequest {
+    return new FindDependencyPathsRequest().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): GetDependencyNodesAndEdgesRequest {
-    return new GetDependencyNodesAndEdgesRequest().fromJson(jsonValue, options);
+  ): FindDependencyPathsRequest {
+    return new FindDependencyPathsRequest().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): GetDependencyNodesAndEdgesRequest {
-    return new GetDependencyNodesAndEdgesRequest().fromJsonString(
-      jsonString,
-      options,
-    );
+  ): FindDependencyPathsRequest {
+    return new FindDependencyPathsRequest().fromJsonString(jsonString, options);
   }
 
   static equals(
     a:
-      | GetDependencyNodesAndEdgesRequest
-      | PlainMessage<GetDependencyNodesAndEdgesRequest>
+      | FindDependencyPathsRequest
+      | PlainMessage<FindDependencyPathsRequest>
       | undefined,
     b:
-      | GetDependencyNodesAndEdgesRequest
-      | PlainMessage<GetDependencyNodesAndEdgesRequest>
+      | FindDependencyPathsRequest
+      | PlainMessage<FindDependencyPathsRequest>
       | undefined,
   ): boolean {
-    return proto3.util.equals(GetDependencyNodesAndEdgesRequest, a, b);
+    return proto3.util.equals(FindDependencyPathsRequest, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.GetDependencyNodesAndEdgesResponse
+ * @generated from message state_search.v1.DependencyPath
  */
-export class GetDependencyNodesAndEdgesResponse extends Message<GetDependencyNodesAndEdgesResponse> {
+export class DependencyPath extends Message<DependencyPath> {
   /**
+   * Nodes from source to target. Names without a LeanNode only carry a name.
+   *
    * @generated from field: repeated state_search.v1.LeanNode nodes = 1;
    */
   nodes: LeanNode[] = [];
 
   /**
+   * Edges between consecutive nodes, including parallel edges of other types.
+   *
    * @generated from field: repeated state_search.v1.LeanEdge edges = 2;
    */
   edges: LeanEdge[] = [];
 
-  /**
-   * @generated from field: state_search.v1.SamplingInfo sampling_info = 3;
-   */
-  samplingInfo?: SamplingInfo;
-
-  constructor(data?: PartialMessage<GetDependencyNodesAndEdgesResponse>) {
+  constructor(data?: PartialMessage<DependencyPath>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName =
-    "state_search.v1.GetDependencyNodesAndEdgesResponse";
+  static readonly typeName = "state_search.v1.DependencyPath";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
     { no: 1, name: "nodes", kind: "message", T: LeanNode, repeated: true },
     { no: 2, name: "edges", kind: "message", T: LeanEdge, repeated: true },
-    { no: 3, name: "sampling_info", kind: "message", T: SamplingInfo },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): GetDependencyNodesAndEdgesResponse {
-    return new GetDependencyNodesAndEdgesResponse().fromBinary(bytes, options);
+  ): DependencyPath {
+    return new DependencyPath().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): GetDependencyNodesAndEdgesResponse {
-    return new GetDependencyNodesAndEdgesResponse().fromJson(
-      jsonValue,
-      options,
-    );
+  ): DependencyPath {
+    return new DependencyPath().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): GetDependencyNodesAndEdgesResponse {
-    return new GetDependencyNodesAndEdgesResponse().fromJsonString(
-      jsonString,
-      options,
-    );
+  ): DependencyPath {
+    return new DependencyPath().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a:
-      | GetDependencyNodesAndEdgesResponse
-      | PlainMessage<GetDependencyNodesAndEdgesResponse>
-      | undefined,
-    b:
-      | GetDependencyNodesAndEdgesResponse
-      | PlainMessage<GetDependencyNodesAndEdgesResponse>
-      | undefined,
+    a: DependencyPath | PlainMessage<DependencyPath> | undefined,
+    b: DependencyPath | PlainMessage<DependencyPath> | undefined,
   ): boolean {
-    return proto3.util.equals(GetDependencyNodesAndEdgesResponse, a, b);
+    return proto3.util.equals(DependencyPath, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.GetDependentNodesAndEdgesRequest
+ * @generated from message state_search.v1.FindDependencyPathsResponse
  */
-export class GetDependentNodesAndEdgesRequest extends Message<GetDependentNodesAndEdgesRequest> {
+export class FindDependencyPathsResponse extends Message<FindDependencyPathsResponse> {
   /**
-   * @generated from field: string name = 1;
+   * Paths without repeated nodes, shortest first.
+   *
+   * @generated from field: repeated state_search.v1.DependencyPath paths = 1;
    */
-  name = "";
+  paths: DependencyPath[] = [];
 
-  constructor(data?: PartialMessage<GetDependentNodesAndEdgesRequest>) {
+  /**
+   * Whether the server's exploration limit stopped the search before it found
+   * `k` paths or ran out of them.
+   *
+   * @generated from field: bool truncated = 2;
+   */
+  truncated = false;
+
+  constructor(data?: PartialMessage<FindDependencyPathsResponse>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.GetDependentNodesAndEdgesRequest";
+  static readonly typeName = "state_search.v1.FindDependencyPathsResponse";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "name", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    {
+      no: 1,
+      name: "paths",
+      kind: "message",
+      T: DependencyPath,
+      repeated: true,
+    },
+    { no: 2, name: "truncated", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): GetDependentNodesAndEdgesRequest {
-    return new GetDependentNodesAndEdgesRequest().fromBinary(bytes, options);
+  ): FindDependencyPathsResponse {
+    return new FindDependencyPathsResponse().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): GetDependentNodesAndEdgesRequest {
-    return new GetDependentNodesAndEdgesRequest().fromJson(jsonValue, options);
+  ): FindDependencyPathsResponse {
+    return new FindDependencyPathsResponse().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): GetDependentNodesAndEdgesRequest {
-    return new GetDependentNodesAndEdgesRequest().fromJsonString(
+  ): FindDependencyPathsResponse {
+    return new FindDependencyPathsResponse().fromJsonString(
       jsonString,
       options,
     );
@@ -967,248 +2316,219 @@ export class GetDependentNodesAndEdgesRequest extends Message<GetDependentNodesA
 
   static equals(
     a:
-      | GetDependentNodesAndEdgesRequest
-      | PlainMessage<GetDependentNodesAndEdgesRequest>
+      | FindDependencyPathsResponse
+      | PlainMessage<FindDependencyPathsResponse>
       | undefined,
     b:
-      | GetDependentNodesAndEdgesRequest
-      | PlainMessage<GetDependentNodesAndEdgesRequest>
+      | FindDependencyPathsResponse
+      | PlainMessage<FindDependencyPathsResponse>
       | undefined,
   ): boolean {
-    return proto3.util.equals(GetDependentNodesAndEdgesRequest, a, b);
+    return proto3.util.equals(FindDependencyPathsResponse, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.GetDependentNodesAndEdgesResponse
+ * @generated from message state_search.v1.ReachabilityQuery
  */
-export class GetDependentNodesAndEdgesResponse extends Message<GetDependentNodesAndEdgesResponse> {
-  /**
-   * @generated from field: repeated state_search.v1.LeanNode nodes = 1;
-   */
-  nodes: LeanNode[] = [];
-
+export class ReachabilityQuery extends Message<ReachabilityQuery> {
   /**
-   * @generated from field: repeated state_search.v1.LeanEdge edges = 2;
+   * @generated from field: string source = 1;
    */
-  edges: LeanEdge[] = [];
+  source = "";
 
   /**
-   * @generated from field: state_search.v1.SamplingInfo sampling_info = 3;
+   * @generated from field: string target = 2;
    */
-  samplingInfo?: SamplingInfo;
+  target = "";
 
-  constructor(data?: PartialMessage<GetDependentNodesAndEdgesResponse>) {
+  constructor(data?: PartialMessage<ReachabilityQuery>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName =
-    "state_search.v1.GetDependentNodesAndEdgesResponse";
+  static readonly typeName = "state_search.v1.ReachabilityQuery";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "nodes", kind: "message", T: LeanNode, repeated: true },
-    { no: 2, name: "edges", kind: "message", T: LeanEdge, repeated: true },
-    { no: 3, name: "sampling_info", kind: "message", T: SamplingInfo },
+    { no: 1, name: "source", kind: "scalar", T: 9 /* ScalarType.STRING */ },
+    { no: 2, name: "target", kind: "scalar", T: 9 /* ScalarType.STRING */ },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): GetDependentNodesAndEdgesResponse {
-    return new GetDependentNodesAndEdgesResponse().fromBinary(bytes, options);
+  ): ReachabilityQuery {
+    return new ReachabilityQuery().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): GetDependentNodesAndEdgesResponse {
-    return new GetDependentNodesAndEdgesResponse().fromJson(jsonValue, options);
+  ): ReachabilityQuery {
+    return new ReachabilityQuery().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): GetDependentNodesAndEdgesResponse {
-    return new GetDependentNodesAndEdgesResponse().fromJsonString(
-      jsonString,
-      options,
-    );
+  ): ReachabilityQuery {
+    return new ReachabilityQuery().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a:
-      | GetDependentNodesAndEdgesResponse
-      | PlainMessage<GetDependentNodesAndEdgesResponse>
-      | undefined,
-    b:
-      | GetDependentNodesAndEdgesResponse
-      | PlainMessage<GetDependentNodesAndEdgesResponse>
-      | undefined,
+    a: ReachabilityQuery | PlainMessage<ReachabilityQuery> | undefined,
+    b: ReachabilityQuery | PlainMessage<ReachabilityQuery> | undefined,
   ): boolean {
-    return proto3.util.equals(GetDependentNodesAndEdgesResponse, a, b);
+    return proto3.util.equals(ReachabilityQuery, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.SamplingInfo
+ * @generated from message state_search.v1.CheckReachabilityRequest
  */
-export class SamplingInfo extends Message<SamplingInfo> {
-  /**
-   * @generated from field: bool was_sampled = 1;
-   */
-  wasSampled = false;
-
-  /**
-   * @generated from field: int32 original_node_count = 2;
-   */
-  originalNodeCount = 0;
-
+export class CheckReachabilityRequest extends Message<CheckReachabilityRequest> {
   /**
-   * @generated from field: int32 sampled_node_count = 3;
+   * @generated from field: repeated state_search.v1.ReachabilityQuery queries = 1;
    */
-  sampledNodeCount = 0;
+  queries: ReachabilityQuery[] = [];
 
-  constructor(data?: PartialMessage<SamplingInfo>) {
+  constructor(data?: PartialMessage<CheckReachabilityRequest>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.SamplingInfo";
+  static readonly typeName = "state_search.v1.CheckReachabilityRequest";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "was_sampled", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
-    {
-      no: 2,
-      name: "original_node_count",
-      kind: "scalar",
-      T: 5 /* ScalarType.INT32 */,
-    },
     {
-      no: 3,
-      name: "sampled_node_count",
-      kind: "scalar",
-      T: 5 /* ScalarType.INT32 */,
+      no: 1,
+      name: "queries",
+      kind: "message",
+      T: ReachabilityQuery,
+      repeated: true,
     },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): SamplingInfo {
-    return new SamplingInfo().fromBinary(bytes, options);
+  ): CheckReachabilityRequest {
+    return new CheckReachabilityRequest().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): SamplingInfo {
-    return new SamplingInfo().fromJson(jsonValue, options);
+  ): CheckReachabilityRequest {
+    return new CheckReachabilityRequest().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): SamplingInfo {
-    return new SamplingInfo().fromJsonString(jsonString, options);
+  ): CheckReachabilityRequest {
+    return new CheckReachabilityRequest().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a: SamplingInfo | PlainMessage<SamplingInfo> | undefined,
-    b: SamplingInfo | PlainMessage<SamplingInfo> | undefined,
+    a:
+      | CheckReachabilityRequest
+      | PlainMessage<CheckReachabilityRequest>
+      | undefined,
+    b:
+      | CheckReachabilityRequest
+      | PlainMessage<CheckReachabilityRequest>
+      | undefined,
   ): boolean {
-    return proto3.util.equals(SamplingInfo, a, b);
+    return proto3.util.equals(CheckReachabilityRequest, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.GetNodeSuggestionsRequest
+ * @generated from message state_search.v1.ReachabilityResult
  */
-export class GetNodeSuggestionsRequest extends Message<GetNodeSuggestionsRequest> {
+export class ReachabilityResult extends Message<ReachabilityResult> {
   /**
-   * @generated from field: string query = 1;
+   * Whether `target` is a transitive dependency of `source`. A node reaches
+   * itself; unknown nodes reach nothing.
+   *
+   * @generated from field: bool reachable = 1;
    */
-  query = "";
+  reachable = false;
 
   /**
-   * @generated from field: int32 max_suggestions = 2;
+   * Whether the server gave up on the query, in which case `reachable` is
+   * false. Only happens when the graph is not held in memory.
+   *
+   * @generated from field: bool undecided = 2;
    */
-  maxSuggestions = 0;
+  undecided = false;
 
-  constructor(data?: PartialMessage<GetNodeSuggestionsRequest>) {
+  constructor(data?: PartialMessage<ReachabilityResult>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.GetNodeSuggestionsRequest";
+  static readonly typeName = "state_search.v1.ReachabilityResult";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
-    { no: 1, name: "query", kind: "scalar", T: 9 /* ScalarType.STRING */ },
-    {
-      no: 2,
-      name: "max_suggestions",
-      kind: "scalar",
-      T: 5 /* ScalarType.INT32 */,
-    },
+    { no: 1, name: "reachable", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
+    { no: 2, name: "undecided", kind: "scalar", T: 8 /* ScalarType.BOOL */ },
   ]);
 
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): GetNodeSuggestionsRequest {
-    return new GetNodeSuggestionsRequest().fromBinary(bytes, options);
+  ): ReachabilityResult {
+    return new ReachabilityResult().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): GetNodeSuggestionsRequest {
-    return new GetNodeSuggestionsRequest().fromJson(jsonValue, options);
+  ): ReachabilityResult {
+    return new ReachabilityResult().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): GetNodeSuggestionsRequest {
-    return new GetNodeSuggestionsRequest().fromJsonString(jsonString, options);
+  ): ReachabilityResult {
+    return new ReachabilityResult().fromJsonString(jsonString, options);
   }
 
   static equals(
-    a:
-      | GetNodeSuggestionsRequest
-      | PlainMessage<GetNodeSuggestionsRequest>
-      | undefined,
-    b:
-      | GetNodeSuggestionsRequest
-      | PlainMessage<GetNodeSuggestionsRequest>
-      | undefined,
+    a: ReachabilityResult | PlainMessage<ReachabilityResult> | undefined,
+    b: ReachabilityResult | PlainMessage<ReachabilityResult> | undefined,
   ): boolean {
-    return proto3.util.equals(GetNodeSuggestionsRequest, a, b);
+    return proto3.util.equals(ReachabilityResult, a, b);
   }
 }
 
 /**
- * @generated from message state_search.v1.GetNodeSuggestionsResponse
+ * @generated from message state_search.v1.CheckReachabilityResponse
  */
-export class GetNodeSuggestionsResponse extends Message<GetNodeSuggestionsResponse> {
+export class CheckReachabilityResponse extends Message<CheckReachabilityResponse> {
   /**
-   * @generated from field: repeated string suggestions = 1;
+   * One result per query, in request order.
+   *
+   * @generated from field: repeated state_search.v1.ReachabilityResult results = 1;
    */
-  suggestions: string[] = [];
+  results: ReachabilityResult[] = [];
 
-  constructor(data?: PartialMessage<GetNodeSuggestionsResponse>) {
+  constructor(data?: PartialMessage<CheckReachabilityResponse>) {
     super();
     proto3.util.initPartial(data, this);
   }
 
   static readonly runtime: typeof proto3 = proto3;
-  static readonly typeName = "state_search.v1.GetNodeSuggestionsResponse";
+  static readonly typeName = "state_search.v1.CheckReachabilityResponse";
   static readonly fields: FieldList = proto3.util.newFieldList(() => [
     {
       no: 1,
-      name: "suggestions",
-      kind: "scalar",
-      T: 9 /* ScalarType.STRING */,
+      name: "results",
+      kind: "message",
+      T: ReachabilityResult,
       repeated: true,
     },
   ]);
@@ -1216,34 +2536,34 @@ export class GetNodeSuggestionsResponse extends Message<GetNodeSuggestionsRespon
   static fromBinary(
     bytes: Uint8Array,
     options?: Partial<BinaryReadOptions>,
-  ): GetNodeSuggestionsResponse {
-    return new GetNodeSuggestionsResponse().fromBinary(bytes, options);
+  ): CheckReachabilityResponse {
+    return new CheckReachabilityResponse().fromBinary(bytes, options);
   }
 
   static fromJson(
     jsonValue: JsonValue,
     options?: Partial<JsonReadOptions>,
-  ): GetNodeSuggestionsResponse {
-    return new GetNodeSuggestionsResponse().fromJson(jsonValue, options);
+  ): CheckReachabilityResponse {
+    return new CheckReachabilityResponse().fromJson(jsonValue, options);
   }
 
   static fromJsonString(
     jsonString: string,
     options?: Partial<JsonReadOptions>,
-  ): GetNodeSuggestionsResponse {
-    return new GetNodeSuggestionsResponse().fromJsonString(jsonString, options);
+  ): CheckReachabilityResponse {
+    return new CheckReachabilityResponse().fromJsonString(jsonString, options);
   }
 
   static equals(
     a:
-      | GetNodeSuggestionsResponse
-      | PlainMessage<GetNodeSuggestionsResponse>
+      | CheckReachabilityResponse
+      | PlainMessage<CheckReachabilityResponse>
       | undefined,
     b:
-      | GetNodeSuggestionsResponse
-      | PlainMessage<GetNodeSuggestionsResponse>
+      | CheckReachabilityResponse
+      | PlainMessage<CheckReachabilityResponse>
       | undefined,
   ): boolean {
-    return proto3.util.equals(GetNodeSuggestionsResponse, a, b);
+    return proto3.util.equals(CheckReachabilityResponse, a, b);
   }
 }
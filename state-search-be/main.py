@@ -1,13 +1,18 @@
 import asyncio
 import grpc
 from state_search_be.api import LeanStateSearchServicer, LeanGraphServicer
+from state_search_be.graph_store import CsrGraph
+from state_search_be.model_pool import ModelPool
 import logging
 from state_search_be.state_search.v1.state_search_pb2_grpc import (
     add_LeanStateSearchServiceServicer_to_server,
     add_LeanGraphServiceServicer_to_server,
 )
 from prisma import Prisma
-from qdrant_client import QdrantClient
+from state_search_be.vector_store import MmapVectorStore, QdrantVectorStore
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import QuantizationSearchParams, SearchParams
+import httpx
 import meilisearch
 import os
 
@@ -27,21 +32,77 @@ async def serve() -> None:
     # Initialize database connections
     if os.getenv("MODE") == "docker":
         qdrant_url = "http://qdrant:6333"
+        qdrant_grpc_port = 6334
         meili_url = "http://meilisearch:7700"
     else:
         qdrant_url = f"http://localhost:{os.getenv('QDRANT_PORT')}"
+        qdrant_grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
         meili_url = f"http://localhost:{os.getenv('MEILI_PORT', '7700')}"
 
-    vb = QdrantClient(qdrant_url)
+    if os.getenv("VECTOR_STORE", "qdrant") == "mmap":
+        vb = MmapVectorStore(os.getenv("VECTOR_STORE_PATH", "vector_store"))
+    else:
+        # Keep-alive connections are shared by concurrent searches
+        qdrant_connections = int(os.getenv("QDRANT_CONNECTIONS", "32"))
+        qdrant = AsyncQdrantClient(
+            qdrant_url,
+            grpc_port=qdrant_grpc_port,
+            prefer_grpc=os.getenv("QDRANT_PREFER_GRPC", "0") == "1",
+            timeout=int(os.getenv("QDRANT_TIMEOUT", "10")),
+            limits=httpx.Limits(
+                max_connections=qdrant_connections,
+                max_keepalive_connections=qdrant_connections,
+            ),
+        )
+        vb = QdrantVectorStore(
+            qdrant,
+            # Only used by collections built with quantization, ignored otherwise
+            search_params=SearchParams(
+                quantization=QuantizationSearchParams(
+                    ignore=os.getenv("QDRANT_QUANTIZATION_IGNORE", "0") == "1",
+                    rescore=os.getenv("QDRANT_RESCORE", "1") == "1",
+                    oversampling=float(os.getenv("QDRANT_OVERSAMPLING", "2.0")),
+                )
+            ),
+            search_timeout=int(os.getenv("QDRANT_SEARCH_TIMEOUT", "5")),
+            batch_search_timeout=int(os.getenv("QDRANT_BATCH_SEARCH_TIMEOUT", "60")),
+        )
     meili_client = meilisearch.Client(
         meili_url, os.getenv("MEILI_MASTER_KEY", "masterKey")
     )
 
     await db.connect()
 
+    # Load the embedding model in worker processes
+    threads_per_worker = os.getenv("MODEL_THREADS_PER_WORKER")
+    model = ModelPool(
+        os.getenv("MODEL_NAME_OR_PATH"),
+        num_workers=int(os.getenv("MODEL_WORKERS", "1")),
+        threads_per_worker=int(threads_per_worker) if threads_per_worker else None,
+        pin_cores=os.getenv("MODEL_PIN_CORES", "1") == "1",
+        use_fp16=False,
+        pooling_method="mean",
+        use_fast_tokenizer=os.getenv("MODEL_FAST_TOKENIZER", "0") == "1",
+        backend=os.getenv("MODEL_BACKEND", "torch"),
+    )
+    logging.info("Loading model in %d worker(s)...", model.num_workers)
+    await model.start()
+
     # Create servicers
-    lean_state_search_servicer = LeanStateSearchServicer(db=db, vb=vb)
-    lean_graph_servicer = LeanGraphServicer(db=db, meili_client=meili_client)
+    lean_state_search_servicer = LeanStateSearchServicer(db=db, vb=vb, model=model)
+    graph = None
+    if os.getenv("GRAPH_IN_MEMORY", "0") == "1":
+        logging.info("Loading dependency graph into memory...")
+        graph = await CsrGraph.load(db)
+        logging.info(
+            "Loaded %d nodes and %d edges (%.1f MiB)",
+            len(graph.names),
+            graph.num_edges,
+            graph.nbytes / 2**20,
+        )
+    lean_graph_servicer = LeanGraphServicer(
+        db=db, meili_client=meili_client, graph=graph
+    )
 
     # Initialize Meilisearch index
     logging.info("Initializing Meilisearch index...")
@@ -57,7 +118,18 @@ async def serve() -> None:
     logging.info("Starting server on %s", listen_addr)
 
     await server.start()
+    stats_interval = float(os.getenv("EMBED_CACHE_LOG_INTERVAL", "300"))
+    log_cache_stats = None
+    if stats_interval > 0:
+        log_cache_stats = asyncio.create_task(
+            lean_state_search_servicer.embedding_cache.log_stats(stats_interval)
+        )
     await server.wait_for_termination()
+    if log_cache_stats is not None:
+        log_cache_stats.cancel()
+    await lean_state_search_servicer.batcher.close()
+    model.close()
+    await vb.close()
     await db.disconnect()
 
 
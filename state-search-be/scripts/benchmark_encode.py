@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import os
+import random
+import time
+
+import jsonlines
+import numpy as np
+from dotenv import load_dotenv
+from prisma import Prisma
+
+from state_search_be.flag_model import FlagModel
+
+load_dotenv()
+
+
+async def load_corpus(args):
+    if args.data_path:
+        with jsonlines.open(args.data_path, "r") as f:
+            theorems = [(it["args"], it["goal"]) for it in f.iter()]
+    else:
+        db = Prisma()
+        await db.connect()
+        rows = await db.theorem.find_many(where={"rev": args.rev})
+        await db.disconnect()
+        theorems = [(theorem.args, theorem.goal) for theorem in rows]
+    random.Random(args.seed).shuffle(theorems)
+    theorems = theorems[: args.sample]
+    # The same two corpora create_vector_store.py embeds
+    return ["".join("<VAR>" + v for v in args_) for args_, _ in theorems] + [
+        "<GOAL>" + goal for _, goal in theorems
+    ]
+
+
+def padded_tokens(lengths, batches):
+    return sum(len(batch) * max(lengths[i] for i in batch) for batch in batches)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare fixed-size and token-budget batching of FlagModel.encode"
+    )
+    parser.add_argument("--data-path", type=str, help="Theorem jsonl dump")
+    parser.add_argument("--rev", type=str, help="Load theorems of a rev instead")
+    parser.add_argument("--sample", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--token-budget", type=int, default=16384)
+    parser.add_argument("--max-length", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not args.data_path and not args.rev:
+        parser.error("one of --data-path or --rev is required")
+
+    corpus = asyncio.run(load_corpus(args))
+    model = FlagModel(
+        os.getenv("MODEL_NAME_OR_PATH"),
+        use_fp16=False,
+        pooling_method="mean",
+    )
+    encoded = model.tokenizer(corpus, truncation=True, max_length=args.max_length)
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+    real = sum(lengths)
+    fixed_batches = [
+        range(start, min(start + args.batch_size, len(corpus)))
+        for start in range(0, len(corpus), args.batch_size)
+    ]
+    bucketed_batches = [
+        indices
+        for indices, _ in model.token_batches(
+            corpus, args.token_budget, args.max_length
+        )
+    ]
+
+    start = time.perf_counter()
+    fixed = model.encode_corpus(
+        corpus, batch_size=args.batch_size, max_length=args.max_length
+    )
+    fixed_time = time.perf_counter() - start
+    start = time.perf_counter()
+    bucketed = model.encode_corpus(
+        corpus, max_length=args.max_length, token_budget=args.token_budget
+    )
+    bucketed_time = time.perf_counter() - start
+
+    print(f"{len(corpus)} sentences, {real} tokens")
+    for name, batches, elapsed in [
+        (f"batch_size={args.batch_size}", fixed_batches, fixed_time),
+        (f"token_budget={args.token_budget}", bucketed_batches, bucketed_time),
+    ]:
+        padded = padded_tokens(lengths, batches)
+        print(
+            f"{name:>20}: {elapsed:8.2f}s  {real / elapsed:10.1f} tokens/s  "
+            f"{len(batches):6d} batches  {1 - real / padded:6.1%} padding"
+        )
+    print(f"Speedup: {fixed_time / bucketed_time:.2f}x")
+    print(f"Max abs difference: {np.abs(fixed - bucketed).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import asyncio
+import os
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+
+from benchmark_encode import load_corpus
+from state_search_be.flag_model import BACKENDS, FlagModel
+
+load_dotenv()
+
+
+def top_k(queries: np.ndarray, corpus: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the embeddings of a FlagModel backend with fp32"
+    )
+    parser.add_argument("--data-path", type=str, help="Theorem jsonl dump")
+    parser.add_argument("--rev", type=str, help="Load theorems of a rev instead")
+    parser.add_argument("--backend", choices=BACKENDS[1:], default="int8")
+    parser.add_argument("--sample", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-length", type=int, default=512)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    parser.add_argument("--min-overlap", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not args.data_path and not args.rev:
+        parser.error("one of --data-path or --rev is required")
+
+    corpus = asyncio.run(load_corpus(args))
+    indices = np.linspace(0, len(corpus) - 1, min(args.queries, len(corpus)))
+    indices = np.unique(indices.astype(int))
+    # Query rows are left out of the searched corpus, where each would be its
+    # own top hit under both backends
+    held_out = np.setdiff1d(np.arange(len(corpus)), indices)
+    if len(held_out) < args.top_k:
+        parser.error("--queries must leave at least --top-k rows to search")
+    queries = [corpus[i] for i in indices]
+    embeddings = {}
+    for backend in ("torch", args.backend):
+        model = FlagModel(
+            os.getenv("MODEL_NAME_OR_PATH"),
+            use_fp16=False,
+            pooling_method="mean",
+            backend=backend,
+        )
+        if model.backend != backend:
+            raise SystemExit(f"Backend {backend} is not available here")
+        start = time.perf_counter()
+        encoded = model.encode_corpus(
+            corpus, batch_size=args.batch_size, max_length=args.max_length
+        )
+        corpus_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for query in queries:
+            model.encode_queries(query, max_length=args.max_length)
+        query_time = (time.perf_counter() - start) / len(queries)
+        embeddings[backend] = encoded
+        print(
+            f"{backend:>6}: corpus {len(corpus) / corpus_time:8.1f} sentences/s  "
+            f"query {query_time * 1000:7.2f} ms"
+        )
+        del model
+
+    # The index is always built with fp32, queries come from the backend
+    reference, candidate = embeddings["torch"], embeddings[args.backend]
+    cosine = np.sum(reference * candidate, axis=1)
+    expected = top_k(reference[indices], reference[held_out], args.top_k)
+    actual = top_k(candidate[indices], reference[held_out], args.top_k)
+    overlap = np.mean(
+        [len(set(a) & set(b)) / args.top_k for a, b in zip(expected, actual)]
+    )
+    print(f"Cosine to fp32: mean {cosine.mean():.5f}  min {cosine.min():.5f}")
+    print(f"Top-{args.top_k} overlap with fp32: {overlap:.2%}")
+    if cosine.mean() < args.min_cosine or overlap < args.min_overlap:
+        raise SystemExit(f"Backend {args.backend} disagrees with fp32")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+import os
+
+from dotenv import load_dotenv
+
+from benchmark_encode import load_corpus
+from state_search_be.flag_model import (
+    TOKENIZER_PROBES,
+    check_tokenizer_parity,
+    load_encoder_tokenizer,
+)
+
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that the fast tokenizer matches the slow one on a corpus"
+    )
+    parser.add_argument("--data-path", type=str, help="Theorem jsonl dump")
+    parser.add_argument("--rev", type=str, help="Load theorems of a rev instead")
+    parser.add_argument("--sample", type=int, default=5000)
+    parser.add_argument("--max-length", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not args.data_path and not args.rev:
+        parser.error("one of --data-path or --rev is required")
+
+    corpus = TOKENIZER_PROBES + asyncio.run(load_corpus(args))
+    model_name_or_path = os.getenv("MODEL_NAME_OR_PATH")
+    mismatches = check_tokenizer_parity(
+        load_encoder_tokenizer(model_name_or_path, use_fast=False),
+        load_encoder_tokenizer(model_name_or_path, use_fast=True),
+        corpus,
+        args.max_length,
+    )
+    for sentence in mismatches[:20]:
+        print(repr(sentence))
+    print(f"{len(mismatches)} of {len(corpus)} sentences differ")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,49 +2,298 @@ from prisma import Prisma
 import asyncio
 import argparse
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import PointStruct
 from dotenv import load_dotenv
 from state_search_be.flag_model import FlagModel
+from state_search_be.embedding_store import CorpusEmbeddingStore, model_identity
+from state_search_be.theorem_store import iter_theorem_pages, theorem_payload
+from state_search_be.vector_store import VectorStoreWriter, create_qdrant_collection
+from state_search_be.rev_registry import register_rev
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from datetime import datetime, timezone
+from tqdm import tqdm
+import numpy as np
 import os
 
 load_dotenv()
 
 
+def embed_theorems(model, theorems, store=None, token_budget=None) -> np.ndarray:
+    """Embed theorems, reusing the vectors of statements already in `store`."""
+    context_corpus = [
+        "".join(map(lambda v: "<VAR>" + v, theorem.args)) for theorem in theorems
+    ]
+    goal_corpus = ["<GOAL>" + theorem.goal for theorem in theorems]
+    if store is None:
+        context_embeddings = model.encode_corpus(
+            context_corpus, batch_size=32, token_budget=token_budget
+        )
+        goal_embeddings = model.encode_corpus(
+            goal_corpus, batch_size=32, token_budget=token_budget
+        )
+        return (context_embeddings + goal_embeddings) / 2
+
+    keys = [store.key(c, g) for c, g in zip(context_corpus, goal_corpus)]
+    found = store.get_many(keys)
+    # One index per statement that still needs embedding
+    missing = list({key: i for i, key in enumerate(keys) if key not in found}.values())
+    print(f"Reusing {len(keys) - len(missing)} embeddings, computing {len(missing)}")
+    if missing:
+        context_embeddings = model.encode_corpus(
+            [context_corpus[i] for i in missing],
+            batch_size=32,
+            token_budget=token_budget,
+        )
+        goal_embeddings = model.encode_corpus(
+            [goal_corpus[i] for i in missing],
+            batch_size=32,
+            token_budget=token_budget,
+        )
+        computed = ((context_embeddings + goal_embeddings) / 2).astype(np.float32)
+        store.put_many(zip([keys[i] for i in missing], computed))
+        found.update(zip([keys[i] for i in missing], computed))
+    return np.stack([found[key] for key in keys])
+
+
+def chunk_bytes(theorems, embeddings: np.ndarray) -> int:
+    """Rough size of a chunk held in memory until its upload completes."""
+    text = sum(len(t.goal) + sum(map(len, t.args)) + len(t.name) for t in theorems)
+    return embeddings.nbytes + 2 * text
+
+
+def writes_artifact(args) -> bool:
+    return not (args.store == "qdrant" and args.no_artifact)
+
+
+def open_artifact(args, capacity: int, dim: int):
+    """Writer of the rev's embedding artifact, unless `--no-artifact` is set."""
+    if not writes_artifact(args):
+        return None
+    return VectorStoreWriter(
+        args.vector_store_path, args.rev, capacity, dim, dtype=args.dtype
+    )
+
+
+def close_artifact(writer, model_id=None):
+    manifest = writer.close(model=os.getenv("MODEL_NAME_OR_PATH"), model_id=model_id)
+    print(
+        f"Wrote {manifest['count']} vectors to {os.path.join(writer.root, writer.rev)}"
+    )
+
+
+async def build_pipelined(model, vb_client, db_client, args, store=None, model_id=None):
+    """
+    Page theorems from Postgres, embed them chunk by chunk and upload finished
+    chunks on background threads while the next chunk is being embedded.
+
+    Chunks waiting for upload are bounded by `--max-memory-mb`; when the limit
+    is reached, embedding pauses until the oldest upload has finished.
+    """
+    total = await db_client.theorem.count(where={"rev": args.rev})
+    limit = args.max_memory_mb * 2**20
+    pending = deque()
+    in_flight = 0
+    offset = 0
+    created = False
+    artifact = None
+    progress = tqdm(total=total, desc="Embedding theorems")
+    with ThreadPoolExecutor(max_workers=args.upload_workers) as uploader:
+        async for theorems in iter_theorem_pages(db_client, args.rev, args.chunk_size):
+            embeddings = embed_theorems(
+                model, theorems, store, args.token_budget
+            ).astype(np.float32)
+            if not created:
+                create_qdrant_collection(
+                    vb_client,
+                    args.rev,
+                    embeddings.shape[1],
+                    quantization=args.quantization,
+                    on_disk=args.on_disk,
+                )
+                artifact = open_artifact(args, total, embeddings.shape[1])
+                created = True
+            if artifact is not None:
+                artifact.append([theorem.id for theorem in theorems], embeddings)
+            size = chunk_bytes(theorems, embeddings)
+            while pending and (pending[0][0].done() or in_flight + size > limit):
+                future, done_size = pending.popleft()
+                future.result()
+                in_flight -= done_size
+            pending.append(
+                (
+                    uploader.submit(
+                        vb_client.upload_collection,
+                        collection_name=args.rev,
+                        vectors=embeddings,
+                        payload=[
+                            theorem_payload(t, args.full_payload) for t in theorems
+                        ],
+                        ids=range(offset, offset + len(theorems)),
+                        wait=True,
+                    ),
+                    size,
+                )
+            )
+            in_flight += size
+            offset += len(theorems)
+            progress.update(len(theorems))
+        for future, _ in pending:
+            future.result()
+    progress.close()
+    print(f"Uploaded {offset} points to collection {args.rev}")
+    if artifact is not None:
+        close_artifact(artifact, model_id)
+
+
+async def build_mmap(model, db_client, args, store=None, model_id=None):
+    """Embed a rev page by page into the files read by `MmapVectorStore`."""
+    total = await db_client.theorem.count(where={"rev": args.rev})
+    writer = None
+    progress = tqdm(total=total, desc="Embedding theorems")
+    async for theorems in iter_theorem_pages(db_client, args.rev, args.chunk_size):
+        embeddings = embed_theorems(model, theorems, store, args.token_budget)
+        if writer is None:
+            writer = open_artifact(args, total, embeddings.shape[1])
+        writer.append([theorem.id for theorem in theorems], embeddings)
+        progress.update(len(theorems))
+    progress.close()
+    if writer is None:
+        print(f"No theorems found for rev {args.rev}")
+        return
+    close_artifact(writer, model_id)
+
+
+async def build_in_memory(model, vb_client, db_client, args, store=None, model_id=None):
+    theorems = await db_client.theorem.find_many(where={"rev": args.rev})
+    corpus_embeddings = embed_theorems(model, theorems, store, args.token_budget)
+    points = [
+        PointStruct(
+            id=i,
+            vector=corpus_embeddings[i].tolist(),
+            payload=theorem_payload(theorems[i], args.full_payload),
+        )
+        for i in range(len(corpus_embeddings))
+    ]
+
+    create_qdrant_collection(
+        vb_client,
+        args.rev,
+        len(corpus_embeddings[0]),
+        quantization=args.quantization,
+        on_disk=args.on_disk,
+    )
+    vb_client.upload_points(collection_name=args.rev, points=points)
+    artifact = open_artifact(args, len(theorems), corpus_embeddings.shape[1])
+    if artifact is not None:
+        artifact.append([theorem.id for theorem in theorems], corpus_embeddings)
+        close_artifact(artifact, model_id)
+
+
 async def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--rev", type=str, required=True)
+    parser.add_argument(
+        "--full-payload",
+        action="store_true",
+        help="Store display fields in the payload so search can skip Postgres",
+    )
+    parser.add_argument(
+        "--embedding-store",
+        type=str,
+        default=os.getenv("EMBEDDING_STORE_PATH"),
+        help="SQLite file of embeddings shared across revs",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Embed and upload chunk by chunk with bounded memory",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=None,
+        help="Batch by padded token count instead of 32 sentences per batch",
+    )
+    parser.add_argument(
+        "--store",
+        choices=["qdrant", "mmap"],
+        default="qdrant",
+        help="Upload to Qdrant or write files for the in-process vector store",
+    )
+    parser.add_argument(
+        "--vector-store-path",
+        type=str,
+        default=os.getenv("VECTOR_STORE_PATH", "vector_store"),
+        help="Directory of the in-process vector store and of embedding artifacts",
+    )
+    parser.add_argument(
+        "--no-artifact",
+        action="store_true",
+        help="Only upload to Qdrant, without keeping the embeddings on disk",
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=["float32", "float16"],
+        default="float32",
+        help="Precision of the vectors written to disk",
+    )
+    parser.add_argument(
+        "--quantization",
+        choices=["none", "scalar", "binary"],
+        default="none",
+        help="Keep int8 or 1-bit copies of the vectors in RAM for search",
+    )
+    parser.add_argument(
+        "--on-disk",
+        action="store_true",
+        help="Store the original float32 vectors on disk",
+    )
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--upload-workers", type=int, default=2)
+    parser.add_argument(
+        "--max-memory-mb",
+        type=int,
+        default=1024,
+        help="Memory ceiling for chunks waiting to be uploaded (pipeline mode)",
+    )
     args = parser.parse_args()
     model = FlagModel(
         os.getenv("MODEL_NAME_OR_PATH"),
         use_fp16=False,
         pooling_method="mean",
+        use_fast_tokenizer=os.getenv("MODEL_FAST_TOKENIZER", "0") == "1",
     )
-    vb_client = QdrantClient(f"http://localhost:{os.getenv('QDRANT_PORT')}")
     db_client = Prisma()
     await db_client.connect()
-    theorems = await db_client.theorem.find_many(where={"rev": args.rev})
-    context_corpus = [
-        "".join(map(lambda v: "<VAR>" + v, theorem.args)) for theorem in theorems
-    ]
-    goal_corpus = ["<GOAL>" + theorem.goal for theorem in theorems]
-    context_embeddings = model.encode_corpus(context_corpus, batch_size=32)
-    goal_embeddings = model.encode_corpus(goal_corpus, batch_size=32)
-    corpus_embeddings = (context_embeddings + goal_embeddings) / 2
-    points = [
-        PointStruct(
-            id=i, vector=corpus_embeddings[i].tolist(), payload={"id": theorems[i].id}
+    # Fingerprinting reads every file of the model, so only when it is recorded
+    model_id = None
+    if args.embedding_store or writes_artifact(args):
+        model_id = model_identity(
+            os.getenv("MODEL_NAME_OR_PATH"), pooling_method="mean"
         )
-        for i in range(len(corpus_embeddings))
-    ]
-
-    vb_client.delete_collection(args.rev)
-    vb_client.create_collection(
-        collection_name=args.rev,
-        vectors_config=VectorParams(
-            size=len(corpus_embeddings[0]), distance=Distance.DOT
-        ),
+    store = None
+    if args.embedding_store:
+        store = CorpusEmbeddingStore(args.embedding_store, model_id)
+    if args.store == "mmap":
+        await build_mmap(model, db_client, args, store, model_id)
+        collection = os.path.join(args.vector_store_path, args.rev)
+    else:
+        vb_client = QdrantClient(f"http://localhost:{os.getenv('QDRANT_PORT')}")
+        if args.pipeline:
+            await build_pipelined(model, vb_client, db_client, args, store, model_id)
+        else:
+            await build_in_memory(model, vb_client, db_client, args, store, model_id)
+        collection = args.rev
+    await register_rev(
+        db_client,
+        args.rev,
+        embedding_model=os.getenv("MODEL_NAME_OR_PATH"),
+        collection=collection,
+        built_at=datetime.now(timezone.utc),
     )
-    vb_client.upload_points(collection_name=args.rev, points=points)
+    if store is not None:
+        store.close()
     await db_client.disconnect()
 
 
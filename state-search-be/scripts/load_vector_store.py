@@ -0,0 +1,99 @@
+from prisma import Prisma
+import asyncio
+import argparse
+from qdrant_client import QdrantClient
+from dotenv import load_dotenv
+from state_search_be.theorem_store import iter_theorem_pages, theorem_payload
+from state_search_be.vector_store import (
+    MmapVectorStore,
+    create_qdrant_collection,
+    read_manifest,
+)
+from concurrent.futures import ThreadPoolExecutor
+from tqdm import tqdm
+import numpy as np
+import os
+
+load_dotenv()
+
+
+async def full_payloads(rev: str) -> dict:
+    db_client = Prisma()
+    await db_client.connect()
+    payloads = {}
+    async for theorems in iter_theorem_pages(db_client, rev):
+        for theorem in theorems:
+            payloads[theorem.id] = theorem_payload(theorem, full=True)
+    await db_client.disconnect()
+    return payloads
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Create a Qdrant collection from a rev's embedding artifact, "
+        "written by create_vector_store.py, without running the model"
+    )
+    parser.add_argument("--rev", type=str, required=True)
+    parser.add_argument(
+        "--vector-store-path",
+        type=str,
+        default=os.getenv("VECTOR_STORE_PATH", "vector_store"),
+        help="Directory holding the embedding artifacts",
+    )
+    parser.add_argument(
+        "--full-payload",
+        action="store_true",
+        help="Store display fields in the payload, read from Postgres",
+    )
+    parser.add_argument(
+        "--quantization", choices=["none", "scalar", "binary"], default="none"
+    )
+    parser.add_argument("--on-disk", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=8192)
+    parser.add_argument("--upload-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    manifest = read_manifest(args.vector_store_path, args.rev)
+    ids, embeddings = MmapVectorStore(args.vector_store_path).open(args.rev)
+    print(
+        f"Loading {manifest['count']} vectors of rev {args.rev} "
+        f"embedded with {manifest.get('model')}"
+    )
+    payloads = None
+    if args.full_payload:
+        payloads = await full_payloads(args.rev)
+
+    vb_client = QdrantClient(f"http://localhost:{os.getenv('QDRANT_PORT')}")
+    create_qdrant_collection(
+        vb_client,
+        args.rev,
+        manifest["dim"],
+        quantization=args.quantization,
+        on_disk=args.on_disk,
+    )
+
+    def upload(start: int) -> int:
+        chunk_ids = [str(id) for id in ids[start : start + args.chunk_size]]
+        vb_client.upload_collection(
+            collection_name=args.rev,
+            vectors=np.asarray(
+                embeddings[start : start + args.chunk_size], dtype=np.float32
+            ),
+            payload=[
+                payloads[id] if payloads is not None else {"id": id} for id in chunk_ids
+            ],
+            ids=range(start, start + len(chunk_ids)),
+            wait=True,
+        )
+        return len(chunk_ids)
+
+    # Reading the artifact is cheap, so upload chunks in parallel
+    with ThreadPoolExecutor(max_workers=args.upload_workers) as uploader:
+        with tqdm(total=len(ids), desc="Uploading vectors") as progress:
+            for uploaded in uploader.map(upload, range(0, len(ids), args.chunk_size)):
+                progress.update(uploaded)
+    print(f"Uploaded {len(ids)} points to collection {args.rev}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,6 +3,7 @@ import jsonlines
 import argparse
 import asyncio
 from tqdm import tqdm
+from state_search_be.rev_registry import register_rev
 import os
 
 os.environ["DATABASE_URL"] = (
@@ -31,6 +32,7 @@ async def main():
                 }
             )
     await db.theorem.create_many(data=theorems)
+    await register_rev(db, args.rev)
     await db.disconnect()
 
 
@@ -6,6 +6,14 @@ from state_search_be.state_search.v1.state_search_pb2_grpc import (
 from state_search_be.state_search.v1.state_search_pb2 import (
     SearchTheoremRequest,
     SearchTheoremResponse,
+    SearchTheoremStreamRequest,
+    SearchTheoremStreamResponse,
+    BatchSearchTheoremRequest,
+    BatchSearchTheoremResponse,
+    MultiRevSearchTheoremRequest,
+    MultiRevSearchTheoremResponse,
+    RevSearchResult,
+    ScoredTheorem,
     FeedbackRequest,
     FeedbackResponse,
     GetAllRevResponse,
@@ -13,9 +21,6 @@ from state_search_be.state_search.v1.state_search_pb2 import (
     ClickResponse,
     CallRequest,
     CallResponse,
-    Theorem,
-    LeanEdge as ProtoLeanEdge,
-    LeanNode as ProtoLeanNode,
     GetDependencyNodesAndEdgesRequest,
     GetDependencyNodesAndEdgesResponse,
     GetDependentNodesAndEdgesRequest,
@@ -23,133 +28,229 @@ from state_search_be.state_search.v1.state_search_pb2 import (
     SamplingInfo,
     GetNodeSuggestionsRequest,
     GetNodeSuggestionsResponse,
+    TraversalDirection,
+    TraverseGraphRequest,
+    TraverseGraphResponse,
+    FindDependencyPathsRequest,
+    FindDependencyPathsResponse,
+    CheckReachabilityRequest,
+    CheckReachabilityResponse,
+    ReachabilityResult,
 )
 from dotenv import load_dotenv
+import asyncio
+import grpc
 import re
-import random
 import meilisearch
-from .flag_model import FlagModel
+import numpy as np
+from typing import List, Optional
+from .batcher import EmbeddingBatcher
+from .embedding_cache import EmbeddingCache
+from .graph_store import CsrGraph, DbGraph, decode_page_token, encode_page_token
+from .model_pool import ModelPool
+from .rev_registry import RevRegistry
+from .theorem_store import TheoremStore, theorem_from_payload
+from .vector_store import VectorStore
 from prisma import Prisma
-from prisma.errors import RawQueryError
-from qdrant_client import QdrantClient
 
 load_dotenv()
 
 
-def random_sample_with_target(nodes, edges, target_name, max_nodes=50):
-    """
-    Randomly sample nodes ensuring the target node is always included.
-    Returns sampled nodes, edges, and sampling information.
-    """
-    original_count = len(nodes)
-
-    if len(nodes) <= max_nodes:
-        return (
-            nodes,
-            edges,
-            {
-                "was_sampled": False,
-                "original_node_count": original_count,
-                "sampled_node_count": len(nodes),
-            },
-        )
-
-    # Find the target node
-    target_node = None
-    for node in nodes:
-        if node.name == target_name:
-            target_node = node
-            break
-
-    if not target_node:
-        # If target node not found, just do random sampling
-        sampled_nodes = random.sample(nodes, max_nodes)
+def normalize_query(query: str) -> str:
+    """Turn a raw proof state into the `<VAR>...<GOAL>...` form the model expects."""
+    query = query.split("⊢")
+    context = query[0]
+    if len(query) == 2:
+        goal = query[1]
     else:
-        # Always include the target node
-        other_nodes = [n for n in nodes if n.name != target_name]
-        sampled_others = random.sample(other_nodes, max_nodes - 1)
-        sampled_nodes = [target_node] + sampled_others
-
-    # Create set of sampled node names for efficient lookup
-    sampled_names = {node.name for node in sampled_nodes}
-
-    # Filter edges to only include those between sampled nodes
-    sampled_edges = [
-        edge
-        for edge in edges
-        if edge.source in sampled_names and edge.target in sampled_names
-    ]
-
-    return (
-        sampled_nodes,
-        sampled_edges,
-        {
-            "was_sampled": True,
-            "original_node_count": original_count,
-            "sampled_node_count": len(sampled_nodes),
-        },
+        goal = ""
+
+    context = re.sub(r"\n\s+", "", context).strip()
+    context = "".join(
+        filter(lambda line: ":" in line, ["<VAR>" + var for var in context.split("\n")])
     )
+    goal = "<GOAL>" + goal.strip()
+    return context + goal
+
+
+def merge_results(
+    revs: List[str], results: List[List[ScoredTheorem]], nresult: int
+) -> List[ScoredTheorem]:
+    """
+    Merge the hits of several revs, keeping the best scoring hit of every
+    theorem name together with all the revs it was found in.
+    """
+    best = {}
+    for rev, rev_results in zip(revs, results):
+        for result in rev_results:
+            merged = best.get(result.theorem.name)
+            if merged is None:
+                merged = ScoredTheorem(theorem=result.theorem, score=result.score)
+                best[result.theorem.name] = merged
+            elif result.score > merged.score:
+                merged.theorem.CopyFrom(result.theorem)
+                merged.score = result.score
+            merged.revs.append(rev)
+    return sorted(best.values(), key=lambda merged: -merged.score)[:nresult]
 
 
 class LeanStateSearchServicer(LeanStateSearchServiceServicer):
-    def __init__(self, db: Prisma, vb: QdrantClient):
+    def __init__(self, db: Prisma, vb: VectorStore, model: ModelPool):
         self.db = db
         self.vb = vb
-        self.model = FlagModel(
-            os.getenv("MODEL_NAME_OR_PATH"),
-            use_fp16=False,
-            pooling_method="mean",
+        self.model = model
+        self.batcher = EmbeddingBatcher(
+            self.encode_queries,
+            max_batch_size=int(os.getenv("EMBED_MAX_BATCH_SIZE", "32")),
+            max_wait_ms=float(os.getenv("EMBED_MAX_WAIT_MS", "5")),
+            max_inflight=model.num_workers,
+        )
+        self.theorem_store = TheoremStore(
+            db, max_revs=int(os.getenv("THEOREM_STORE_MAX_REVS", "4"))
+        )
+        self.rev_registry = RevRegistry(
+            db,
+            ttl=float(os.getenv("REV_REGISTRY_TTL", "30")),
+            on_change=self.theorem_store.invalidate,
+        )
+        self.search_from_payload = os.getenv("SEARCH_FROM_PAYLOAD", "0") == "1"
+        self.stream_first_chunk = max(int(os.getenv("STREAM_FIRST_CHUNK", "5")), 1)
+        self.stream_chunk = max(int(os.getenv("STREAM_CHUNK", "20")), 1)
+        self.max_batch_queries = int(os.getenv("BATCH_SEARCH_MAX_QUERIES", "1000"))
+        self.embedding_cache = EmbeddingCache(
+            maxsize=int(os.getenv("EMBED_CACHE_SIZE", "10000")),
+            ttl=float(os.getenv("EMBED_CACHE_TTL", "3600")),
         )
 
-    async def SearchTheorem(self, request: SearchTheoremRequest, context):
-        query = request.query.split("⊢")
-        nresult = min(max(request.nresult, 1), 100)
-        rev = request.rev
-        context = query[0]
-        if len(query) == 2:
-            goal = query[1]
-        else:
-            goal = ""
+    async def encode_queries(self, queries):
+        return await self.model.encode_queries(queries, batch_size=len(queries))
 
-        context = re.sub(r"\n\s+", "", context).strip()
-        context = "".join(
-            filter(
-                lambda line: ":" in line, ["<VAR>" + var for var in context.split("\n")]
+    async def embed_many(self, queries: List[str]) -> List[np.ndarray]:
+        """Embed many queries at once, spreading cache misses over all workers."""
+        embeddings, misses = self.embedding_cache.get_many(queries)
+        if misses:
+            chunk_size = -(-len(misses) // self.model.num_workers)
+            chunks = [
+                misses[i : i + chunk_size] for i in range(0, len(misses), chunk_size)
+            ]
+            encoded = await asyncio.gather(
+                *[self.model.encode_queries(chunk) for chunk in chunks]
+            )
+            for chunk, chunk_embeddings in zip(chunks, encoded):
+                for query, embedding in zip(chunk, chunk_embeddings):
+                    embeddings[query] = self.embedding_cache.put(query, embedding)
+        return [embeddings[query] for query in queries]
+
+    async def hydrate(self, rev: str, points) -> SearchTheoremResponse:
+        # Collections built without the display payload fall back to the store
+        if self.search_from_payload and all(
+            "name" in point.payload for point in points
+        ):
+            return SearchTheoremResponse(
+                results=[theorem_from_payload(point.payload, rev) for point in points]
             )
+        results_ids = [point.payload["id"] for point in points]
+        # Refreshes a stale registry in the background, which drops cached
+        # theorems of revs uploaded again since
+        await self.rev_registry.revs()
+        return await self.theorem_store.results(rev, results_ids)
+
+    async def embed_query(self, query: str) -> np.ndarray:
+        return await self.embedding_cache.get_or_embed(
+            normalize_query(query), self.batcher.embed
         )
-        goal = "<GOAL>" + goal.strip()
-        query = context + goal
-        query_embedding = self.model.encode_queries(query).tolist()
-        results = self.vb.query_points(
-            rev, query_embedding, limit=nresult, with_payload=True
+
+    async def search_points(self, request: SearchTheoremRequest):
+        nresult = min(max(request.nresult, 1), 100)
+        query_embedding = await self.embed_query(request.query)
+        return await self.vb.search(
+            request.rev,
+            query_embedding,
+            nresult,
+            with_payload=self.search_from_payload,
         )
-        results_ids = list(map(lambda p: p.payload["id"], results.points))
 
-        theorems = await self.db.theorem.find_many(
-            where={
-                "id": {
-                    "in": results_ids,
-                }
-            }
+    async def scored_results(
+        self, rev: str, query_embedding: np.ndarray, nresult: int
+    ) -> List[ScoredTheorem]:
+        points = await self.vb.search(
+            rev, query_embedding, nresult, with_payload=self.search_from_payload
         )
-        theorems = sorted(theorems, key=lambda x: results_ids.index(x.id))
+        scores = {point.payload["id"]: point.score for point in points}
+        return [
+            ScoredTheorem(theorem=theorem, score=scores[theorem.id])
+            for theorem in (await self.hydrate(rev, points)).results
+        ]
 
-        def to_code(theorem):
-            args = "".join(theorem.args)
-            return f"theorem {theorem.name} {args} : {theorem.goal}"
+    async def SearchTheorem(self, request: SearchTheoremRequest, context):
+        points = await self.search_points(request)
+        return await self.hydrate(request.rev, points)
+
+    async def SearchTheoremStream(self, request: SearchTheoremStreamRequest, context):
+        points = await self.search_points(request)
+        # The top hits go out on their own so clients can render them early
+        chunks = [points[: self.stream_first_chunk]]
+        for start in range(self.stream_first_chunk, len(points), self.stream_chunk):
+            chunks.append(points[start : start + self.stream_chunk])
+        for chunk in chunks:
+            if chunk:
+                response = await self.hydrate(request.rev, chunk)
+                yield SearchTheoremStreamResponse(results=response.results)
+
+    async def BatchSearchTheorem(self, request: BatchSearchTheoremRequest, context):
+        nresult = min(max(request.nresult, 1), 100)
+        rev = request.rev
+        if not request.queries:
+            return BatchSearchTheoremResponse(results=[])
+        if len(request.queries) > self.max_batch_queries:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {self.max_batch_queries} queries per request",
+            )
+        queries = [normalize_query(query) for query in request.queries]
+        query_embeddings = await self.embed_many(queries)
+        results = await self.vb.search_batch(
+            rev, query_embeddings, nresult, with_payload=self.search_from_payload
+        )
+        return BatchSearchTheoremResponse(
+            results=[await self.hydrate(rev, points) for points in results]
+        )
 
-        return SearchTheoremResponse(
-            results=[
-                Theorem(
-                    id=theorem.id,
-                    name=theorem.name,
-                    code=to_code(theorem),
-                    rev=rev,
-                    module=theorem.module,
-                    formal_type=theorem.formal_type,
-                )
-                for theorem in theorems
-            ]
+    async def MultiRevSearchTheorem(
+        self, request: MultiRevSearchTheoremRequest, context
+    ):
+        nresult = min(max(request.nresult, 1), 100)
+        revs = list(dict.fromkeys(request.revs))
+        if not revs:
+            return MultiRevSearchTheoremResponse()
+        # Every rev is hydrated from the theorem store, which would otherwise
+        # evict and reload the revs of each such request
+        if len(revs) > self.theorem_store.max_revs:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {self.theorem_store.max_revs} revs per request",
+            )
+        # Revs missing from the registry have no collection and get no results
+        known = set(await self.rev_registry.revs())
+        searched = [rev for rev in revs if rev in known]
+        found = {}
+        if searched:
+            # One embedding for all revs, which are then searched concurrently
+            query_embedding = await self.embed_query(request.query)
+            searched_results = await asyncio.gather(
+                *[
+                    self.scored_results(rev, query_embedding, nresult)
+                    for rev in searched
+                ]
+            )
+            found = dict(zip(searched, searched_results))
+        results = [found.get(rev, []) for rev in revs]
+        return MultiRevSearchTheoremResponse(
+            revs=[
+                RevSearchResult(rev=rev, results=rev_results)
+                for rev, rev_results in zip(revs, results)
+            ],
+            merged=merge_results(revs, results, nresult) if request.merge else [],
         )
 
     async def Feedback(self, request: FeedbackRequest, context):
@@ -184,13 +285,7 @@ class LeanStateSearchServicer(LeanStateSearchServiceServicer):
         return FeedbackResponse()
 
     async def GetAllRev(self, request, context):
-        try:
-            results = await self.db.query_raw('SELECT DISTINCT "rev" FROM "Theorem";')
-            values = [result["rev"] for result in results]
-        except RawQueryError:
-            values = []
-
-        return GetAllRevResponse(revs=values)
+        return GetAllRevResponse(revs=await self.rev_registry.revs())
 
     async def Click(self, request: ClickRequest, context):
         query = request.query
@@ -209,145 +304,156 @@ class LeanStateSearchServicer(LeanStateSearchServiceServicer):
 
 
 class LeanGraphServicer(LeanGraphServiceServicer):
-    def __init__(self, db: Prisma, meili_client: meilisearch.Client):
+    def __init__(
+        self,
+        db: Prisma,
+        meili_client: meilisearch.Client,
+        graph: Optional[CsrGraph] = None,
+    ):
         self.db = db
+        # Queries go to Postgres unless the graph was loaded into memory
+        if graph is None:
+            graph = DbGraph(
+                db,
+                os.getenv("GRAPH_REACHABILITY_INDEX_PATH", "reachability_index.npz"),
+            )
+        self.graph = graph
         self.meili_client = meili_client
         self.index_name = "lean_nodes"
-
-    async def GetDependencyNodesAndEdges(
-        self, request: GetDependencyNodesAndEdgesRequest, context
-    ):
-        node = await self.db.leannode.find_first(where={"name": request.name})
-        if node is None:
-            return GetDependencyNodesAndEdgesResponse(nodes=[], edges=[])
-
-        edges = await self.db.leanedge.find_many(where={"source": node.name})
-
-        nodes = await self.db.leannode.find_many(
-            where={"name": {"in": [edge.target for edge in edges]}}
+        self.max_traversal_depth = int(os.getenv("GRAPH_TRAVERSAL_MAX_DEPTH", "10"))
+        self.max_traversal_nodes = int(os.getenv("GRAPH_TRAVERSAL_MAX_NODES", "2000"))
+        self.max_paths = int(os.getenv("GRAPH_PATHS_MAX_K", "10"))
+        self.max_path_explored = int(os.getenv("GRAPH_PATHS_MAX_EXPLORED", "100000"))
+        self.max_reachability_pairs = int(
+            os.getenv("GRAPH_REACHABILITY_MAX_PAIRS", "1000")
         )
-
-        # Create proto nodes for dependency targets
-        proto_nodes = [
-            ProtoLeanNode(
-                name=node.name,
-                const_category=node.const_category,
-                const_type=node.const_type,
-                module=node.module,
-                doc_string=node.doc_string,
-                informal_name=node.informal_name,
-                informal_statement=node.informal_statement,
-            )
-            for node in nodes
-        ]
-
-        # Add the target node itself to the list
-        proto_nodes.append(
-            ProtoLeanNode(
-                name=node.name,
-                const_category=node.const_category,
-                const_type=node.const_type,
-                module=node.module,
-                doc_string=node.doc_string,
-                informal_name=node.informal_name,
-                informal_statement=node.informal_statement,
-            )
+        # Neighborhoods are sampled down to this many nodes, including the center
+        self.max_neighborhood_nodes = max(int(os.getenv("GRAPH_SAMPLE_NODES", "50")), 2)
+        self.max_page_size = int(os.getenv("GRAPH_MAX_PAGE_SIZE", "500"))
+
+    async def neighborhood(self, request, direction: str, context) -> dict:
+        """Fields of the response to a dependency or dependent lookup."""
+        if request.page_size > 0:
+            return await self.neighborhood_page(request, direction, context)
+
+        # Only the sampled neighbors are read, so hubs cost as much as any node
+        neighborhood = await self.graph.neighborhood(
+            request.name,
+            direction,
+            self.max_neighborhood_nodes - 1,
+            request.sample_seed,
         )
+        if neighborhood is None:
+            return {}
 
-        proto_edges = [
-            ProtoLeanEdge(
-                id=edge.id,
-                source=edge.source,
-                target=edge.target,
-                edge_type=edge.edge_type,
-            )
-            for edge in edges
-        ]
-
-        # Apply sampling if needed
-        sampled_nodes, sampled_edges, sampling_data = random_sample_with_target(
-            proto_nodes, proto_edges, request.name
-        )
+        # Add the target node itself to the list
+        proto_nodes = neighborhood.nodes + [neighborhood.node]
 
-        # Create sampling info
         sampling_info = SamplingInfo(
-            was_sampled=sampling_data["was_sampled"],
-            original_node_count=sampling_data["original_node_count"],
-            sampled_node_count=sampling_data["sampled_node_count"],
+            was_sampled=neighborhood.neighbor_count > self.max_neighborhood_nodes - 1,
+            original_node_count=neighborhood.neighbor_count + 1,
+            sampled_node_count=len(proto_nodes),
+            original_edge_count=neighborhood.edge_count,
+        )
+        return {
+            "nodes": proto_nodes,
+            "edges": neighborhood.edges,
+            "sampling_info": sampling_info,
+        }
+
+    async def neighborhood_page(self, request, direction: str, context) -> dict:
+        after = ""
+        if request.page_token:
+            try:
+                after = decode_page_token(request.page_token, request.name, direction)
+            except ValueError as e:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        page = await self.graph.neighborhood_page(
+            request.name,
+            direction,
+            min(request.page_size, self.max_page_size),
+            after,
         )
+        if page is None:
+            return {}
+        next_page_token = ""
+        if page.last is not None:
+            next_page_token = encode_page_token(request.name, direction, page.last)
+        return {
+            "nodes": page.nodes + [page.node],
+            "edges": page.edges,
+            "next_page_token": next_page_token,
+        }
 
+    async def GetDependencyNodesAndEdges(
+        self, request: GetDependencyNodesAndEdgesRequest, context
+    ):
         return GetDependencyNodesAndEdgesResponse(
-            nodes=sampled_nodes,
-            edges=sampled_edges,
-            sampling_info=sampling_info,
+            **await self.neighborhood(request, "dependency", context)
         )
 
     async def GetDependentNodesAndEdges(
         self, request: GetDependentNodesAndEdgesRequest, context
     ):
-        node = await self.db.leannode.find_first(where={"name": request.name})
-        if node is None:
-            return GetDependencyNodesAndEdgesResponse(nodes=[], edges=[])
-
-        edges = await self.db.leanedge.find_many(where={"target": node.name})
-
-        nodes = await self.db.leannode.find_many(
-            where={"name": {"in": [edge.source for edge in edges]}}
+        return GetDependentNodesAndEdgesResponse(
+            **await self.neighborhood(request, "dependent", context)
         )
 
-        # Create proto nodes for dependent sources
-        proto_nodes = [
-            ProtoLeanNode(
-                name=node.name,
-                const_category=node.const_category,
-                const_type=node.const_type,
-                module=node.module,
-                doc_string=node.doc_string,
-                informal_name=node.informal_name,
-                informal_statement=node.informal_statement,
-            )
-            for node in nodes
-        ]
-
-        # Add the target node itself to the list
-        proto_nodes.append(
-            ProtoLeanNode(
-                name=node.name,
-                const_category=node.const_category,
-                const_type=node.const_type,
-                module=node.module,
-                doc_string=node.doc_string,
-                informal_name=node.informal_name,
-                informal_statement=node.informal_statement,
-            )
+    async def TraverseGraph(self, request: TraverseGraphRequest, context):
+        if request.direction == TraversalDirection.TRAVERSAL_DIRECTION_DEPENDENTS:
+            direction = "dependent"
+        else:
+            direction = "dependency"
+        max_depth = min(
+            request.max_depth or self.max_traversal_depth, self.max_traversal_depth
         )
-
-        proto_edges = [
-            ProtoLeanEdge(
-                id=edge.id,
-                source=edge.source,
-                target=edge.target,
-                edge_type=edge.edge_type,
-            )
-            for edge in edges
-        ]
-
-        # Apply sampling if needed
-        sampled_nodes, sampled_edges, sampling_data = random_sample_with_target(
-            proto_nodes, proto_edges, request.name
+        max_nodes = min(
+            request.max_nodes or self.max_traversal_nodes, self.max_traversal_nodes
         )
-
-        # Create sampling info
-        sampling_info = SamplingInfo(
-            was_sampled=sampling_data["was_sampled"],
-            original_node_count=sampling_data["original_node_count"],
-            sampled_node_count=sampling_data["sampled_node_count"],
+        traversal = await self.graph.traverse(
+            request.name,
+            direction,
+            max(max_depth, 0),
+            max(max_nodes, 1),
+            list(request.edge_types),
+        )
+        if traversal is None:
+            return TraverseGraphResponse()
+        return TraverseGraphResponse(
+            nodes=traversal.nodes,
+            edges=traversal.edges,
+            depths=traversal.depths,
+            truncated=traversal.truncated,
         )
 
-        return GetDependentNodesAndEdgesResponse(
-            nodes=sampled_nodes,
-            edges=sampled_edges,
-            sampling_info=sampling_info,
+    async def FindDependencyPaths(self, request: FindDependencyPathsRequest, context):
+        result = await self.graph.dependency_paths(
+            request.source,
+            request.target,
+            min(max(request.k, 1), self.max_paths),
+            self.max_path_explored,
+            list(request.edge_types),
+        )
+        if result is None:
+            return FindDependencyPathsResponse()
+        paths, truncated = result
+        return FindDependencyPathsResponse(paths=paths, truncated=truncated)
+
+    async def CheckReachability(self, request: CheckReachabilityRequest, context):
+        if len(request.queries) > self.max_reachability_pairs:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {self.max_reachability_pairs} queries per request",
+            )
+        results = await self.graph.reachability(
+            [(query.source, query.target) for query in request.queries],
+            self.max_path_explored,
+        )
+        return CheckReachabilityResponse(
+            results=[
+                ReachabilityResult(reachable=reachable, undecided=undecided)
+                for reachable, undecided in results
+            ]
         )
 
     async def initialize_meilisearch_index(self):
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU cache of query embeddings with a time-to-live.
+
+    Embeddings are kept as read-only float32 arrays. Concurrent misses on the
+    same key share a single computation instead of embedding the query twice.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, np.ndarray]] = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, embedding = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return embedding
+
+    def put(self, key: str, embedding: np.ndarray) -> np.ndarray:
+        embedding = np.array(embedding, dtype=np.float32)
+        embedding.setflags(write=False)
+        if self.maxsize <= 0:
+            return embedding
+        self._entries[key] = (time.monotonic() + self.ttl, embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return embedding
+
+    def get_many(self, keys: List[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """The cached embeddings among `keys`, and the distinct keys missing."""
+        found, missing = {}, []
+        for key in dict.fromkeys(keys):
+            embedding = self.get(key)
+            if embedding is None:
+                missing.append(key)
+            else:
+                found[key] = embedding
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        return found, missing
+
+    async def get_or_embed(
+        self, key: str, embed: Callable[[str], Awaitable[np.ndarray]]
+    ) -> np.ndarray:
+        embedding = self.get(key)
+        if embedding is not None:
+            self.hits += 1
+            return embedding
+        pending = self._pending.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._fill(key, embed))
+            self._pending[key] = pending
+        else:
+            self.hits += 1
+        # A cancelled caller must not cancel the shared computation.
+        return await asyncio.shield(pending)
+
+    async def _fill(
+        self, key: str, embed: Callable[[str], Awaitable[np.ndarray]]
+    ) -> np.ndarray:
+        try:
+            return self.put(key, await embed(key))
+        finally:
+            del self._pending[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self), "hits": self.hits, "misses": self.misses}
+
+    async def log_stats(self, interval: float):
+        """Log `stats` every `interval` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            stats = self.stats()
+            lookups = stats["hits"] + stats["misses"]
+            logging.info(
+                "Embedding cache: %d entries, %d hits, %d misses (%.1f%% hit rate)",
+                stats["size"],
+                stats["hits"],
+                stats["misses"],
+                100 * stats["hits"] / lookups if lookups else 0.0,
+            )
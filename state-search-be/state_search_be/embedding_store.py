@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# SQLite limits the number of bound parameters per statement.
+_SQLITE_BATCH = 900
+_HASH_CHUNK = 1 << 20
+
+
+def model_identity(model_name_or_path: str, **options) -> str:
+    """
+    Fingerprint of a model and the options that change its embeddings.
+
+    A hub id is resolved to the snapshot of its current revision. Every file of
+    the model directory is hashed by name and content, so a retrained checkpoint
+    or a new upstream revision gets a new identity.
+    """
+    path = model_name_or_path
+    if not os.path.isdir(path):
+        from huggingface_hub import snapshot_download
+
+        path = snapshot_download(model_name_or_path)
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(files):
+            file = os.path.join(root, name)
+            digest.update(os.path.relpath(file, path).encode() + b"\0")
+            with open(file, "rb") as f:
+                while chunk := f.read(_HASH_CHUNK):
+                    digest.update(chunk)
+    digest.update(json.dumps(options, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class CorpusEmbeddingStore:
+    """
+    Persistent, content-addressed store of theorem embeddings.
+
+    A vector is keyed by the model identity and the normalized context and goal
+    texts it was computed from, so revs that share a statement share its
+    embedding no matter where the statement lives.
+    """
+
+    def __init__(self, path: str, model_id: str):
+        self.model_id = model_id
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+        )
+
+    def key(self, context: str, goal: str) -> bytes:
+        return hashlib.sha256(
+            "\0".join((self.model_id, context, goal)).encode()
+        ).digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), _SQLITE_BATCH):
+            batch = unique[start : start + _SQLITE_BATCH]
+            rows = self.conn.execute(
+                "SELECT key, vector FROM embeddings WHERE key IN "
+                f"({','.join('?' * len(batch))})",
+                batch,
+            )
+            for key, vector in rows:
+                found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def put_many(self, items: Iterable[tuple]):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+            (
+                (key, np.asarray(vector, dtype=np.float32).tobytes())
+                for key, vector in items
+            ),
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -1,4 +1,6 @@
-from typing import cast, List, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast, Iterable, List, Optional, Union
 
 import numpy as np
 import torch
@@ -13,6 +15,57 @@ import transformers
 from typing import Dict
 
 DEFAULT_PAD_TOKEN = "[PAD]"
+# Inference backends: fp32 torch, dynamically quantized int8 Linear layers,
+# and bfloat16 weights on CPUs with native bf16 support.
+BACKENDS = ("torch", "int8", "bf16")
+
+# Proof states exercising our special tokens, used to compare tokenizers.
+TOKENIZER_PROBES = [
+    "<VAR>(n : ℕ)<VAR>(h : 0 < n)<GOAL>n ≠ 0",
+    "<VAR>{α : Type u_1} [inst : Group α] (a b : α)<GOAL>a * b * b⁻¹ = a",
+    "<VAR>(f : ℝ → ℝ) (hf : Continuous f)<GOAL>∀ ε > 0, ∃ δ > 0, |f δ| < ε",
+    "<GOAL>∀ (x : ℝ), 0 < Real.exp x",
+    "[UNK]<VAR>x : 𝔽<GOAL>x = x [UNK]",
+    "<GOAL>",
+]
+_END = object()
+
+
+def load_encoder_tokenizer(
+    model_name_or_path: str, use_fast: bool = False
+) -> transformers.PreTrainedTokenizerBase:
+    tokenizer = AutoTokenizer.from_pretrained(model_name_or_path, use_fast=use_fast)
+    tokenizer.add_special_tokens({"unk_token": "[UNK]"})
+    return tokenizer
+
+
+def check_tokenizer_parity(
+    slow: transformers.PreTrainedTokenizerBase,
+    fast: transformers.PreTrainedTokenizerBase,
+    sentences: List[str],
+    max_length: int = 512,
+) -> List[str]:
+    """Return the sentences that the two tokenizers turn into different ids."""
+    slow_ids = slow(sentences, truncation=True, max_length=max_length)["input_ids"]
+    fast_ids = fast(sentences, truncation=True, max_length=max_length)["input_ids"]
+    return [
+        sentence
+        for sentence, a, b in zip(sentences, slow_ids, fast_ids)
+        if list(a) != list(b)
+    ]
+
+
+def prefetch(iterable: Iterable, depth: int = 1):
+    """Produce the items of `iterable` on a worker thread, `depth` items ahead."""
+    iterator = iter(iterable)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = deque(executor.submit(next, iterator, _END) for _ in range(depth))
+        while True:
+            item = pending.popleft().result()
+            if item is _END:
+                return
+            pending.append(executor.submit(next, iterator, _END))
+            yield item
 
 
 def smart_tokenizer_and_embedding_resize(
@@ -44,16 +97,30 @@ class FlagModel:
         query_instruction_for_retrieval: str = None,
         use_fp16: bool = True,
         model_type: str = "encoder_only",
+        use_fast_tokenizer: bool = False,
+        backend: str = "torch",
     ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
         if model_type == "encoder_only" or model_type == "decoder_only":
             self.model = AutoModel.from_pretrained(model_name_or_path)
         else:
             self.model = T5EncoderModel.from_pretrained(model_name_or_path)
 
         if model_type == "encoder_only":
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                model_name_or_path, use_fast=False
-            )
+            self.tokenizer = load_encoder_tokenizer(model_name_or_path, False)
+            if use_fast_tokenizer:
+                fast_tokenizer = load_encoder_tokenizer(model_name_or_path, True)
+                mismatches = check_tokenizer_parity(
+                    self.tokenizer, fast_tokenizer, TOKENIZER_PROBES
+                )
+                if mismatches:
+                    print(
+                        "Fast tokenizer disagrees with the slow one on "
+                        f"{mismatches!r}, keeping the slow tokenizer"
+                    )
+                else:
+                    self.tokenizer = fast_tokenizer
         else:
             self.tokenizer = AutoTokenizer.from_pretrained(
                 model_name_or_path,
@@ -95,18 +162,41 @@ class FlagModel:
         if use_fp16:
             self.model.half()
         self.model = self.model.to(self.device)
+        self.backend = "torch"
+        if backend != "torch":
+            self.use_backend(backend)
 
         self.num_gpus = torch.cuda.device_count()
         if self.num_gpus > 1:
             print(f"----------using {self.num_gpus}*GPUs----------")
             self.model = torch.nn.DataParallel(self.model)
 
+    def use_backend(self, backend: str):
+        """Switch the CPU model to a lower precision backend."""
+        if self.device.type != "cpu":
+            print(f"Backend {backend} is only supported on CPU, keeping torch")
+            return
+        if backend == "int8":
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif backend == "bf16":
+            if not (
+                torch.backends.mkldnn.is_available()
+                and torch.ops.mkldnn._is_mkldnn_bf16_supported()
+            ):
+                print("This CPU has no native bf16 support, keeping torch")
+                return
+            self.model = self.model.to(torch.bfloat16)
+        self.backend = backend
+
     def encode_queries(
         self,
         queries: Union[List[str], str],
         batch_size: int = 256,
         max_length: int = 512,
         convert_to_numpy: bool = True,
+        token_budget: Optional[int] = None,
     ) -> np.ndarray:
         """
         This function will be used for retrieval task
@@ -127,6 +217,7 @@ class FlagModel:
             batch_size=batch_size,
             max_length=max_length,
             convert_to_numpy=convert_to_numpy,
+            token_budget=token_budget,
         )
 
     def encode_corpus(
@@ -135,6 +226,7 @@ class FlagModel:
         batch_size: int = 256,
         max_length: int = 512,
         convert_to_numpy: bool = True,
+        token_budget: Optional[int] = None,
     ) -> np.ndarray:
         """
         This function will be used for retrieval task
@@ -145,6 +237,7 @@ class FlagModel:
             batch_size=batch_size,
             max_length=max_length,
             convert_to_numpy=convert_to_numpy,
+            token_budget=token_budget,
         )
 
     @torch.no_grad()
@@ -154,7 +247,13 @@ class FlagModel:
         batch_size: int = 256,
         max_length: int = 512,
         convert_to_numpy: bool = True,
+        token_budget: Optional[int] = None,
     ) -> np.ndarray:
+        """
+        With `token_budget`, sentences are sorted by token count and batched so
+        that each padded batch holds at most `token_budget` tokens, instead of
+        `batch_size` sentences in input order. Outputs keep the input order.
+        """
         if self.num_gpus > 0:
             batch_size = batch_size * self.num_gpus
         self.model.eval()
@@ -165,30 +264,25 @@ class FlagModel:
             input_was_string = True
         if self.model_type != "encoder_only":
             sentences = [item + " <|endoftext|>" for item in sentences]
+        if token_budget is not None:
+            all_embeddings = self.encode_bucketed(sentences, token_budget, max_length)
+            if convert_to_numpy:
+                all_embeddings = all_embeddings.cpu().numpy()
+            if input_was_string:
+                return all_embeddings[0]
+            return all_embeddings
         all_embeddings = []
         print(len(sentences))
-        for start_index in tqdm(
-            range(0, len(sentences), batch_size),
+        batches = self.fixed_batches(sentences, batch_size, max_length)
+        if len(sentences) > batch_size:
+            batches = prefetch(batches)
+        for inputs in tqdm(
+            batches,
+            total=-(-len(sentences) // batch_size),
             desc="Inference Embeddings",
             disable=len(sentences) < 256,
         ):
-            sentences_batch = sentences[start_index : start_index + batch_size]
-            try:
-                inputs = self.tokenizer(
-                    sentences_batch,
-                    padding=True,
-                    truncation=True,
-                    return_tensors="pt",
-                    max_length=max_length,
-                ).to(self.device)
-            except ValueError:
-                print(sentences_batch)
-                raise ValueError("error")
-            # if self.model_type == 'encoder_only':
-            last_hidden_state = self.model(**inputs, return_dict=True).last_hidden_state
-            embeddings = self.pooling(last_hidden_state, inputs["attention_mask"])
-            if self.normalize_embeddings:
-                embeddings = torch.nn.functional.normalize(embeddings, dim=-1)
+            embeddings = self.embed_inputs(inputs.to(self.device))
 
             # else:
             #     hidden_states = self.model(input_ids=inputs['input_ids'], attention_mask=inputs['attention_mask'],
@@ -211,6 +305,95 @@ class FlagModel:
             return all_embeddings[0]
         return all_embeddings
 
+    def embed_inputs(self, inputs) -> torch.Tensor:
+        last_hidden_state = self.model(**inputs, return_dict=True).last_hidden_state
+        # Pool and normalize in fp32 whatever precision the model runs in
+        last_hidden_state = last_hidden_state.float()
+        embeddings = self.pooling(last_hidden_state, inputs["attention_mask"])
+        if self.normalize_embeddings:
+            embeddings = torch.nn.functional.normalize(embeddings, dim=-1)
+        return embeddings
+
+    def fixed_batches(self, sentences: List[str], batch_size: int, max_length: int):
+        """Tokenize `sentences` in input order, `batch_size` at a time."""
+        for start_index in range(0, len(sentences), batch_size):
+            sentences_batch = sentences[start_index : start_index + batch_size]
+            try:
+                yield self.tokenizer(
+                    sentences_batch,
+                    padding=True,
+                    truncation=True,
+                    return_tensors="pt",
+                    max_length=max_length,
+                )
+            except ValueError:
+                print(sentences_batch)
+                raise ValueError("error")
+
+    def token_batches(
+        self,
+        sentences: List[str],
+        token_budget: int,
+        max_length: int = 512,
+        window: int = 4096,
+    ):
+        """
+        Group `sentences`, longest first, into batches whose padded size stays
+        within `token_budget` tokens. Sentences are taken by character length in
+        windows of `window`; a window is tokenized on a worker thread while the
+        batches of the previous one run, and sorted by token count. Yields the
+        original indices of each batch together with its padded inputs.
+        """
+        by_chars = sorted(range(len(sentences)), key=lambda i: -len(sentences[i]))
+
+        def tokenized_windows():
+            for start in range(0, len(by_chars), window):
+                indices = by_chars[start : start + window]
+                yield (
+                    indices,
+                    self.tokenizer(
+                        [sentences[i] for i in indices],
+                        truncation=True,
+                        max_length=max_length,
+                    ),
+                )
+
+        for indices, encoded in prefetch(tokenized_windows()):
+            lengths = [len(ids) for ids in encoded["input_ids"]]
+            order = sorted(range(len(indices)), key=lambda i: -lengths[i])
+            start = 0
+            while start < len(order):
+                # The first sentence of a batch is its longest one
+                size = max(token_budget // lengths[order[start]], 1)
+                batch = order[start : start + size]
+                features = [{k: v[i] for k, v in encoded.items()} for i in batch]
+                yield (
+                    [indices[i] for i in batch],
+                    self.tokenizer.pad(features, return_tensors="pt"),
+                )
+                start += size
+
+    def encode_bucketed(
+        self, sentences: List[str], token_budget: int, max_length: int = 512
+    ) -> torch.Tensor:
+        all_embeddings = None
+        # Batch k+1 is collated on a worker thread while batch k runs
+        batches = prefetch(self.token_batches(sentences, token_budget, max_length))
+        with tqdm(
+            total=len(sentences),
+            desc="Inference Embeddings",
+            disable=len(sentences) < 256,
+        ) as progress:
+            for indices, inputs in batches:
+                embeddings = self.embed_inputs(inputs.to(self.device))
+                if all_embeddings is None:
+                    all_embeddings = embeddings.new_empty(
+                        (len(sentences), embeddings.shape[-1])
+                    )
+                all_embeddings[indices] = embeddings
+                progress.update(len(indices))
+        return all_embeddings
+
     def pooling(
         self, last_hidden_state: torch.Tensor, attention_mask: torch.Tensor = None
     ):
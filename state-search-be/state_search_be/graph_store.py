@@ -0,0 +1,942 @@
+import asyncio
+import base64
+import bisect
+import hashlib
+import heapq
+import json
+import os
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from prisma import Prisma
+
+from state_search_be.reachability import ReachabilityIndex
+from state_search_be.state_search.v1.state_search_pb2 import (
+    DependencyPath as ProtoDependencyPath,
+    LeanEdge as ProtoLeanEdge,
+    LeanNode as ProtoLeanNode,
+)
+
+# Edge column matching the center node and edge column of its neighbors.
+DIRECTIONS = {
+    "dependency": ("source", "target"),
+    "dependent": ("target", "source"),
+}
+
+# The center node, the number of its edges and distinct neighbors in one
+# direction, and the edges to and nodes of the `$3` neighbors with the lowest
+# `sample_key`, as a single JSON document. Counting and sampling only read the
+# composite edge index.
+_NEIGHBORHOOD_SQL = """
+WITH neighbors AS (
+  SELECT "{neighbor}" AS name, COUNT(*) AS edges
+  FROM "LeanEdge" WHERE "{center}" = $1 GROUP BY "{neighbor}"
+),
+sample AS (
+  SELECT name FROM neighbors WHERE name <> $1
+  ORDER BY ('x' || left(md5(name), 16))::bit(64)::bigint # $2::bigint
+  LIMIT $3
+)
+SELECT json_build_object(
+  'node', row_to_json(n),
+  'neighbor_count', (SELECT COUNT(*) FROM neighbors WHERE name <> $1),
+  'edge_count', (SELECT COALESCE(SUM(edges), 0) FROM neighbors),
+  'edges', COALESCE(
+    (SELECT json_agg(e ORDER BY e."{neighbor}" COLLATE "C", e."id")
+     FROM "LeanEdge" e
+     WHERE e."{center}" = $1
+       AND (e."{neighbor}" = $1 OR e."{neighbor}" IN (SELECT name FROM sample))),
+    '[]'::json
+  ),
+  'nodes', COALESCE(
+    (SELECT json_agg(m ORDER BY m."name" COLLATE "C") FROM "LeanNode" m
+     WHERE m."name" IN (SELECT name FROM sample)),
+    '[]'::json
+  )
+)::text AS neighborhood
+FROM "LeanNode" n
+WHERE n."name" = $1;
+"""
+NEIGHBORHOOD_SQL = {
+    direction: _NEIGHBORHOOD_SQL.format(center=center, neighbor=neighbor)
+    for direction, (center, neighbor) in DIRECTIONS.items()
+}
+
+# The center node and the first `$3` distinct neighbors after `$2` in name
+# order, with their nodes and edges, as a single JSON document. Self-loops
+# come with the first page. Names are compared and ordered by code point, as
+# in `CsrGraph`, whatever the database collation. On a database with the C
+# collation, the page is read in index order from the composite edge index, so
+# it costs the same at any offset.
+_NEIGHBORHOOD_PAGE_SQL = """
+WITH page AS (
+  SELECT "{neighbor}" AS name FROM "LeanEdge"
+  WHERE "{center}" = $1 AND "{neighbor}" COLLATE "C" > $2 AND "{neighbor}" <> $1
+  GROUP BY 1
+  ORDER BY "{neighbor}" COLLATE "C"
+  LIMIT $3
+),
+last AS (SELECT MAX(name COLLATE "C") AS name FROM page)
+SELECT json_build_object(
+  'node', row_to_json(n),
+  'last', (SELECT name FROM last),
+  'more', EXISTS (
+    SELECT 1 FROM "LeanEdge" e
+    WHERE e."{center}" = $1 AND e."{neighbor}" <> $1
+      AND e."{neighbor}" COLLATE "C" > (SELECT name FROM last)
+  ),
+  'edges', COALESCE(
+    (SELECT json_agg(e ORDER BY e."{neighbor}" COLLATE "C", e."id") FROM (
+       SELECT * FROM "LeanEdge"
+       WHERE "{center}" = $1 AND "{neighbor}" <> $1
+         AND "{neighbor}" COLLATE "C" > $2
+         AND "{neighbor}" COLLATE "C" <= (SELECT name FROM last)
+       UNION ALL
+       SELECT * FROM "LeanEdge"
+       WHERE "{center}" = $1 AND "{neighbor}" = $1 AND $2 = ''
+     ) e),
+    '[]'::json
+  ),
+  'nodes', COALESCE(
+    (SELECT json_agg(m ORDER BY m."name" COLLATE "C") FROM "LeanNode" m
+     WHERE m."name" IN (SELECT name FROM page)),
+    '[]'::json
+  )
+)::text AS neighborhood
+FROM "LeanNode" n
+WHERE n."name" = $1;
+"""
+NEIGHBORHOOD_PAGE_SQL = {
+    direction: _NEIGHBORHOOD_PAGE_SQL.format(center=center, neighbor=neighbor)
+    for direction, (center, neighbor) in DIRECTIONS.items()
+}
+
+# Name columns of the graph tables. The queries above compare and order names
+# by code point; with the C collation on these columns as well, the primary key
+# and the composite edge indexes serve those comparisons.
+GRAPH_NAME_COLUMNS = {"LeanNode": ["name"], "LeanEdge": ["source", "target"]}
+
+
+async def use_code_point_collation(db: Prisma):
+    """Give every graph name column the C collation, rebuilding its indexes."""
+    for table, columns in GRAPH_NAME_COLUMNS.items():
+        rows = await db.query_raw(
+            "SELECT column_name, collation_name FROM information_schema.columns "
+            "WHERE table_name = $1;",
+            table,
+        )
+        altered = [
+            row["column_name"]
+            for row in rows
+            if row["column_name"] in columns and row["collation_name"] != "C"
+        ]
+        if altered:
+            await db.execute_raw(
+                f'ALTER TABLE "{table}" '
+                + ", ".join(
+                    f'ALTER COLUMN "{column}" TYPE text COLLATE "C"'
+                    for column in altered
+                )
+                + ";"
+            )
+
+
+def sample_key(value: str) -> int:
+    """
+    The first 64 bits of the MD5 of `value` as a signed integer, which
+    Postgres computes as `('x' || left(md5(value), 16))::bit(64)::bigint`.
+    """
+    return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big", signed=True)
+
+
+class Neighborhood(NamedTuple):
+    """
+    A node with a sample of its neighbors in one direction: the `limit`
+    neighbors whose `sample_key` XOR that of the seed is lowest, and the
+    edges to them. `neighbor_count` and `edge_count` count all of them.
+    """
+
+    node: ProtoLeanNode
+    nodes: List[ProtoLeanNode]
+    edges: List[ProtoLeanEdge]
+    neighbor_count: int
+    edge_count: int
+
+
+class NeighborhoodPage(NamedTuple):
+    """
+    A node with a page of its neighbors in one direction, in name order, and
+    the edges to them. `last` is the name to continue after, or None on the
+    last page.
+    """
+
+    node: ProtoLeanNode
+    nodes: List[ProtoLeanNode]
+    edges: List[ProtoLeanEdge]
+    last: Optional[str]
+
+
+def encode_page_token(name: str, direction: str, last: str) -> str:
+    return base64.urlsafe_b64encode(
+        json.dumps([name, direction, last]).encode()
+    ).decode()
+
+
+def decode_page_token(token: str, name: str, direction: str) -> str:
+    """The name to continue after, or ValueError if `token` is not ours."""
+    try:
+        token_name, token_direction, last = json.loads(
+            base64.urlsafe_b64decode(token.encode())
+        )
+    except (ValueError, TypeError):
+        raise ValueError("Malformed page token") from None
+    if (token_name, token_direction) != (name, direction) or not isinstance(last, str):
+        raise ValueError("Page token of another request")
+    return last
+
+
+class Traversal(NamedTuple):
+    nodes: List[ProtoLeanNode]
+    depths: List[int]
+    edges: List[ProtoLeanEdge]
+    truncated: bool
+
+
+# Maps a frontier to the neighbors of each of its nodes in a direction, in name
+# order.
+Expand = Callable[[list, str], Awaitable[List[list]]]
+
+
+async def bounded_bfs(
+    start, expand: Expand, direction: str, max_depth: int, max_nodes: int
+) -> Tuple[Dict, bool]:
+    """
+    Level by level breadth-first search from `start` in `direction`. Returns
+    the depth of every visited node, in visiting order, and whether
+    `max_nodes` cut the search short of `max_depth`.
+    """
+    depths = {start: 0}
+    frontier = [start]
+    for depth in range(1, max_depth + 1):
+        if not frontier:
+            break
+        next_frontier = []
+        for neighbors in await expand(frontier, direction):
+            for neighbor in neighbors:
+                if neighbor in depths:
+                    continue
+                if len(depths) >= max_nodes:
+                    return depths, True
+                depths[neighbor] = depth
+                next_frontier.append(neighbor)
+        frontier = next_frontier
+    return depths, False
+
+
+class _Exhausted(Exception):
+    pass
+
+
+async def shortest_paths(
+    source,
+    target,
+    expand: Expand,
+    k: int,
+    max_explored: int,
+) -> Tuple[List[list], bool]:
+    """
+    Up to `k` shortest paths without repeated nodes from `source` to `target`
+    following dependencies.
+
+    The shortest path is found by bidirectional breadth-first search, and the
+    following ones by Yen's algorithm with the same search for every spur path.
+    Paths of equal length come in a deterministic order. At most
+    `max_explored` node expansions are spent over all searches; returns the
+    paths found and whether that limit stopped the search.
+    """
+    remaining = max_explored
+
+    async def search(start, banned_nodes, banned_edges) -> Optional[list]:
+        nonlocal remaining
+        if start == target:
+            return [start]
+        sides = [
+            ({start: None}, {start: 0}, [start]),
+            ({target: None}, {target: 0}, [target]),
+        ]
+        while sides[0][2] and sides[1][2]:
+            # Expand the smaller frontier by one whole level
+            side = 0 if len(sides[0][2]) <= len(sides[1][2]) else 1
+            parents, distances, frontier = sides[side]
+            other = sides[1 - side][1]
+            if len(frontier) > remaining:
+                raise _Exhausted
+            remaining -= len(frontier)
+            direction = "dependency" if side == 0 else "dependent"
+            next_frontier, meet = [], None
+            for node, neighbors in zip(frontier, await expand(frontier, direction)):
+                for neighbor in neighbors:
+                    edge = (node, neighbor) if side == 0 else (neighbor, node)
+                    if (
+                        neighbor in parents
+                        or neighbor in banned_nodes
+                        or edge in banned_edges
+                    ):
+                        continue
+                    parents[neighbor] = node
+                    distances[neighbor] = distances[node] + 1
+                    next_frontier.append(neighbor)
+                    if neighbor in other and (
+                        meet is None or other[neighbor] < other[meet]
+                    ):
+                        meet = neighbor
+            if meet is not None:
+                forward, backward = [], []
+                node = meet
+                while node is not None:
+                    forward.append(node)
+                    node = sides[0][0][node]
+                node = sides[1][0][meet]
+                while node is not None:
+                    backward.append(node)
+                    node = sides[1][0][node]
+                return forward[::-1] + backward
+            sides[side] = (parents, distances, next_frontier)
+        return None
+
+    paths: List[list] = []
+    try:
+        path = await search(source, set(), set())
+        if path is not None:
+            paths.append(path)
+        candidates, seen = [], {tuple(path or ())}
+        while paths and len(paths) < k:
+            previous = paths[-1]
+            for i in range(len(previous) - 1):
+                root = previous[: i + 1]
+                banned_edges = {
+                    (path[i], path[i + 1]) for path in paths if path[: i + 1] == root
+                }
+                spur = await search(previous[i], set(root[:-1]), banned_edges)
+                if spur is None:
+                    continue
+                candidate = root[:-1] + spur
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (len(candidate), candidate))
+            if not candidates:
+                break
+            paths.append(heapq.heappop(candidates)[1])
+    except _Exhausted:
+        return paths, True
+    return paths, False
+
+
+def _type_filter(edge_types: Optional[List[str]]) -> dict:
+    return {"edge_type": {"in": edge_types}} if edge_types else {}
+
+
+def proto_node(row: dict) -> ProtoLeanNode:
+    return ProtoLeanNode(
+        name=row["name"],
+        const_category=row["const_category"],
+        const_type=row["const_type"],
+        module=row["module"],
+        doc_string=row["doc_string"],
+        informal_name=row["informal_name"],
+        informal_statement=row["informal_statement"],
+    )
+
+
+def proto_edge(row: dict) -> ProtoLeanEdge:
+    return ProtoLeanEdge(
+        id=row["id"],
+        source=row["source"],
+        target=row["target"],
+        edge_type=row["edge_type"],
+    )
+
+
+class DbGraph:
+    """
+    Dependency graph queries against the `LeanNode` and `LeanEdge` tables.
+
+    Reachability is answered from the index at `reachability_index_path`, as
+    written by `save_reachability_index` when the graph is uploaded, and
+    reloaded when that file changes. Pairs the index does not cover fall back
+    to a bounded traversal.
+    """
+
+    def __init__(self, db: Prisma, reachability_index_path: Optional[str] = None):
+        self.db = db
+        self.reachability_index_path = reachability_index_path
+        self._reachability_index: Optional[
+            Tuple[tuple, Dict[str, int], ReachabilityIndex]
+        ] = None
+
+    async def neighborhood(
+        self, name: str, direction: str, limit: int, seed: int = 0
+    ) -> Optional[Neighborhood]:
+        """
+        The node `name` with a sample of its outgoing ("dependency") or
+        incoming ("dependent") edges and the nodes at their other ends, in one
+        round trip.
+        """
+        rows = await self.db.query_raw(
+            NEIGHBORHOOD_SQL[direction], name, sample_key(str(seed)), limit
+        )
+        if not rows:
+            return None
+        result = json.loads(rows[0]["neighborhood"])
+        return Neighborhood(
+            node=proto_node(result["node"]),
+            nodes=[proto_node(row) for row in result["nodes"]],
+            edges=[proto_edge(row) for row in result["edges"]],
+            neighbor_count=result["neighbor_count"],
+            edge_count=result["edge_count"],
+        )
+
+    async def neighborhood_page(
+        self, name: str, direction: str, page_size: int, after: str = ""
+    ) -> Optional[NeighborhoodPage]:
+        """The node `name` with its neighbors after `after`, in one round trip."""
+        rows = await self.db.query_raw(
+            NEIGHBORHOOD_PAGE_SQL[direction], name, after, page_size
+        )
+        if not rows:
+            return None
+        result = json.loads(rows[0]["neighborhood"])
+        return NeighborhoodPage(
+            node=proto_node(result["node"]),
+            nodes=[proto_node(row) for row in result["nodes"]],
+            edges=[proto_edge(row) for row in result["edges"]],
+            last=result["last"] if result["more"] else None,
+        )
+
+    def expander(self, edge_types: Optional[List[str]] = None) -> Expand:
+        """
+        Neighbor lookups for `bounded_bfs` and `shortest_paths`, one edge query
+        per frontier. Nodes are only looked up once per direction.
+        """
+        cache: Dict[Tuple[str, str], List[str]] = {}
+
+        async def expand(frontier: List[str], direction: str) -> List[List[str]]:
+            center, neighbor = DIRECTIONS[direction]
+            missing = [node for node in frontier if (direction, node) not in cache]
+            if missing:
+                edges = await self.db.leanedge.find_many(
+                    where={center: {"in": missing}, **_type_filter(edge_types)}
+                )
+                neighbors: Dict[str, set] = {}
+                for edge in edges:
+                    neighbors.setdefault(getattr(edge, center), set()).add(
+                        getattr(edge, neighbor)
+                    )
+                for node in missing:
+                    cache[direction, node] = sorted(neighbors.get(node, ()))
+            return [cache[direction, node] for node in frontier]
+
+        return expand
+
+    async def induced_edges(self, names: List[str], edge_types: Optional[List[str]]):
+        return await self.db.leanedge.find_many(
+            where={
+                "source": {"in": names},
+                "target": {"in": names},
+                **_type_filter(edge_types),
+            }
+        )
+
+    async def traverse(
+        self,
+        name: str,
+        direction: str,
+        max_depth: int,
+        max_nodes: int,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[Traversal]:
+        """
+        Nodes within `max_depth` edges of `name` in `direction`, at most
+        `max_nodes` of them, with the edges between them. One query per level.
+        """
+        if await self.db.leannode.find_first(where={"name": name}) is None:
+            return None
+        depths, truncated = await bounded_bfs(
+            name, self.expander(edge_types), direction, max_depth, max_nodes
+        )
+        visited = list(depths)
+        nodes = {
+            node.name: node
+            for node in await self.db.leannode.find_many(
+                where={"name": {"in": visited}}
+            )
+        }
+        edges = await self.induced_edges(visited, edge_types)
+        order = {name: i for i, name in enumerate(visited)}
+        edges.sort(key=lambda edge: (order[edge.source], edge.target, edge.id))
+        return Traversal(
+            nodes=[
+                proto_node(nodes[name].__dict__) for name in visited if name in nodes
+            ],
+            depths=[depths[name] for name in visited if name in nodes],
+            edges=[proto_edge(edge.__dict__) for edge in edges],
+            truncated=truncated,
+        )
+
+    async def dependency_paths(
+        self,
+        source: str,
+        target: str,
+        k: int,
+        max_explored: int,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[Tuple[List[ProtoDependencyPath], bool]]:
+        """
+        `shortest_paths` from `source` to `target` with their nodes and edges,
+        or None if either is not a node.
+        """
+        for name in (source, target):
+            if await self.db.leannode.find_first(where={"name": name}) is None:
+                return None
+        paths, truncated = await shortest_paths(
+            source, target, self.expander(edge_types), k, max_explored
+        )
+        names = list({name: None for path in paths for name in path})
+        nodes = {
+            node.name: proto_node(node.__dict__)
+            for node in await self.db.leannode.find_many(where={"name": {"in": names}})
+        }
+        edges: Dict[Tuple[str, str], List[ProtoLeanEdge]] = {}
+        for edge in sorted(
+            await self.induced_edges(names, edge_types), key=lambda edge: edge.id
+        ):
+            edges.setdefault((edge.source, edge.target), []).append(
+                proto_edge(edge.__dict__)
+            )
+        return [
+            ProtoDependencyPath(
+                nodes=[nodes.get(name, ProtoLeanNode(name=name)) for name in path],
+                edges=[edge for hop in zip(path, path[1:]) for edge in edges[hop]],
+            )
+            for path in paths
+        ], truncated
+
+    async def reachability(
+        self, pairs: List[Tuple[str, str]], max_explored: int
+    ) -> List[Tuple[bool, bool]]:
+        """
+        Whether the target of each pair is a transitive dependency of its
+        source, and whether `max_explored` expansions were too few to tell.
+        """
+        names = list({name: None for pair in pairs for name in pair})
+        found = {
+            node.name
+            for node in await self.db.leannode.find_many(where={"name": {"in": names}})
+        }
+        indexed = await asyncio.to_thread(self.indexed_reachability, pairs)
+        expand = self.expander()
+        results = []
+        for (source, target), reachable in zip(pairs, indexed):
+            if source not in found or target not in found:
+                results.append((False, False))
+                continue
+            if reachable is not None:
+                results.append((reachable, False))
+                continue
+            paths, truncated = await shortest_paths(
+                source, target, expand, 1, max_explored
+            )
+            results.append((bool(paths), truncated))
+        return results
+
+    def indexed_reachability(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Optional[bool]]:
+        """Answers of the reachability index, None for the pairs it lacks a node of."""
+        if not self.reachability_index_path:
+            return [None] * len(pairs)
+        try:
+            stat = os.stat(self.reachability_index_path)
+        except FileNotFoundError:
+            return [None] * len(pairs)
+        # The file is replaced, not rewritten, when the index is rebuilt
+        version = (stat.st_ino, stat.st_mtime_ns)
+        if self._reachability_index is None or self._reachability_index[0] != version:
+            names, index = ReachabilityIndex.load(self.reachability_index_path)
+            ids = {name: i for i, name in enumerate(names)}
+            self._reachability_index = (version, ids, index)
+        _, ids, index = self._reachability_index
+        return [
+            index.reachable(ids[source], ids[target])
+            if source in ids and target in ids
+            else None
+            for source, target in pairs
+        ]
+
+
+def _run_sync(coro):
+    """Run a coroutine that never suspends, such as a search over a `CsrGraph`."""
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("Coroutine suspended")
+
+
+def _csr(keys: np.ndarray, values: np.ndarray, types: np.ndarray, size: int):
+    """Group `values` and `types` by `keys` into compressed sparse rows."""
+    order = np.lexsort((values, keys))
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=indptr[1:])
+    return indptr, values[order], types[order]
+
+
+class CsrGraph:
+    """
+    The dependency graph held in memory as compressed sparse rows.
+
+    Node names are interned to integer ids in sorted order, and the edges of a
+    node in each direction are one contiguous slice of an int32 neighbor array
+    with a parallel array of uint8 edge types. Node attributes are kept as
+    serialized `LeanNode` messages and only parsed for the nodes returned.
+    Names that only occur in edges get an id but no attributes. A
+    `ReachabilityIndex` over the dependency edges is built along with the
+    adjacency.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        attrs: bytes,
+        attr_offsets: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        types: np.ndarray,
+        edge_types: List[str],
+    ):
+        self.names = names
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self.attrs = attrs
+        self.attr_offsets = attr_offsets
+        self.edge_types = edge_types
+        self.num_edges = len(sources)
+        self.adjacency = {
+            "dependency": _csr(sources, targets, types, len(names)),
+            "dependent": _csr(targets, sources, types, len(names)),
+        }
+        self.sample_keys = np.array(
+            [sample_key(name) for name in names], dtype=np.int64
+        )
+        self.reachability_index = ReachabilityIndex.build(
+            *self.adjacency["dependency"][:2]
+        )
+
+    @classmethod
+    async def load(cls, db: Prisma, page_size: int = 50000) -> "CsrGraph":
+        """Read `LeanNode` and `LeanEdge` page by page, interning names as we go."""
+        ids: Dict[str, int] = {}
+        names: List[str] = []
+        attrs = bytearray()
+        offsets = [0]
+        cursor = ""
+        while True:
+            rows = await db.query_raw(
+                'SELECT * FROM "LeanNode" WHERE "name" > $1 ORDER BY "name" LIMIT $2;',
+                cursor,
+                page_size,
+            )
+            for row in rows:
+                ids[row["name"]] = len(names)
+                names.append(row["name"])
+                attrs += proto_node(row).SerializeToString()
+                offsets.append(len(attrs))
+            if len(rows) < page_size:
+                break
+            cursor = rows[-1]["name"]
+
+        edge_types: Dict[str, int] = {}
+        sources, targets, types = [], [], []
+        cursor = ""
+        while True:
+            rows = await db.query_raw(
+                'SELECT "id", "source", "target", "edge_type" FROM "LeanEdge" '
+                'WHERE "id" > $1 ORDER BY "id" LIMIT $2;',
+                cursor,
+                page_size,
+            )
+            page = np.empty((3, len(rows)), dtype=np.int32)
+            for i, row in enumerate(rows):
+                for j, name in enumerate((row["source"], row["target"])):
+                    if name not in ids:
+                        ids[name] = len(names)
+                        names.append(name)
+                        offsets.append(len(attrs))
+                    page[j, i] = ids[name]
+                page[2, i] = edge_types.setdefault(row["edge_type"], len(edge_types))
+            sources.append(page[0])
+            targets.append(page[1])
+            types.append(page[2])
+            if len(rows) < page_size:
+                break
+            cursor = rows[-1]["id"]
+        if len(edge_types) > 256:
+            raise ValueError(f"Too many edge types: {len(edge_types)}")
+
+        # Renumber so that ids follow name order, including edge-only names
+        order = np.array(
+            sorted(range(len(names)), key=names.__getitem__), dtype=np.int64
+        )
+        rank = np.empty(len(names), dtype=np.int32)
+        rank[order] = np.arange(len(names), dtype=np.int32)
+        offsets = np.array(offsets, dtype=np.int64)
+        lengths = np.diff(offsets)[order]
+        attr_offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=attr_offsets[1:])
+        sorted_attrs = b"".join(attrs[offsets[i] : offsets[i + 1]] for i in order)
+        return cls(
+            [names[i] for i in order],
+            sorted_attrs,
+            attr_offsets,
+            rank[np.concatenate(sources)],
+            rank[np.concatenate(targets)],
+            np.concatenate(types).astype(np.uint8),
+            sorted(edge_types, key=edge_types.get),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [array for csr in self.adjacency.values() for array in csr]
+        return (
+            len(self.attrs)
+            + self.attr_offsets.nbytes
+            + sum(a.nbytes for a in arrays)
+            + self.sample_keys.nbytes
+            + self.reachability_index.nbytes
+        )
+
+    def node(self, i: int) -> Optional[ProtoLeanNode]:
+        start, end = self.attr_offsets[i], self.attr_offsets[i + 1]
+        if start == end:
+            return None
+        return ProtoLeanNode.FromString(self.attrs[start:end])
+
+    def edge(self, source: int, target: int, edge_type: int) -> ProtoLeanEdge:
+        edge_type = self.edge_types[edge_type]
+        source, target = self.names[source], self.names[target]
+        return ProtoLeanEdge(
+            id=f"{edge_type}_{source}->{target}",
+            source=source,
+            target=target,
+            edge_type=edge_type,
+        )
+
+    def neighbors(self, i: int, direction: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Neighbor ids, in name order, and edge types of the edges of node `i`."""
+        indptr, neighbors, types = self.adjacency[direction]
+        return (
+            neighbors[indptr[i] : indptr[i + 1]],
+            types[indptr[i] : indptr[i + 1]],
+        )
+
+    async def neighborhood(
+        self, name: str, direction: str, limit: int, seed: int = 0
+    ) -> Optional[Neighborhood]:
+        i = self.ids.get(name)
+        node = None if i is None else self.node(i)
+        if node is None:
+            return None
+        neighbors, types = self.neighbors(i, direction)
+        edge_count = len(neighbors)
+        # Neighbors are sorted, so the distinct ones start a run
+        distinct = neighbors[np.diff(neighbors, prepend=-1) != 0]
+        distinct = distinct[distinct != i]
+        sample = distinct
+        if len(distinct) > limit:
+            keys = self.sample_keys[distinct] ^ np.int64(sample_key(str(seed)))
+            sample = np.sort(distinct[np.argpartition(keys, limit)[:limit]])
+            kept = np.isin(neighbors, sample) | (neighbors == i)
+            neighbors, types = neighbors[kept], types[kept]
+        neighbors, types = neighbors.tolist(), types.tolist()
+        if direction == "dependency":
+            edges = [self.edge(i, j, t) for j, t in zip(neighbors, types)]
+        else:
+            edges = [self.edge(j, i, t) for j, t in zip(neighbors, types)]
+        nodes = [self.node(j) for j in sample.tolist()]
+        return Neighborhood(
+            node=node,
+            nodes=[node for node in nodes if node is not None],
+            edges=edges,
+            neighbor_count=len(distinct),
+            edge_count=edge_count,
+        )
+
+    async def neighborhood_page(
+        self, name: str, direction: str, page_size: int, after: str = ""
+    ) -> Optional[NeighborhoodPage]:
+        i = self.ids.get(name)
+        node = None if i is None else self.node(i)
+        if node is None:
+            return None
+        neighbors, types = self.neighbors(i, direction)
+        start = np.searchsorted(neighbors, bisect.bisect_right(self.names, after))
+        # Grow a window of edges until it holds one neighbor more than the
+        # page; with one edge per type and pair, the first window does
+        size = (page_size + 2) * max(len(self.edge_types), 1)
+        while True:
+            window = neighbors[start : start + size]
+            distinct = window[np.diff(window, prepend=-1) != 0]
+            distinct = distinct[distinct != i]
+            if len(distinct) > page_size or start + size >= len(neighbors):
+                break
+            size *= 2
+        page = distinct[:page_size]
+        kept = start + np.flatnonzero(np.isin(window, page))
+        if not after:
+            loops = np.arange(*np.searchsorted(neighbors, [i, i + 1]))
+            kept = np.sort(np.concatenate([kept, loops]))
+        neighbors, types = neighbors[kept].tolist(), types[kept].tolist()
+        if direction == "dependency":
+            edges = [self.edge(i, j, t) for j, t in zip(neighbors, types)]
+        else:
+            edges = [self.edge(j, i, t) for j, t in zip(neighbors, types)]
+        nodes = [self.node(j) for j in page.tolist()]
+        return NeighborhoodPage(
+            node=node,
+            nodes=[node for node in nodes if node is not None],
+            edges=edges,
+            last=self.names[page[-1]] if len(distinct) > page_size else None,
+        )
+
+    def type_mask(self, edge_types: Optional[List[str]]) -> Optional[np.ndarray]:
+        """Lookup table from edge type code to whether it is in `edge_types`."""
+        if not edge_types:
+            return None
+        mask = np.zeros(256, dtype=bool)
+        mask[[i for i, t in enumerate(self.edge_types) if t in set(edge_types)]] = True
+        return mask
+
+    def expander(self, edge_types: Optional[List[str]] = None) -> Expand:
+        mask = self.type_mask(edge_types)
+
+        async def expand(frontier: List[int], direction: str) -> List[List[int]]:
+            result = []
+            for j in frontier:
+                neighbors, types = self.neighbors(j, direction)
+                if mask is not None:
+                    neighbors = neighbors[mask[types]]
+                result.append(list(dict.fromkeys(neighbors.tolist())))
+            return result
+
+        return expand
+
+    async def traverse(
+        self,
+        name: str,
+        direction: str,
+        max_depth: int,
+        max_nodes: int,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[Traversal]:
+        # Large traversals take a while, so keep them off the event loop
+        return await asyncio.to_thread(
+            self._traverse, name, direction, max_depth, max_nodes, edge_types
+        )
+
+    def _traverse(
+        self,
+        name: str,
+        direction: str,
+        max_depth: int,
+        max_nodes: int,
+        edge_types: Optional[List[str]],
+    ) -> Optional[Traversal]:
+        i = self.ids.get(name)
+        if i is None or self.node(i) is None:
+            return None
+        mask = self.type_mask(edge_types)
+        depths, truncated = _run_sync(
+            bounded_bfs(i, self.expander(edge_types), direction, max_depth, max_nodes)
+        )
+        nodes, node_depths, edges = [], [], []
+        for j, depth in depths.items():
+            node = self.node(j)
+            if node is not None:
+                nodes.append(node)
+                node_depths.append(depth)
+            neighbors, types = self.neighbors(j, "dependency")
+            for k, t in zip(neighbors.tolist(), types.tolist()):
+                if k in depths and (mask is None or mask[t]):
+                    edges.append(self.edge(j, k, t))
+        return Traversal(
+            nodes=nodes, depths=node_depths, edges=edges, truncated=truncated
+        )
+
+    async def dependency_paths(
+        self,
+        source: str,
+        target: str,
+        k: int,
+        max_explored: int,
+        edge_types: Optional[List[str]] = None,
+    ) -> Optional[Tuple[List[ProtoDependencyPath], bool]]:
+        # Path searches take a while, so keep them off the event loop
+        return await asyncio.to_thread(
+            self._dependency_paths, source, target, k, max_explored, edge_types
+        )
+
+    def _dependency_paths(
+        self,
+        source: str,
+        target: str,
+        k: int,
+        max_explored: int,
+        edge_types: Optional[List[str]],
+    ) -> Optional[Tuple[List[ProtoDependencyPath], bool]]:
+        ends = [self.ids.get(name) for name in (source, target)]
+        if any(i is None or self.node(i) is None for i in ends):
+            return None
+        mask = self.type_mask(edge_types)
+        paths, truncated = _run_sync(
+            shortest_paths(*ends, self.expander(edge_types), k, max_explored)
+        )
+        result = []
+        for path in paths:
+            edges = []
+            for i, j in zip(path, path[1:]):
+                neighbors, types = self.neighbors(i, "dependency")
+                start, end = np.searchsorted(neighbors, [j, j + 1])
+                edges += [
+                    self.edge(i, j, t)
+                    for t in types[start:end].tolist()
+                    if mask is None or mask[t]
+                ]
+            nodes = [self.node(i) for i in path]
+            result.append(
+                ProtoDependencyPath(
+                    nodes=[
+                        ProtoLeanNode(name=self.names[i]) if node is None else node
+                        for i, node in zip(path, nodes)
+                    ],
+                    edges=edges,
+                )
+            )
+        return result, truncated
+
+    async def reachability(
+        self, pairs: List[Tuple[str, str]], max_explored: int
+    ) -> List[Tuple[bool, bool]]:
+        def check(source: str, target: str) -> Tuple[bool, bool]:
+            i, j = self.ids.get(source), self.ids.get(target)
+            if i is None or j is None or self.node(i) is None or self.node(j) is None:
+                return False, False
+            return self.reachability_index.reachable(i, j), False
+
+        # Large batches take a while, so keep them off the event loop
+        return await asyncio.to_thread(lambda: [check(*pair) for pair in pairs])
+
+
+async def save_reachability_index(db: Prisma, path: str):
+    """Build the reachability index of the graph in `db` and write it to `path`."""
+    graph = await CsrGraph.load(db)
+    graph.reachability_index.save(path, graph.names)
@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
+
+import numpy as np
+
+# Per-process state of a model worker, set up by `_init_worker`.
+_model = None
+_ready = None
+
+
+def _init_worker(model_name_or_path, model_kwargs, cpu_sets, num_threads, ready):
+    global _model, _ready
+    cpus = cpu_sets.get()
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    # Thread pools are sized when torch is first imported, so the worker must
+    # configure them before `flag_model` pulls torch in.
+    os.environ["OMP_NUM_THREADS"] = str(num_threads)
+    os.environ["MKL_NUM_THREADS"] = str(num_threads)
+    import torch
+    from .flag_model import FlagModel
+
+    torch.set_num_threads(num_threads)
+    _model = FlagModel(model_name_or_path, **model_kwargs)
+    _ready = ready
+
+
+def _wait_ready(timeout):
+    _ready.wait(timeout)
+    return os.getpid()
+
+
+def _encode_queries(queries, batch_size, max_length):
+    return _model.encode_queries(queries, batch_size=batch_size, max_length=max_length)
+
+
+def available_cpus() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+class ModelPool:
+    """
+    A pool of worker processes that each hold a loaded `FlagModel`.
+
+    Inference is synchronous torch code, so it runs in the workers and the
+    event loop only awaits the results. With `pin_cores`, the available CPUs
+    are split into contiguous, disjoint sets and every worker is pinned to one
+    of them, so workers do not fight over cores.
+    """
+
+    def __init__(
+        self,
+        model_name_or_path: str,
+        num_workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        pin_cores: bool = True,
+        **model_kwargs,
+    ):
+        cpus = available_cpus()
+        self.num_workers = max(num_workers, 1)
+        self.threads_per_worker = threads_per_worker or max(
+            len(cpus) // self.num_workers, 1
+        )
+
+        ctx = multiprocessing.get_context("spawn")
+        cpu_sets = ctx.Queue()
+        for i in range(self.num_workers):
+            if pin_cores and len(cpus) >= self.num_workers:
+                start = i * len(cpus) // self.num_workers
+                end = (i + 1) * len(cpus) // self.num_workers
+                cpu_sets.put(cpus[start:end])
+            else:
+                cpu_sets.put(None)
+        self._ready = ctx.Barrier(self.num_workers)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(
+                model_name_or_path,
+                model_kwargs,
+                cpu_sets,
+                self.threads_per_worker,
+                self._ready,
+            ),
+        )
+
+    async def start(self, timeout: float = 600):
+        """Spawn every worker and wait until all of them have loaded the model."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(self.executor, _wait_ready, timeout)
+                for _ in range(self.num_workers)
+            ]
+        )
+
+    async def encode_queries(
+        self,
+        queries: Union[List[str], str],
+        batch_size: int = 256,
+        max_length: int = 512,
+    ) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _encode_queries, queries, batch_size, max_length
+        )
+
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,286 @@
+import os
+from typing import List, Tuple
+
+import numpy as np
+
+# Arrays of a `ReachabilityIndex`, in constructor order.
+_FIELDS = (
+    "component",
+    "indptr",
+    "children",
+    "heights",
+    "ranks",
+    "lows",
+    "reaches",
+    "reached_by",
+)
+
+
+def strongly_connected_components(
+    indptr: np.ndarray, neighbors: np.ndarray
+) -> Tuple[np.ndarray, int]:
+    """
+    Tarjan's algorithm without recursion over a graph in compressed sparse
+    rows. Components are numbered in reverse topological order, so every edge
+    between two components points to the lower number.
+    """
+    n = len(indptr) - 1
+    indptr, neighbors = indptr.tolist(), neighbors.tolist()
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    component = [0] * n
+    stack = []
+    counter = count = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, indptr[root])]
+        while work:
+            v, i = work[-1]
+            end = indptr[v + 1]
+            while i < end:
+                w = neighbors[i]
+                i += 1
+                if index[w] == -1:
+                    work[-1] = (v, i)
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, indptr[w]))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work and low[v] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+    return np.array(component, dtype=np.int32), count
+
+
+def _post_order(indptr: np.ndarray, children: np.ndarray, roots: np.ndarray):
+    """Depth-first post-order number of every node, starting from `roots`."""
+    indptr, children = indptr.tolist(), children.tolist()
+    rank = [-1] * (len(indptr) - 1)
+    counter = 0
+    for root in roots.tolist():
+        if rank[root] != -1:
+            continue
+        # Mark on entry so that shared descendants are only entered once
+        rank[root] = -2
+        work = [(root, indptr[root])]
+        while work:
+            v, i = work[-1]
+            end = indptr[v + 1]
+            while i < end:
+                w = children[i]
+                i += 1
+                if rank[w] == -1:
+                    rank[w] = -2
+                    work[-1] = (v, i)
+                    work.append((w, indptr[w]))
+                    break
+            else:
+                work.pop()
+                rank[v] = counter
+                counter += 1
+    return np.array(rank, dtype=np.int32)
+
+
+class ReachabilityIndex:
+    """
+    Answers whether one node reaches another without traversing the graph
+    for most pairs.
+
+    Strongly connected components are collapsed into a DAG. Every component
+    gets a height, the length of its longest outgoing path, and `num_labels`
+    GRAIL intervals: its post-order number in a randomized depth-first search
+    and the lowest such number reachable from it. A component can only
+    reach components that are lower and whose intervals nest in its own.
+
+    The `num_landmarks` components with the most paths through them, as
+    estimated from their degrees, are landmarks. A bit mask per component
+    records which landmarks it reaches and another which landmarks reach it,
+    so a pair sharing a landmark is reachable. Pairs that none of these tests
+    settle are settled by a breadth-first search that only enters components
+    that pass the negative tests, and stops at the first one sharing a
+    landmark with the target.
+    """
+
+    def __init__(
+        self,
+        component: np.ndarray,
+        indptr: np.ndarray,
+        children: np.ndarray,
+        heights: np.ndarray,
+        ranks: np.ndarray,
+        lows: np.ndarray,
+        reaches: np.ndarray,
+        reached_by: np.ndarray,
+    ):
+        self.component = component
+        self.indptr = indptr
+        self.children = children
+        self.heights = heights
+        self.ranks = ranks
+        self.lows = lows
+        self.reaches = reaches
+        self.reached_by = reached_by
+
+    @classmethod
+    def build(
+        cls,
+        indptr: np.ndarray,
+        neighbors: np.ndarray,
+        num_labels: int = 3,
+        num_landmarks: int = 256,
+        seed: int = 0,
+    ) -> "ReachabilityIndex":
+        component, count = strongly_connected_components(indptr, neighbors)
+
+        # Edges between components, grouped by their source component
+        sources = component[np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))]
+        targets = component[neighbors]
+        keys = np.unique(
+            sources[sources != targets].astype(np.int64) * count
+            + targets[sources != targets]
+        )
+        dag_indptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // count, minlength=count), out=dag_indptr[1:])
+        children = (keys % count).astype(np.int32)
+
+        # Children have lower component numbers, so they are done first
+        heights = [0] * count
+        ptr, child_list = dag_indptr.tolist(), children.tolist()
+        for c in range(count):
+            if ptr[c] < ptr[c + 1]:
+                heights[c] = 1 + max(
+                    heights[j] for j in child_list[ptr[c] : ptr[c + 1]]
+                )
+        heights = np.array(heights, dtype=np.int32)
+
+        rng = np.random.default_rng(seed)
+        parents = np.repeat(np.arange(count), np.diff(dag_indptr))
+        ranks = np.empty((count, num_labels), dtype=np.int32)
+        for label in range(num_labels):
+            shuffled = children[np.lexsort((rng.random(len(children)), parents))]
+            ranks[:, label] = _post_order(dag_indptr, shuffled, rng.permutation(count))
+        lows = ranks.copy()
+
+        degrees = np.diff(dag_indptr) + 1
+        landmarks = np.argsort(
+            -degrees * (np.bincount(children, minlength=count) + 1), kind="stable"
+        )[:num_landmarks]
+        bits = np.arange(len(landmarks))
+        reaches = np.zeros((count, -(-num_landmarks // 64)), dtype=np.uint64)
+        reaches[landmarks, bits // 64] = np.uint64(1) << (bits % 64).astype(np.uint64)
+        reached_by = reaches.copy()
+
+        # Components one height at a time, with the positions in `children`
+        # of their edges
+        by_height = np.argsort(heights, kind="stable")
+        levels = np.searchsorted(
+            heights[by_height], np.arange(heights.max(initial=0) + 2)
+        )
+        level_edges = []
+        for height in range(1, len(levels) - 1):
+            nodes = by_height[levels[height] : levels[height + 1]]
+            starts, ends = dag_indptr[nodes], dag_indptr[nodes + 1]
+            offsets = np.zeros(len(nodes), dtype=np.int64)
+            np.cumsum((ends - starts)[:-1], out=offsets[1:])
+            edges = np.repeat(starts - offsets, ends - starts) + np.arange(
+                ends[-1] - starts[-1] + offsets[-1]
+            )
+            level_edges.append((nodes, ends - starts, offsets, edges))
+            # Lowest reachable rank and landmarks reached, from the children
+            lows[nodes] = np.minimum(
+                lows[nodes], np.minimum.reduceat(lows[children[edges]], offsets, axis=0)
+            )
+            reaches[nodes] |= np.bitwise_or.reduceat(
+                reaches[children[edges]], offsets, axis=0
+            )
+        # Landmarks reaching a component, from its parents, top down
+        for nodes, degrees, _, edges in reversed(level_edges):
+            np.bitwise_or.at(
+                reached_by,
+                children[edges],
+                np.repeat(reached_by[nodes], degrees, axis=0),
+            )
+        return cls(
+            component, dag_indptr, children, heights, ranks, lows, reaches, reached_by
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, field).nbytes for field in _FIELDS)
+
+    def save(self, path: str, names: List[str]):
+        """
+        Write the index with the names of its nodes, in id order, to `path`.
+        The file is replaced atomically, so readers never see a partial index.
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                names=np.frombuffer("\0".join(names).encode(), dtype=np.uint8),
+                **{field: getattr(self, field) for field in _FIELDS},
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> Tuple[List[str], "ReachabilityIndex"]:
+        """The node names and index written by `save`."""
+        with np.load(path) as data:
+            index = cls(*(data[field] for field in _FIELDS))
+            names = data["names"].tobytes().decode().split("\0")
+        return names if len(index.component) else [], index
+
+    def reachable(self, source: int, target: int) -> bool:
+        """Whether there is a path from node `source` to node `target`."""
+        c, goal = self.component[source], self.component[target]
+        if c == goal:
+            return True
+        height, rank, low = self.heights[goal], self.ranks[goal], self.lows[goal]
+        if (
+            self.heights[c] <= height
+            or (self.ranks[c] < rank).any()
+            or (self.lows[c] > low).any()
+        ):
+            return False
+        landmarks = self.reached_by[goal]
+        if (self.reaches[c] & landmarks).any():
+            return True
+        # Level by level over the components that pass the negative tests
+        seen = np.zeros(len(self.heights), dtype=bool)
+        frontier = np.array([c])
+        while len(frontier):
+            starts, ends = self.indptr[frontier], self.indptr[frontier + 1]
+            offsets = np.cumsum(ends - starts) - (ends - starts)
+            children = self.children[
+                np.repeat(starts - offsets, ends - starts)
+                + np.arange((ends - starts).sum())
+            ]
+            if (children == goal).any() or (self.reaches[children] & landmarks).any():
+                return True
+            children = children[
+                (self.heights[children] > height)
+                & (self.ranks[children] >= rank).all(axis=1)
+                & (self.lows[children] <= low).all(axis=1)
+            ]
+            frontier = np.unique(children[~seen[children]])
+            seen[frontier] = True
+        return False
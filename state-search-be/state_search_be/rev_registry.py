@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from prisma import Prisma
+from prisma.errors import PrismaError
+
+
+async def register_rev(db: Prisma, rev: str, **fields):
+    """
+    Create or update the registry row of `rev`. The theorem count is always
+    refreshed; `fields` sets any other column, such as `embedding_model`.
+    """
+    data = {
+        "theorem_count": await db.theorem.count(where={"rev": rev}),
+        **fields,
+    }
+    await db.rev.upsert(
+        where={"rev": rev},
+        data={"create": {"rev": rev, **data}, "update": data},
+    )
+
+
+class RevRegistry:
+    """
+    In-memory copy of the `Rev` table.
+
+    `revs` answers from memory and refreshes the copy in the background once it
+    is `ttl` seconds old. Revs whose row changed since the last refresh, which
+    is what an upload or rebuild does, are passed to `on_change`.
+
+    The first refresh registers the revs of the theorem table that have no row
+    yet, such as those uploaded before the table existed. Until that succeeds,
+    every refresh also reads the revs of the theorem table.
+    """
+
+    def __init__(
+        self,
+        db: Prisma,
+        ttl: float = 30,
+        on_change: Optional[Callable[[str], None]] = None,
+    ):
+        self.db = db
+        self.ttl = ttl
+        self.on_change = on_change
+        self.info: Dict[str, object] = {}
+        self._revs: Optional[List[str]] = None
+        self._loaded_at = 0.0
+        self._refreshing: Optional[asyncio.Future] = None
+        self._backfilled = False
+
+    async def revs(self) -> List[str]:
+        if self._revs is None:
+            await self.refresh()
+        elif time.monotonic() - self._loaded_at >= self.ttl and (
+            self._refreshing is None or self._refreshing.done()
+        ):
+            self._refreshing = asyncio.ensure_future(self.refresh())
+        return self._revs
+
+    async def refresh(self):
+        self._loaded_at = time.monotonic()
+        try:
+            if not self._backfilled:
+                await self.backfill()
+            rows = await self.db.rev.find_many(order={"rev": "asc"})
+            info = {row.rev: row for row in rows}
+            if not self._backfilled:
+                results = await self.db.query_raw(
+                    'SELECT DISTINCT "rev" FROM "Theorem" ORDER BY "rev";'
+                )
+                for result in results:
+                    info.setdefault(result["rev"], None)
+                info = dict(sorted(info.items()))
+        except PrismaError:
+            logging.exception("Failed to refresh the rev registry")
+            if self._revs is None:
+                self._revs = []
+            return
+        if self.on_change is not None and self._revs is not None:
+            for rev in set(self.info) | set(info):
+                old, new = self.info.get(rev), info.get(rev)
+                if rev not in info or (
+                    old is not None and new is not None and old.updateAt != new.updateAt
+                ):
+                    self.on_change(rev)
+        self.info = info
+        self._revs = list(info)
+
+    async def backfill(self):
+        """Register the revs of the theorem table that have no row."""
+        results = await self.db.query_raw('SELECT DISTINCT "rev" FROM "Theorem";')
+        registered = {row.rev for row in await self.db.rev.find_many()}
+        try:
+            for result in results:
+                if result["rev"] not in registered:
+                    await register_rev(self.db, result["rev"])
+                    logging.info("Registered rev %s", result["rev"])
+        except PrismaError:
+            logging.exception("Failed to register the revs of the theorem table")
+            return
+        self._backfilled = True
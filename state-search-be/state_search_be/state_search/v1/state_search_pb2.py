@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"state_search/v1/state_search.proto\x12\x0fstate_search.v1\"\x8c\x01\n\x07Theorem\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x12\n\x04\x63ode\x18\x03 \x01(\tR\x04\x63ode\x12\x10\n\x03rev\x18\x04 \x01(\tR\x03rev\x12\x16\n\x06module\x18\x05 \x01(\tR\x06module\x12\x1f\n\x0b\x66ormal_type\x18\x06 \x01(\tR\nformalType\"\x12\n\x10GetAllRevRequest\"\'\n\x11GetAllRevResponse\x12\x12\n\x04revs\x18\x01 \x03(\tR\x04revs\"X\n\x14SearchTheoremRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x18\n\x07nresult\x18\x02 \x01(\x05R\x07nresult\x12\x10\n\x03rev\x18\x03 \x01(\tR\x03rev\"K\n\x15SearchTheoremResponse\x12\x32\n\x07results\x18\x01 \x03(\x0b\x32\x18.state_search.v1.TheoremR\x07results\"\x8e\x01\n\x0f\x46\x65\x65\x64\x62\x61\x63kRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x1d\n\ntheorem_id\x18\x02 \x01(\tR\ttheoremId\x12\x1a\n\x08relevant\x18\x03 \x01(\x08R\x08relevant\x12\x16\n\x06update\x18\x04 \x01(\x08R\x06update\x12\x12\n\x04rank\x18\x05 \x01(\x05R\x04rank\"\x12\n\x10\x46\x65\x65\x64\x62\x61\x63kResponse\"W\n\x0c\x43lickRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x1d\n\ntheorem_id\x18\x02 \x01(\tR\ttheoremId\x12\x12\n\x04rank\x18\x03 \x01(\x05R\x04rank\"\x0f\n\rClickResponse\"@\n\x0b\x43\x61llRequest\x12\x1b\n\tcall_type\x18\x01 \x01(\x05R\x08\x63\x61llType\x12\x14\n\x05query\x18\x02 \x01(\tR\x05query\"\x0e\n\x0c\x43\x61llResponse\"\xef\x01\n\x08LeanNode\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12%\n\x0e\x63onst_category\x18\x02 \x01(\tR\rconstCategory\x12\x1d\n\nconst_type\x18\x03 \x01(\tR\tconstType\x12\x16\n\x06module\x18\x04 \x01(\tR\x06module\x12\x1d\n\ndoc_string\x18\x05 \x01(\tR\tdocString\x12#\n\rinformal_name\x18\x06 \x01(\tR\x0cinformalName\x12-\n\x12informal_statement\x18\x07 \x01(\tR\x11informalStatement\"g\n\x08LeanEdge\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x16\n\x06source\x18\x02 \x01(\tR\x06source\x12\x16\n\x06target\x18\x03 \x01(\tR\x06target\x12\x1b\n\tedge_type\x18\x04 \x01(\tR\x08\x65\x64geType\"7\n!GetDependencyNodesAndEdgesRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\"\xca\x01\n\"GetDependencyNodesAndEdgesResponse\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32\x19.state_search.v1.LeanNodeR\x05nodes\x12/\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x19.state_search.v1.LeanEdgeR\x05\x65\x64ges\x12\x42\n\rsampling_info\x18\x03 \x01(\x0b\x32\x1d.state_search.v1.SamplingInfoR\x0csamplingInfo\"6\n GetDependentNodesAndEdgesRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\"\xc9\x01\n!GetDependentNodesAndEdgesResponse\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32\x19.state_search.v1.LeanNodeR\x05nodes\x12/\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x19.state_search.v1.LeanEdgeR\x05\x65\x64ges\x12\x42\n\rsampling_info\x18\x03 \x01(\x0b\x32\x1d.state_search.v1.SamplingInfoR\x0csamplingInfo\"\x8d\x01\n\x0cSamplingInfo\x12\x1f\n\x0bwas_sampled\x18\x01 \x01(\x08R\nwasSampled\x12.\n\x13original_node_count\x18\x02 \x01(\x05R\x11originalNodeCount\x12,\n\x12sampled_node_count\x18\x03 \x01(\x05R\x10sampledNodeCount\"Z\n\x19GetNodeSuggestionsRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\'\n\x0fmax_suggestions\x18\x02 \x01(\x05R\x0emaxSuggestions\">\n\x1aGetNodeSuggestionsResponse\x12 \n\x0bsuggestions\x18\x01 \x03(\tR\x0bsuggestions2\xaa\x03\n\x16LeanStateSearchService\x12R\n\tGetAllRev\x12!.state_search.v1.GetAllRevRequest\x1a\".state_search.v1.GetAllRevResponse\x12^\n\rSearchTheorem\x12%.state_search.v1.SearchTheoremRequest\x1a&.state_search.v1.SearchTheoremResponse\x12O\n\x08\x46\x65\x65\x64\x62\x61\x63k\x12 .state_search.v1.FeedbackRequest\x1a!.state_search.v1.FeedbackResponse\x12\x46\n\x05\x43lick\x12\x1d.state_search.v1.ClickRequest\x1a\x1e.state_search.v1.ClickResponse\x12\x43\n\x04\x43\x61ll\x12\x1c.state_search.v1.CallRequest\x1a\x1d.state_search.v1.CallResponse2\x8e\x03\n\x10LeanGraphService\x12\x85\x01\n\x1aGetDependencyNodesAndEdges\x12\x32.state_search.v1.GetDependencyNodesAndEdgesRequest\x1a\x33.state_search.v1.GetDependencyNodesAndEdgesResponse\x12\x82\x01\n\x19GetDependentNodesAndEdges\x12\x31.state_search.v1.GetDependentNodesAndEdgesRequest\x1a\x32.state_search.v1.GetDependentNodesAndEdgesResponse\x12m\n\x12GetNodeSuggestions\x12*.state_search.v1.GetNodeSuggestionsRequest\x1a+.state_search.v1.GetNodeSuggestionsResponseB\x80\x01\n\x13\x63om.state_search.v1B\x10StateSearchProtoP\x01\xa2\x02\x03SXX\xaa\x02\x0eStateSearch.V1\xca\x02\x0eStateSearch\\V1\xe2\x02\x1aStateSearch\\V1\\GPBMetadata\xea\x02\x0fStateSearch::V1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"state_search/v1/state_search.proto\x12\x0fstate_search.v1\"\x8c\x01\n\x07Theorem\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x12\n\x04\x63ode\x18\x03 \x01(\tR\x04\x63ode\x12\x10\n\x03rev\x18\x04 \x01(\tR\x03rev\x12\x16\n\x06module\x18\x05 \x01(\tR\x06module\x12\x1f\n\x0b\x66ormal_type\x18\x06 \x01(\tR\nformalType\"\x12\n\x10GetAllRevRequest\"\'\n\x11GetAllRevResponse\x12\x12\n\x04revs\x18\x01 \x03(\tR\x04revs\"X\n\x14SearchTheoremRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x18\n\x07nresult\x18\x02 \x01(\x05R\x07nresult\x12\x10\n\x03rev\x18\x03 \x01(\tR\x03rev\"K\n\x15SearchTheoremResponse\x12\x32\n\x07results\x18\x01 \x03(\x0b\x32\x18.state_search.v1.TheoremR\x07results\"^\n\x1aSearchTheoremStreamRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x18\n\x07nresult\x18\x02 \x01(\x05R\x07nresult\x12\x10\n\x03rev\x18\x03 \x01(\tR\x03rev\"Q\n\x1bSearchTheoremStreamResponse\x12\x32\n\x07results\x18\x01 \x03(\x0b\x32\x18.state_search.v1.TheoremR\x07results\"a\n\x19\x42\x61tchSearchTheoremRequest\x12\x18\n\x07queries\x18\x01 \x03(\tR\x07queries\x12\x18\n\x07nresult\x18\x02 \x01(\x05R\x07nresult\x12\x10\n\x03rev\x18\x03 \x01(\tR\x03rev\"^\n\x1a\x42\x61tchSearchTheoremResponse\x12@\n\x07results\x18\x01 \x03(\x0b\x32&.state_search.v1.SearchTheoremResponseR\x07results\"x\n\x1cMultiRevSearchTheoremRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x18\n\x07nresult\x18\x02 \x01(\x05R\x07nresult\x12\x12\n\x04revs\x18\x03 \x03(\tR\x04revs\x12\x14\n\x05merge\x18\x04 \x01(\x08R\x05merge\"m\n\rScoredTheorem\x12\x32\n\x07theorem\x18\x01 \x01(\x0b\x32\x18.state_search.v1.TheoremR\x07theorem\x12\x14\n\x05score\x18\x02 \x01(\x02R\x05score\x12\x12\n\x04revs\x18\x03 \x03(\tR\x04revs\"]\n\x0fRevSearchResult\x12\x10\n\x03rev\x18\x01 \x01(\tR\x03rev\x12\x38\n\x07results\x18\x02 \x03(\x0b\x32\x1e.state_search.v1.ScoredTheoremR\x07results\"\x8d\x01\n\x1dMultiRevSearchTheoremResponse\x12\x34\n\x04revs\x18\x01 \x03(\x0b\x32 .state_search.v1.RevSearchResultR\x04revs\x12\x36\n\x06merged\x18\x02 \x03(\x0b\x32\x1e.state_search.v1.ScoredTheoremR\x06merged\"\x8e\x01\n\x0f\x46\x65\x65\x64\x62\x61\x63kRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x1d\n\ntheorem_id\x18\x02 \x01(\tR\ttheoremId\x12\x1a\n\x08relevant\x18\x03 \x01(\x08R\x08relevant\x12\x16\n\x06update\x18\x04 \x01(\x08R\x06update\x12\x12\n\x04rank\x18\x05 \x01(\x05R\x04rank\"\x12\n\x10\x46\x65\x65\x64\x62\x61\x63kResponse\"W\n\x0c\x43lickRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\x1d\n\ntheorem_id\x18\x02 \x01(\tR\ttheoremId\x12\x12\n\x04rank\x18\x03 \x01(\x05R\x04rank\"\x0f\n\rClickResponse\"@\n\x0b\x43\x61llRequest\x12\x1b\n\tcall_type\x18\x01 \x01(\x05R\x08\x63\x61llType\x12\x14\n\x05query\x18\x02 \x01(\tR\x05query\"\x0e\n\x0c\x43\x61llResponse\"\xef\x01\n\x08LeanNode\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12%\n\x0e\x63onst_category\x18\x02 \x01(\tR\rconstCategory\x12\x1d\n\nconst_type\x18\x03 \x01(\tR\tconstType\x12\x16\n\x06module\x18\x04 \x01(\tR\x06module\x12\x1d\n\ndoc_string\x18\x05 \x01(\tR\tdocString\x12#\n\rinformal_name\x18\x06 \x01(\tR\x0cinformalName\x12-\n\x12informal_statement\x18\x07 \x01(\tR\x11informalStatement\"g\n\x08LeanEdge\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x16\n\x06source\x18\x02 \x01(\tR\x06source\x12\x16\n\x06target\x18\x03 \x01(\tR\x06target\x12\x1b\n\tedge_type\x18\x04 \x01(\tR\x08\x65\x64geType\"\x94\x01\n!GetDependencyNodesAndEdgesRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1f\n\x0bsample_seed\x18\x02 \x01(\x05R\nsampleSeed\x12\x1b\n\tpage_size\x18\x03 \x01(\x05R\x08pageSize\x12\x1d\n\npage_token\x18\x04 \x01(\tR\tpageToken\"\xf2\x01\n\"GetDependencyNodesAndEdgesResponse\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32\x19.state_search.v1.LeanNodeR\x05nodes\x12/\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x19.state_search.v1.LeanEdgeR\x05\x65\x64ges\x12\x42\n\rsampling_info\x18\x03 \x01(\x0b\x32\x1d.state_search.v1.SamplingInfoR\x0csamplingInfo\x12&\n\x0fnext_page_token\x18\x04 \x01(\tR\rnextPageToken\"\x93\x01\n GetDependentNodesAndEdgesRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1f\n\x0bsample_seed\x18\x02 \x01(\x05R\nsampleSeed\x12\x1b\n\tpage_size\x18\x03 \x01(\x05R\x08pageSize\x12\x1d\n\npage_token\x18\x04 \x01(\tR\tpageToken\"\xf1\x01\n!GetDependentNodesAndEdgesResponse\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32\x19.state_search.v1.LeanNodeR\x05nodes\x12/\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x19.state_search.v1.LeanEdgeR\x05\x65\x64ges\x12\x42\n\rsampling_info\x18\x03 \x01(\x0b\x32\x1d.state_search.v1.SamplingInfoR\x0csamplingInfo\x12&\n\x0fnext_page_token\x18\x04 \x01(\tR\rnextPageToken\"\xbd\x01\n\x0cSamplingInfo\x12\x1f\n\x0bwas_sampled\x18\x01 \x01(\x08R\nwasSampled\x12.\n\x13original_node_count\x18\x02 \x01(\x05R\x11originalNodeCount\x12,\n\x12sampled_node_count\x18\x03 \x01(\x05R\x10sampledNodeCount\x12.\n\x13original_edge_count\x18\x04 \x01(\x05R\x11originalEdgeCount\"Z\n\x19GetNodeSuggestionsRequest\x12\x14\n\x05query\x18\x01 \x01(\tR\x05query\x12\'\n\x0fmax_suggestions\x18\x02 \x01(\x05R\x0emaxSuggestions\">\n\x1aGetNodeSuggestionsResponse\x12 \n\x0bsuggestions\x18\x01 \x03(\tR\x0bsuggestions\"\xc6\x01\n\x14TraverseGraphRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x41\n\tdirection\x18\x02 \x01(\x0e\x32#.state_search.v1.TraversalDirectionR\tdirection\x12\x1b\n\tmax_depth\x18\x03 \x01(\x05R\x08maxDepth\x12\x1b\n\tmax_nodes\x18\x04 \x01(\x05R\x08maxNodes\x12\x1d\n\nedge_types\x18\x05 \x03(\tR\tedgeTypes\"\xaf\x01\n\x15TraverseGraphResponse\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32\x19.state_search.v1.LeanNodeR\x05nodes\x12/\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x19.state_search.v1.LeanEdgeR\x05\x65\x64ges\x12\x16\n\x06\x64\x65pths\x18\x03 \x03(\x05R\x06\x64\x65pths\x12\x1c\n\ttruncated\x18\x04 \x01(\x08R\ttruncated\"y\n\x1a\x46indDependencyPathsRequest\x12\x16\n\x06source\x18\x01 \x01(\tR\x06source\x12\x16\n\x06target\x18\x02 \x01(\tR\x06target\x12\x0c\n\x01k\x18\x03 \x01(\x05R\x01k\x12\x1d\n\nedge_types\x18\x04 \x03(\tR\tedgeTypes\"r\n\x0e\x44\x65pendencyPath\x12/\n\x05nodes\x18\x01 \x03(\x0b\x32\x19.state_search.v1.LeanNodeR\x05nodes\x12/\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x19.state_search.v1.LeanEdgeR\x05\x65\x64ges\"r\n\x1b\x46indDependencyPathsResponse\x12\x35\n\x05paths\x18\x01 \x03(\x0b\x32\x1f.state_search.v1.DependencyPathR\x05paths\x12\x1c\n\ttruncated\x18\x02 \x01(\x08R\ttruncated\"C\n\x11ReachabilityQuery\x12\x16\n\x06source\x18\x01 \x01(\tR\x06source\x12\x16\n\x06target\x18\x02 \x01(\tR\x06target\"X\n\x18\x43heckReachabilityRequest\x12<\n\x07queries\x18\x01 \x03(\x0b\x32\".state_search.v1.ReachabilityQueryR\x07queries\"P\n\x12ReachabilityResult\x12\x1c\n\treachable\x18\x01 \x01(\x08R\treachable\x12\x1c\n\tundecided\x18\x02 \x01(\x08R\tundecided\"Z\n\x19\x43heckReachabilityResponse\x12=\n\x07results\x18\x01 \x03(\x0b\x32#.state_search.v1.ReachabilityResultR\x07results*\x83\x01\n\x12TraversalDirection\x12#\n\x1fTRAVERSAL_DIRECTION_UNSPECIFIED\x10\x00\x12$\n TRAVERSAL_DIRECTION_DEPENDENCIES\x10\x01\x12\"\n\x1eTRAVERSAL_DIRECTION_DEPENDENTS\x10\x02\x32\x85\x06\n\x16LeanStateSearchService\x12R\n\tGetAllRev\x12!.state_search.v1.GetAllRevRequest\x1a\".state_search.v1.GetAllRevResponse\x12^\n\rSearchTheorem\x12%.state_search.v1.SearchTheoremRequest\x1a&.state_search.v1.SearchTheoremResponse\x12r\n\x13SearchTheoremStream\x12+.state_search.v1.SearchTheoremStreamRequest\x1a,.state_search.v1.SearchTheoremStreamResponse0\x01\x12m\n\x12\x42\x61tchSearchTheorem\x12*.state_search.v1.BatchSearchTheoremRequest\x1a+.state_search.v1.BatchSearchTheoremResponse\x12v\n\x15MultiRevSearchTheorem\x12-.state_search.v1.MultiRevSearchTheoremRequest\x1a..state_search.v1.MultiRevSearchTheoremResponse\x12O\n\x08\x46\x65\x65\x64\x62\x61\x63k\x12 .state_search.v1.FeedbackRequest\x1a!.state_search.v1.FeedbackResponse\x12\x46\n\x05\x43lick\x12\x1d.state_search.v1.ClickRequest\x1a\x1e.state_search.v1.ClickResponse\x12\x43\n\x04\x43\x61ll\x12\x1c.state_search.v1.CallRequest\x1a\x1d.state_search.v1.CallResponse2\xcc\x05\n\x10LeanGraphService\x12\x85\x01\n\x1aGetDependencyNodesAndEdges\x12\x32.state_search.v1.GetDependencyNodesAndEdgesRequest\x1a\x33.state_search.v1.GetDependencyNodesAndEdgesResponse\x12\x82\x01\n\x19GetDependentNodesAndEdges\x12\x31.state_search.v1.GetDependentNodesAndEdgesRequest\x1a\x32.state_search.v1.GetDependentNodesAndEdgesResponse\x12m\n\x12GetNodeSuggestions\x12*.state_search.v1.GetNodeSuggestionsRequest\x1a+.state_search.v1.GetNodeSuggestionsResponse\x12^\n\rTraverseGraph\x12%.state_search.v1.TraverseGraphRequest\x1a&.state_search.v1.TraverseGraphResponse\x12p\n\x13\x46indDependencyPaths\x12+.state_search.v1.FindDependencyPathsRequest\x1a,.state_search.v1.FindDependencyPathsResponse\x12j\n\x11\x43heckReachability\x12).state_search.v1.CheckReachabilityRequest\x1a*.state_search.v1.CheckReachabilityResponseB\x80\x01\n\x13\x63om.state_search.v1B\x10StateSearchProtoP\x01\xa2\x02\x03SXX\xaa\x02\x0eStateSearch.V1\xca\x02\x0eStateSearch\\V1\xe2\x02\x1aStateSearch\\V1\\GPBMetadata\xea\x02\x0fStateSearch::V1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,6 +32,8 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'state_search.v1.state_searc
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n\023com.state_search.v1B\020StateSearchProtoP\001\242\002\003SXX\252\002\016StateSearch.V1\312\002\016StateSearch\\V1\342\002\032StateSearch\\V1\\GPBMetadata\352\002\017StateSearch::V1'
+  _globals['_TRAVERSALDIRECTION']._serialized_start=4178
+  _globals['_TRAVERSALDIRECTION']._serialized_end=4309
   _globals['_THEOREM']._serialized_start=56
   _globals['_THEOREM']._serialized_end=196
   _globals['_GETALLREVREQUEST']._serialized_start=198
@@ -42,38 +44,72 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_SEARCHTHEOREMREQUEST']._serialized_end=347
   _globals['_SEARCHTHEOREMRESPONSE']._serialized_start=349
   _globals['_SEARCHTHEOREMRESPONSE']._serialized_end=424
-  _globals['_FEEDBACKREQUEST']._serialized_start=427
-  _globals['_FEEDBACKREQUEST']._serialized_end=569
-  _globals['_FEEDBACKRESPONSE']._serialized_start=571
-  _globals['_FEEDBACKRESPONSE']._serialized_end=589
-  _globals['_CLICKREQUEST']._serialized_start=591
-  _globals['_CLICKREQUEST']._serialized_end=678
-  _globals['_CLICKRESPONSE']._serialized_start=680
-  _globals['_CLICKRESPONSE']._serialized_end=695
-  _globals['_CALLREQUEST']._serialized_start=697
-  _globals['_CALLREQUEST']._serialized_end=761
-  _globals['_CALLRESPONSE']._serialized_start=763
-  _globals['_CALLRESPONSE']._serialized_end=777
-  _globals['_LEANNODE']._serialized_start=780
-  _globals['_LEANNODE']._serialized_end=1019
-  _globals['_LEANEDGE']._serialized_start=1021
-  _globals['_LEANEDGE']._serialized_end=1124
-  _globals['_GETDEPENDENCYNODESANDEDGESREQUEST']._serialized_start=1126
-  _globals['_GETDEPENDENCYNODESANDEDGESREQUEST']._serialized_end=1181
-  _globals['_GETDEPENDENCYNODESANDEDGESRESPONSE']._serialized_start=1184
-  _globals['_GETDEPENDENCYNODESANDEDGESRESPONSE']._serialized_end=1386
-  _globals['_GETDEPENDENTNODESANDEDGESREQUEST']._serialized_start=1388
-  _globals['_GETDEPENDENTNODESANDEDGESREQUEST']._serialized_end=1442
-  _globals['_GETDEPENDENTNODESANDEDGESRESPONSE']._serialized_start=1445
-  _globals['_GETDEPENDENTNODESANDEDGESRESPONSE']._serialized_end=1646
-  _globals['_SAMPLINGINFO']._serialized_start=1649
-  _globals['_SAMPLINGINFO']._serialized_end=1790
-  _globals['_GETNODESUGGESTIONSREQUEST']._serialized_start=1792
-  _globals['_GETNODESUGGESTIONSREQUEST']._serialized_end=1882
-  _globals['_GETNODESUGGESTIONSRESPONSE']._serialized_start=1884
-  _globals['_GETNODESUGGESTIONSRESPONSE']._serialized_end=1946
-  _globals['_LEANSTATESEARCHSERVICE']._serialized_start=1949
-  _globals['_LEANSTATESEARCHSERVICE']._serialized_end=2375
-  _globals['_LEANGRAPHSERVICE']._serialized_start=2378
-  _globals['_LEANGRAPHSERVICE']._serialized_end=2776
+  _globals['_SEARCHTHEOREMSTREAMREQUEST']._serialized_start=426
+  _globals['_SEARCHTHEOREMSTREAMREQUEST']._serialized_end=520
+  _globals['_SEARCHTHEOREMSTREAMRESPONSE']._serialized_start=522
+  _globals['_SEARCHTHEOREMSTREAMRESPONSE']._serialized_end=603
+  _globals['_BATCHSEARCHTHEOREMREQUEST']._serialized_start=605
+  _globals['_BATCHSEARCHTHEOREMREQUEST']._serialized_end=702
+  _globals['_BATCHSEARCHTHEOREMRESPONSE']._serialized_start=704
+  _globals['_BATCHSEARCHTHEOREMRESPONSE']._serialized_end=798
+  _globals['_MULTIREVSEARCHTHEOREMREQUEST']._serialized_start=800
+  _globals['_MULTIREVSEARCHTHEOREMREQUEST']._serialized_end=920
+  _globals['_SCOREDTHEOREM']._serialized_start=922
+  _globals['_SCOREDTHEOREM']._serialized_end=1031
+  _globals['_REVSEARCHRESULT']._serialized_start=1033
+  _globals['_REVSEARCHRESULT']._serialized_end=1126
+  _globals['_MULTIREVSEARCHTHEOREMRESPONSE']._serialized_start=1129
+  _globals['_MULTIREVSEARCHTHEOREMRESPONSE']._serialized_end=1270
+  _globals['_FEEDBACKREQUEST']._serialized_start=1273
+  _globals['_FEEDBACKREQUEST']._serialized_end=1415
+  _globals['_FEEDBACKRESPONSE']._serialized_start=1417
+  _globals['_FEEDBACKRESPONSE']._serialized_end=1435
+  _globals['_CLICKREQUEST']._serialized_start=1437
+  _globals['_CLICKREQUEST']._serialized_end=1524
+  _globals['_CLICKRESPONSE']._serialized_start=1526
+  _globals['_CLICKRESPONSE']._serialized_end=1541
+  _globals['_CALLREQUEST']._serialized_start=1543
+  _globals['_CALLREQUEST']._serialized_end=1607
+  _globals['_CALLRESPONSE']._serialized_start=1609
+  _globals['_CALLRESPONSE']._serialized_end=1623
+  _globals['_LEANNODE']._serialized_start=1626
+  _globals['_LEANNODE']._serialized_end=1865
+  _globals['_LEANEDGE']._serialized_start=1867
+  _globals['_LEANEDGE']._serialized_end=1970
+  _globals['_GETDEPENDENCYNODESANDEDGESREQUEST']._serialized_start=1973
+  _globals['_GETDEPENDENCYNODESANDEDGESREQUEST']._serialized_end=2121
+  _globals['_GETDEPENDENCYNODESANDEDGESRESPONSE']._serialized_start=2124
+  _globals['_GETDEPENDENCYNODESANDEDGESRESPONSE']._serialized_end=2366
+  _globals['_GETDEPENDENTNODESANDEDGESREQUEST']._serialized_start=2369
+  _globals['_GETDEPENDENTNODESANDEDGESREQUEST']._serialized_end=2516
+  _globals['_GETDEPENDENTNODESANDEDGESRESPONSE']._serialized_start=2519
+  _globals['_GETDEPENDENTNODESANDEDGESRESPONSE']._serialized_end=2760
+  _globals['_SAMPLINGINFO']._serialized_start=2763
+  _globals['_SAMPLINGINFO']._serialized_end=2952
+  _globals['_GETNODESUGGESTIONSREQUEST']._serialized_start=2954
+  _globals['_GETNODESUGGESTIONSREQUEST']._serialized_end=3044
+  _globals['_GETNODESUGGESTIONSRESPONSE']._serialized_start=3046
+  _globals['_GETNODESUGGESTIONSRESPONSE']._serialized_end=3108
+  _globals['_TRAVERSEGRAPHREQUEST']._serialized_start=3111
+  _globals['_TRAVERSEGRAPHREQUEST']._serialized_end=3309
+  _globals['_TRAVERSEGRAPHRESPONSE']._serialized_start=3312
+  _globals['_TRAVERSEGRAPHRESPONSE']._serialized_end=3487
+  _globals['_FINDDEPENDENCYPATHSREQUEST']._serialized_start=3489
+  _globals['_FINDDEPENDENCYPATHSREQUEST']._serialized_end=3610
+  _globals['_DEPENDENCYPATH']._serialized_start=3612
+  _globals['_DEPENDENCYPATH']._serialized_end=3726
+  _globals['_FINDDEPENDENCYPATHSRESPONSE']._serialized_start=3728
+  _globals['_FINDDEPENDENCYPATHSRESPONSE']._serialized_end=3842
+  _globals['_REACHABILITYQUERY']._serialized_start=3844
+  _globals['_REACHABILITYQUERY']._serialized_end=3911
+  _globals['_CHECKREACHABILITYREQUEST']._serialized_start=3913
+  _globals['_CHECKREACHABILITYREQUEST']._serialized_end=4001
+  _globals['_REACHABILITYRESULT']._serialized_start=4003
+  _globals['_REACHABILITYRESULT']._serialized_end=4083
+  _globals['_CHECKREACHABILITYRESPONSE']._serialized_start=4085
+  _globals['_CHECKREACHABILITYRESPONSE']._serialized_end=4175
+  _globals['_LEANSTATESEARCHSERVICE']._serialized_start=4312
+  _globals['_LEANSTATESEARCHSERVICE']._serialized_end=5085
+  _globals['_LEANGRAPHSERVICE']._serialized_start=5088
+  _globals['_LEANGRAPHSERVICE']._serialized_end=5804
 # @@protoc_insertion_point(module_scope)
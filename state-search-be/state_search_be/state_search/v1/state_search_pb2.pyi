@@ -1,10 +1,20 @@
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class TraversalDirection(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TRAVERSAL_DIRECTION_UNSPECIFIED: _ClassVar[TraversalDirection]
+    TRAVERSAL_DIRECTION_DEPENDENCIES: _ClassVar[TraversalDirection]
+    TRAVERSAL_DIRECTION_DEPENDENTS: _ClassVar[TraversalDirection]
+TRAVERSAL_DIRECTION_UNSPECIFIED: TraversalDirection
+TRAVERSAL_DIRECTION_DEPENDENCIES: TraversalDirection
+TRAVERSAL_DIRECTION_DEPENDENTS: TraversalDirection
+
 class Theorem(_message.Message):
     __slots__ = ("id", "name", "code", "rev", "module", "formal_type")
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -47,6 +57,76 @@ class SearchTheoremResponse(_message.Message):
     results: _containers.RepeatedCompositeFieldContainer[Theorem]
     def __init__(self, results: _Optional[_Iterable[_Union[Theorem, _Mapping]]] = ...) -> None: ...
 
+class SearchTheoremStreamRequest(_message.Message):
+    __slots__ = ("query", "nresult", "rev")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    NRESULT_FIELD_NUMBER: _ClassVar[int]
+    REV_FIELD_NUMBER: _ClassVar[int]
+    query: str
+    nresult: int
+    rev: str
+    def __init__(self, query: _Optional[str] = ..., nresult: _Optional[int] = ..., rev: _Optional[str] = ...) -> None: ...
+
+class SearchTheoremStreamResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[Theorem]
+    def __init__(self, results: _Optional[_Iterable[_Union[Theorem, _Mapping]]] = ...) -> None: ...
+
+class BatchSearchTheoremRequest(_message.Message):
+    __slots__ = ("queries", "nresult", "rev")
+    QUERIES_FIELD_NUMBER: _ClassVar[int]
+    NRESULT_FIELD_NUMBER: _ClassVar[int]
+    REV_FIELD_NUMBER: _ClassVar[int]
+    queries: _containers.RepeatedScalarFieldContainer[str]
+    nresult: int
+    rev: str
+    def __init__(self, queries: _Optional[_Iterable[str]] = ..., nresult: _Optional[int] = ..., rev: _Optional[str] = ...) -> None: ...
+
+class BatchSearchTheoremResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[SearchTheoremResponse]
+    def __init__(self, results: _Optional[_Iterable[_Union[SearchTheoremResponse, _Mapping]]] = ...) -> None: ...
+
+class MultiRevSearchTheoremRequest(_message.Message):
+    __slots__ = ("query", "nresult", "revs", "merge")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    NRESULT_FIELD_NUMBER: _ClassVar[int]
+    REVS_FIELD_NUMBER: _ClassVar[int]
+    MERGE_FIELD_NUMBER: _ClassVar[int]
+    query: str
+    nresult: int
+    revs: _containers.RepeatedScalarFieldContainer[str]
+    merge: bool
+    def __init__(self, query: _Optional[str] = ..., nresult: _Optional[int] = ..., revs: _Optional[_Iterable[str]] = ..., merge: bool = ...) -> None: ...
+
+class ScoredTheorem(_message.Message):
+    __slots__ = ("theorem", "score", "revs")
+    THEOREM_FIELD_NUMBER: _ClassVar[int]
+    SCORE_FIELD_NUMBER: _ClassVar[int]
+    REVS_FIELD_NUMBER: _ClassVar[int]
+    theorem: Theorem
+    score: float
+    revs: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, theorem: _Optional[_Union[Theorem, _Mapping]] = ..., score: _Optional[float] = ..., revs: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class RevSearchResult(_message.Message):
+    __slots__ = ("rev", "results")
+    REV_FIELD_NUMBER: _ClassVar[int]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    rev: str
+    results: _containers.RepeatedCompositeFieldContainer[ScoredTheorem]
+    def __init__(self, rev: _Optional[str] = ..., results: _Optional[_Iterable[_Union[ScoredTheorem, _Mapping]]] = ...) -> None: ...
+
+class MultiRevSearchTheoremResponse(_message.Message):
+    __slots__ = ("revs", "merged")
+    REVS_FIELD_NUMBER: _ClassVar[int]
+    MERGED_FIELD_NUMBER: _ClassVar[int]
+    revs: _containers.RepeatedCompositeFieldContainer[RevSearchResult]
+    merged: _containers.RepeatedCompositeFieldContainer[ScoredTheorem]
+    def __init__(self, revs: _Optional[_Iterable[_Union[RevSearchResult, _Mapping]]] = ..., merged: _Optional[_Iterable[_Union[ScoredTheorem, _Mapping]]] = ...) -> None: ...
+
 class FeedbackRequest(_message.Message):
     __slots__ = ("query", "theorem_id", "relevant", "update", "rank")
     QUERY_FIELD_NUMBER: _ClassVar[int]
@@ -122,46 +202,64 @@ class LeanEdge(_message.Message):
     def __init__(self, id: _Optional[str] = ..., source: _Optional[str] = ..., target: _Optional[str] = ..., edge_type: _Optional[str] = ...) -> None: ...
 
 class GetDependencyNodesAndEdgesRequest(_message.Message):
-    __slots__ = ("name",)
+    __slots__ = ("name", "sample_seed", "page_size", "page_token")
     NAME_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_SEED_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     name: str
-    def __init__(self, name: _Optional[str] = ...) -> None: ...
+    sample_seed: int
+    page_size: int
+    page_token: str
+    def __init__(self, name: _Optional[str] = ..., sample_seed: _Optional[int] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
 
 class GetDependencyNodesAndEdgesResponse(_message.Message):
-    __slots__ = ("nodes", "edges", "sampling_info")
+    __slots__ = ("nodes", "edges", "sampling_info", "next_page_token")
     NODES_FIELD_NUMBER: _ClassVar[int]
     EDGES_FIELD_NUMBER: _ClassVar[int]
     SAMPLING_INFO_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     nodes: _containers.RepeatedCompositeFieldContainer[LeanNode]
     edges: _containers.RepeatedCompositeFieldContainer[LeanEdge]
     sampling_info: SamplingInfo
-    def __init__(self, nodes: _Optional[_Iterable[_Union[LeanNode, _Mapping]]] = ..., edges: _Optional[_Iterable[_Union[LeanEdge, _Mapping]]] = ..., sampling_info: _Optional[_Union[SamplingInfo, _Mapping]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, nodes: _Optional[_Iterable[_Union[LeanNode, _Mapping]]] = ..., edges: _Optional[_Iterable[_Union[LeanEdge, _Mapping]]] = ..., sampling_info: _Optional[_Union[SamplingInfo, _Mapping]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class GetDependentNodesAndEdgesRequest(_message.Message):
-    __slots__ = ("name",)
+    __slots__ = ("name", "sample_seed", "page_size", "page_token")
     NAME_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_SEED_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     name: str
-    def __init__(self, name: _Optional[str] = ...) -> None: ...
+    sample_seed: int
+    page_size: int
+    page_token: str
+    def __init__(self, name: _Optional[str] = ..., sample_seed: _Optional[int] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
 
 class GetDependentNodesAndEdgesResponse(_message.Message):
-    __slots__ = ("nodes", "edges", "sampling_info")
+    __slots__ = ("nodes", "edges", "sampling_info", "next_page_token")
     NODES_FIELD_NUMBER: _ClassVar[int]
     EDGES_FIELD_NUMBER: _ClassVar[int]
     SAMPLING_INFO_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     nodes: _containers.RepeatedCompositeFieldContainer[LeanNode]
     edges: _containers.RepeatedCompositeFieldContainer[LeanEdge]
     sampling_info: SamplingInfo
-    def __init__(self, nodes: _Optional[_Iterable[_Union[LeanNode, _Mapping]]] = ..., edges: _Optional[_Iterable[_Union[LeanEdge, _Mapping]]] = ..., sampling_info: _Optional[_Union[SamplingInfo, _Mapping]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, nodes: _Optional[_Iterable[_Union[LeanNode, _Mapping]]] = ..., edges: _Optional[_Iterable[_Union[LeanEdge, _Mapping]]] = ..., sampling_info: _Optional[_Union[SamplingInfo, _Mapping]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class SamplingInfo(_message.Message):
-    __slots__ = ("was_sampled", "original_node_count", "sampled_node_count")
+    __slots__ = ("was_sampled", "original_node_count", "sampled_node_count", "original_edge_count")
     WAS_SAMPLED_FIELD_NUMBER: _ClassVar[int]
     ORIGINAL_NODE_COUNT_FIELD_NUMBER: _ClassVar[int]
     SAMPLED_NODE_COUNT_FIELD_NUMBER: _ClassVar[int]
+    ORIGINAL_EDGE_COUNT_FIELD_NUMBER: _ClassVar[int]
     was_sampled: bool
     original_node_count: int
     sampled_node_count: int
-    def __init__(self, was_sampled: bool = ..., original_node_count: _Optional[int] = ..., sampled_node_count: _Optional[int] = ...) -> None: ...
+    original_edge_count: int
+    def __init__(self, was_sampled: bool = ..., original_node_count: _Optional[int] = ..., sampled_node_count: _Optional[int] = ..., original_edge_count: _Optional[int] = ...) -> None: ...
 
 class GetNodeSuggestionsRequest(_message.Message):
     __slots__ = ("query", "max_suggestions")
@@ -176,3 +274,85 @@ class GetNodeSuggestionsResponse(_message.Message):
     SUGGESTIONS_FIELD_NUMBER: _ClassVar[int]
     suggestions: _containers.RepeatedScalarFieldContainer[str]
     def __init__(self, suggestions: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class TraverseGraphRequest(_message.Message):
+    __slots__ = ("name", "direction", "max_depth", "max_nodes", "edge_types")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    DIRECTION_FIELD_NUMBER: _ClassVar[int]
+    MAX_DEPTH_FIELD_NUMBER: _ClassVar[int]
+    MAX_NODES_FIELD_NUMBER: _ClassVar[int]
+    EDGE_TYPES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    direction: TraversalDirection
+    max_depth: int
+    max_nodes: int
+    edge_types: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, name: _Optional[str] = ..., direction: _Optional[_Union[TraversalDirection, str]] = ..., max_depth: _Optional[int] = ..., max_nodes: _Optional[int] = ..., edge_types: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class TraverseGraphResponse(_message.Message):
+    __slots__ = ("nodes", "edges", "depths", "truncated")
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    EDGES_FIELD_NUMBER: _ClassVar[int]
+    DEPTHS_FIELD_NUMBER: _ClassVar[int]
+    TRUNCATED_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[LeanNode]
+    edges: _containers.RepeatedCompositeFieldContainer[LeanEdge]
+    depths: _containers.RepeatedScalarFieldContainer[int]
+    truncated: bool
+    def __init__(self, nodes: _Optional[_Iterable[_Union[LeanNode, _Mapping]]] = ..., edges: _Optional[_Iterable[_Union[LeanEdge, _Mapping]]] = ..., depths: _Optional[_Iterable[int]] = ..., truncated: bool = ...) -> None: ...
+
+class FindDependencyPathsRequest(_message.Message):
+    __slots__ = ("source", "target", "k", "edge_types")
+    SOURCE_FIELD_NUMBER: _ClassVar[int]
+    TARGET_FIELD_NUMBER: _ClassVar[int]
+    K_FIELD_NUMBER: _ClassVar[int]
+    EDGE_TYPES_FIELD_NUMBER: _ClassVar[int]
+    source: str
+    target: str
+    k: int
+    edge_types: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, source: _Optional[str] = ..., target: _Optional[str] = ..., k: _Optional[int] = ..., edge_types: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DependencyPath(_message.Message):
+    __slots__ = ("nodes", "edges")
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    EDGES_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[LeanNode]
+    edges: _containers.RepeatedCompositeFieldContainer[LeanEdge]
+    def __init__(self, nodes: _Optional[_Iterable[_Union[LeanNode, _Mapping]]] = ..., edges: _Optional[_Iterable[_Union[LeanEdge, _Mapping]]] = ...) -> None: ...
+
+class FindDependencyPathsResponse(_message.Message):
+    __slots__ = ("paths", "truncated")
+    PATHS_FIELD_NUMBER: _ClassVar[int]
+    TRUNCATED_FIELD_NUMBER: _ClassVar[int]
+    paths: _containers.RepeatedCompositeFieldContainer[DependencyPath]
+    truncated: bool
+    def __init__(self, paths: _Optional[_Iterable[_Union[DependencyPath, _Mapping]]] = ..., truncated: bool = ...) -> None: ...
+
+class ReachabilityQuery(_message.Message):
+    __slots__ = ("source", "target")
+    SOURCE_FIELD_NUMBER: _ClassVar[int]
+    TARGET_FIELD_NUMBER: _ClassVar[int]
+    source: str
+    target: str
+    def __init__(self, source: _Optional[str] = ..., target: _Optional[str] = ...) -> None: ...
+
+class CheckReachabilityRequest(_message.Message):
+    __slots__ = ("queries",)
+    QUERIES_FIELD_NUMBER: _ClassVar[int]
+    queries: _containers.RepeatedCompositeFieldContainer[ReachabilityQuery]
+    def __init__(self, queries: _Optional[_Iterable[_Union[ReachabilityQuery, _Mapping]]] = ...) -> None: ...
+
+class ReachabilityResult(_message.Message):
+    __slots__ = ("reachable", "undecided")
+    REACHABLE_FIELD_NUMBER: _ClassVar[int]
+    UNDECIDED_FIELD_NUMBER: _ClassVar[int]
+    reachable: bool
+    undecided: bool
+    def __init__(self, reachable: bool = ..., undecided: bool = ...) -> None: ...
+
+class CheckReachabilityResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[ReachabilityResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[ReachabilityResult, _Mapping]]] = ...) -> None: ...
@@ -25,6 +25,21 @@ class LeanStateSearchServiceStub(object):
                 request_serializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremRequest.SerializeToString,
                 response_deserializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremResponse.FromString,
                 _registered_method=True)
+        self.SearchTheoremStream = channel.unary_stream(
+                '/state_search.v1.LeanStateSearchService/SearchTheoremStream',
+                request_serializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremStreamRequest.SerializeToString,
+                response_deserializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremStreamResponse.FromString,
+                _registered_method=True)
+        self.BatchSearchTheorem = channel.unary_unary(
+                '/state_search.v1.LeanStateSearchService/BatchSearchTheorem',
+                request_serializer=state__search_dot_v1_dot_state__search__pb2.BatchSearchTheoremRequest.SerializeToString,
+                response_deserializer=state__search_dot_v1_dot_state__search__pb2.BatchSearchTheoremResponse.FromString,
+                _registered_method=True)
+        self.MultiRevSearchTheorem = channel.unary_unary(
+                '/state_search.v1.LeanStateSearchService/MultiRevSearchTheorem',
+                request_serializer=state__search_dot_v1_dot_state__search__pb2.MultiRevSearchTheoremRequest.SerializeToString,
+                response_deserializer=state__search_dot_v1_dot_state__search__pb2.MultiRevSearchTheoremResponse.FromString,
+                _registered_method=True)
         self.Feedback = channel.unary_unary(
                 '/state_search.v1.LeanStateSearchService/Feedback',
                 request_serializer=state__search_dot_v1_dot_state__search__pb2.FeedbackRequest.SerializeToString,
@@ -60,6 +75,27 @@ class LeanStateSearchServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SearchTheoremStream(self, request, context):
+        """Search theorem according to the query, streaming the hits in rank order.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchSearchTheorem(self, request, context):
+        """Search theorems for many queries against the same rev at once.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MultiRevSearchTheorem(self, request, context):
+        """Search theorem according to the query in several revs at once.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Feedback(self, request, context):
         """Collect feedbacks from user.
         """
@@ -93,6 +129,21 @@ def add_LeanStateSearchServiceServicer_to_server(servicer, server):
                     request_deserializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremRequest.FromString,
                     response_serializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremResponse.SerializeToString,
             ),
+            'SearchTheoremStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.SearchTheoremStream,
+                    request_deserializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremStreamRequest.FromString,
+                    response_serializer=state__search_dot_v1_dot_state__search__pb2.SearchTheoremStreamResponse.SerializeToString,
+            ),
+            'BatchSearchTheorem': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchSearchTheorem,
+                    request_deserializer=state__search_dot_v1_dot_state__search__pb2.BatchSearchTheoremRequest.FromString,
+                    response_serializer=state__search_dot_v1_dot_state__search__pb2.BatchSearchTheoremResponse.SerializeToString,
+            ),
+            'MultiRevSearchTheorem': grpc.unary_unary_rpc_method_handler(
+                    servicer.MultiRevSearchTheorem,
+                    request_deserializer=state__search_dot_v1_dot_state__search__pb2.MultiRevSearchTheoremRequest.FromString,
+                    response_serializer=state__search_dot_v1_dot_state__search__pb2.MultiRevSearchTheoremResponse.SerializeToString,
+            ),
             'Feedback': grpc.unary_unary_rpc_method_handler(
                     servicer.Feedback,
                     request_deserializer=state__search_dot_v1_dot_state__search__pb2.FeedbackRequest.FromString,
@@ -174,6 +225,87 @@ class LeanStateSearchService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SearchTheoremStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/state_search.v1.LeanStateSearchService/SearchTheoremStream',
+            state__search_dot_v1_dot_state__search__pb2.SearchTheoremStreamRequest.SerializeToString,
+            state__search_dot_v1_dot_state__search__pb2.SearchTheoremStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchSearchTheorem(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/state_search.v1.LeanStateSearchService/BatchSearchTheorem',
+            state__search_dot_v1_dot_state__search__pb2.BatchSearchTheoremRequest.SerializeToString,
+            state__search_dot_v1_dot_state__search__pb2.BatchSearchTheoremResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def MultiRevSearchTheorem(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/state_search.v1.LeanStateSearchService/MultiRevSearchTheorem',
+            state__search_dot_v1_dot_state__search__pb2.MultiRevSearchTheoremRequest.SerializeToString,
+            state__search_dot_v1_dot_state__search__pb2.MultiRevSearchTheoremResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Feedback(request,
             target,
@@ -280,6 +412,21 @@ class LeanGraphServiceStub(object):
                 request_serializer=state__search_dot_v1_dot_state__search__pb2.GetNodeSuggestionsRequest.SerializeToString,
                 response_deserializer=state__search_dot_v1_dot_state__search__pb2.GetNodeSuggestionsResponse.FromString,
                 _registered_method=True)
+        self.TraverseGraph = channel.unary_unary(
+                '/state_search.v1.LeanGraphService/TraverseGraph',
+                request_serializer=state__search_dot_v1_dot_state__search__pb2.TraverseGraphRequest.SerializeToString,
+                response_deserializer=state__search_dot_v1_dot_state__search__pb2.TraverseGraphResponse.FromString,
+                _registered_method=True)
+        self.FindDependencyPaths = channel.unary_unary(
+                '/state_search.v1.LeanGraphService/FindDependencyPaths',
+                request_serializer=state__search_dot_v1_dot_state__search__pb2.FindDependencyPathsRequest.SerializeToString,
+                response_deserializer=state__search_dot_v1_dot_state__search__pb2.FindDependencyPathsResponse.FromString,
+                _registered_method=True)
+        self.CheckReachability = channel.unary_unary(
+                '/state_search.v1.LeanGraphService/CheckReachability',
+                request_serializer=state__search_dot_v1_dot_state__search__pb2.CheckReachabilityRequest.SerializeToString,
+                response_deserializer=state__search_dot_v1_dot_state__search__pb2.CheckReachabilityResponse.FromString,
+                _registered_method=True)
 
 
 class LeanGraphServiceServicer(object):
@@ -303,6 +450,27 @@ class LeanGraphServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def TraverseGraph(self, request, context):
+        """Breadth-first traversal of dependencies or dependents, bounded in depth and size.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FindDependencyPaths(self, request, context):
+        """Shortest chains of dependencies leading from one node to another.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckReachability(self, request, context):
+        """Whether nodes transitively depend on others, for many pairs at once.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_LeanGraphServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -321,6 +489,21 @@ def add_LeanGraphServiceServicer_to_server(servicer, server):
                     request_deserializer=state__search_dot_v1_dot_state__search__pb2.GetNodeSuggestionsRequest.FromString,
                     response_serializer=state__search_dot_v1_dot_state__search__pb2.GetNodeSuggestionsResponse.SerializeToString,
             ),
+            'TraverseGraph': grpc.unary_unary_rpc_method_handler(
+                    servicer.TraverseGraph,
+                    request_deserializer=state__search_dot_v1_dot_state__search__pb2.TraverseGraphRequest.FromString,
+                    response_serializer=state__search_dot_v1_dot_state__search__pb2.TraverseGraphResponse.SerializeToString,
+            ),
+            'FindDependencyPaths': grpc.unary_unary_rpc_method_handler(
+                    servicer.FindDependencyPaths,
+                    request_deserializer=state__search_dot_v1_dot_state__search__pb2.FindDependencyPathsRequest.FromString,
+                    response_serializer=state__search_dot_v1_dot_state__search__pb2.FindDependencyPathsResponse.SerializeToString,
+            ),
+            'CheckReachability': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckReachability,
+                    request_deserializer=state__search_dot_v1_dot_state__search__pb2.CheckReachabilityRequest.FromString,
+                    response_serializer=state__search_dot_v1_dot_state__search__pb2.CheckReachabilityResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'state_search.v1.LeanGraphService', rpc_method_handlers)
@@ -412,3 +595,84 @@ class LeanGraphService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def TraverseGraph(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/state_search.v1.LeanGraphService/TraverseGraph',
+            state__search_dot_v1_dot_state__search__pb2.TraverseGraphRequest.SerializeToString,
+            state__search_dot_v1_dot_state__search__pb2.TraverseGraphResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def FindDependencyPaths(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/state_search.v1.LeanGraphService/FindDependencyPaths',
+            state__search_dot_v1_dot_state__search__pb2.FindDependencyPathsRequest.SerializeToString,
+            state__search_dot_v1_dot_state__search__pb2.FindDependencyPathsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckReachability(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/state_search.v1.LeanGraphService/CheckReachability',
+            state__search_dot_v1_dot_state__search__pb2.CheckReachabilityRequest.SerializeToString,
+            state__search_dot_v1_dot_state__search__pb2.CheckReachabilityResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+from prisma import Prisma
+
+from state_search_be.state_search.v1.state_search_pb2 import (
+    SearchTheoremResponse,
+    Theorem,
+)
+
+# Tag of `SearchTheoremResponse.results` (field 1, length-delimited).
+_RESULTS_TAG = b"\x0a"
+
+
+def to_code(name: str, args: List[str], goal: str) -> str:
+    return f"theorem {name} {''.join(args)} : {goal}"
+
+
+def theorem_payload(theorem, full: bool = False) -> dict:
+    """Payload of a theorem's vector; `full` adds the fields needed for display."""
+    if not full:
+        return {"id": theorem.id}
+    return {
+        "id": theorem.id,
+        "name": theorem.name,
+        "args": theorem.args,
+        "goal": theorem.goal,
+        "module": theorem.module,
+        "formal_type": theorem.formal_type,
+    }
+
+
+def theorem_from_payload(payload: dict, rev: str) -> Theorem:
+    """Build a result from a point stored with the full display payload."""
+    return Theorem(
+        id=payload["id"],
+        name=payload["name"],
+        code=to_code(payload["name"], payload["args"], payload["goal"]),
+        rev=rev,
+        module=payload["module"],
+        formal_type=payload.get("formal_type", ""),
+    )
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _frame(theorem: Theorem) -> bytes:
+    payload = theorem.SerializeToString()
+    return _RESULTS_TAG + _varint(len(payload)) + payload
+
+
+async def iter_theorem_pages(db: Prisma, rev: str, page_size: int = 10000):
+    """Yield the theorems of `rev` in id order, `page_size` rows at a time."""
+    cursor = None
+    while True:
+        page = await db.theorem.find_many(
+            where={"rev": rev},
+            order={"id": "asc"},
+            take=page_size,
+            **({"cursor": {"id": cursor}, "skip": 1} if cursor else {}),
+        )
+        if page:
+            yield page
+        if len(page) < page_size:
+            return
+        cursor = page[-1].id
+
+
+class TheoremStore:
+    """
+    In-memory store of hydrated theorems, one table per rev.
+
+    Each theorem is rendered once when its rev is loaded and kept as an encoded
+    `SearchTheoremResponse.results` entry, so a response is assembled by
+    concatenating bytes and parsing them once. A rev is loaded on first use and
+    reloaded when the vector store returns ids it does not know, which is what
+    happens after the rev is re-uploaded and re-indexed. At most `max_revs`
+    revs are kept, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        db: Prisma,
+        page_size: int = 10000,
+        min_reload_interval: float = 60,
+        max_revs: int = 4,
+    ):
+        self.db = db
+        self.page_size = page_size
+        self.min_reload_interval = min_reload_interval
+        self.max_revs = max(max_revs, 1)
+        self._revs: OrderedDict[str, Dict[str, bytes]] = OrderedDict()
+        self._loaded_at: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def invalidate(self, rev: str):
+        self._revs.pop(rev, None)
+        self._loaded_at.pop(rev, None)
+
+    async def load(self, rev: str) -> Dict[str, bytes]:
+        theorems = {}
+        async for page in iter_theorem_pages(self.db, rev, self.page_size):
+            for theorem in page:
+                theorems[theorem.id] = _frame(
+                    Theorem(
+                        id=theorem.id,
+                        name=theorem.name,
+                        code=to_code(theorem.name, theorem.args, theorem.goal),
+                        rev=rev,
+                        module=theorem.module,
+                        formal_type=theorem.formal_type,
+                    )
+                )
+        logging.info("Loaded %d theorems of rev %s", len(theorems), rev)
+        self._revs[rev] = theorems
+        self._revs.move_to_end(rev)
+        self._loaded_at[rev] = time.monotonic()
+        while len(self._revs) > self.max_revs:
+            evicted, _ = self._revs.popitem(last=False)
+            self._loaded_at.pop(evicted, None)
+            lock = self._locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted]
+        return theorems
+
+    async def _table(self, rev: str, ids: List[str]) -> Dict[str, bytes]:
+        theorems = self._revs.get(rev)
+        if theorems is not None:
+            self._revs.move_to_end(rev)
+        if theorems is not None and all(id in theorems for id in ids):
+            return theorems
+        lock = self._locks.setdefault(rev, asyncio.Lock())
+        async with lock:
+            theorems = self._revs.get(rev)
+            if theorems is None:
+                return await self.load(rev)
+            if all(id in theorems for id in ids):
+                return theorems
+            loaded_at = self._loaded_at.get(rev, 0)
+            if time.monotonic() - loaded_at >= self.min_reload_interval:
+                return await self.load(rev)
+            return theorems
+
+    async def results(self, rev: str, ids: List[str]) -> SearchTheoremResponse:
+        """Hydrate `ids` of `rev` in the given order, skipping unknown ids."""
+        theorems = await self._table(rev, ids)
+        return SearchTheoremResponse.FromString(
+            b"".join(theorems[id] for id in ids if id in theorems)
+        )
@@ -0,0 +1,336 @@
+import abc
+import asyncio
+import json
+import os
+import shutil
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    PayloadSchemaType,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
+
+
+class Point(NamedTuple):
+    """A search hit, shaped like the points Qdrant returns."""
+
+    id: int
+    score: float
+    payload: dict
+
+
+class VectorStore(abc.ABC):
+    """
+    Per-rev vector index searched by `LeanStateSearchServicer`.
+
+    Every rev is a collection of normalized theorem embeddings scored by dot
+    product. Hits carry at least the theorem `id` in their payload.
+    """
+
+    @abc.abstractmethod
+    async def search(
+        self, rev: str, vector: np.ndarray, limit: int, with_payload: bool = False
+    ) -> list: ...
+
+    @abc.abstractmethod
+    async def search_batch(
+        self,
+        rev: str,
+        vectors: Sequence[np.ndarray],
+        limit: int,
+        with_payload: bool = False,
+    ) -> List[list]: ...
+
+    async def close(self):
+        pass
+
+
+class QdrantVectorStore(VectorStore):
+    """Collections of a Qdrant server, one per rev."""
+
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        search_params: Optional[SearchParams] = None,
+        search_timeout: Optional[int] = None,
+        batch_search_timeout: Optional[int] = None,
+    ):
+        self.client = client
+        self.search_params = search_params
+        self.search_timeout = search_timeout
+        self.batch_search_timeout = batch_search_timeout
+
+    async def search(self, rev, vector, limit, with_payload=False):
+        results = await self.client.query_points(
+            rev,
+            np.asarray(vector).tolist(),
+            limit=limit,
+            search_params=self.search_params,
+            with_payload=True if with_payload else ["id"],
+            timeout=self.search_timeout,
+        )
+        return results.points
+
+    async def search_batch(self, rev, vectors, limit, with_payload=False):
+        results = await self.client.query_batch_points(
+            rev,
+            [
+                QueryRequest(
+                    query=np.asarray(vector).tolist(),
+                    limit=limit,
+                    params=self.search_params,
+                    with_payload=True if with_payload else ["id"],
+                )
+                for vector in vectors
+            ],
+            timeout=self.batch_search_timeout,
+        )
+        return [result.points for result in results]
+
+    async def close(self):
+        await self.client.close()
+
+
+def create_qdrant_collection(
+    client: QdrantClient,
+    rev: str,
+    size: int,
+    quantization: str = "none",
+    on_disk: bool = False,
+):
+    """
+    (Re)create the collection of `rev`. With `quantization` ("scalar" or
+    "binary"), the quantized vectors stay in RAM and `on_disk` moves the
+    originals, which are only read for rescoring, to disk.
+    """
+    quantization_config = None
+    if quantization == "scalar":
+        quantization_config = ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8, quantile=0.99, always_ram=True
+            )
+        )
+    elif quantization == "binary":
+        quantization_config = BinaryQuantization(
+            binary=BinaryQuantizationConfig(always_ram=True)
+        )
+    client.delete_collection(rev)
+    client.create_collection(
+        collection_name=rev,
+        vectors_config=VectorParams(size=size, distance=Distance.DOT, on_disk=on_disk),
+        quantization_config=quantization_config,
+    )
+    client.create_payload_index(
+        collection_name=rev, field_name="id", field_schema=PayloadSchemaType.KEYWORD
+    )
+
+
+def rev_path(root: str, rev: str) -> str:
+    """
+    Path of the directory of `rev` under `root`. Revs that are not a single
+    plain path component are rejected so that they cannot leave `root`.
+    """
+    if (
+        not rev
+        or rev.startswith(".")
+        or os.sep in rev
+        or (os.altsep and os.altsep in rev)
+        or "\0" in rev
+    ):
+        raise ValueError(f"Invalid rev {rev!r}")
+    return os.path.join(root, rev)
+
+
+def read_manifest(root: str, rev: str) -> dict:
+    with open(os.path.join(rev_path(root, rev), "manifest.json")) as f:
+        return json.load(f)
+
+
+def top_k(
+    matrix: np.ndarray, queries: np.ndarray, limit: int, chunk_rows: int = 65536
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact top-`limit` rows of `matrix` by dot product with each query.
+
+    The matrix is scored `chunk_rows` rows at a time so that a memory-mapped
+    float16 matrix is never converted to float32 as a whole. Returns indices
+    and scores of shape `(len(queries), k)`, best first.
+    """
+    queries = np.asarray(queries, dtype=np.float32)
+    best_indices = np.empty((len(queries), 0), dtype=np.int64)
+    best_scores = np.empty((len(queries), 0), dtype=np.float32)
+    for start in range(0, len(matrix), chunk_rows):
+        block = np.asarray(matrix[start : start + chunk_rows], dtype=np.float32)
+        scores = np.concatenate([best_scores, queries @ block.T], axis=1)
+        indices = np.concatenate(
+            [
+                best_indices,
+                np.broadcast_to(
+                    np.arange(start, start + len(block)), (len(queries), len(block))
+                ),
+            ],
+            axis=1,
+        )
+        k = min(limit, scores.shape[1])
+        keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, keep, axis=1)
+        best_indices = np.take_along_axis(indices, keep, axis=1)
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    return (
+        np.take_along_axis(best_indices, order, axis=1),
+        np.take_along_axis(best_scores, order, axis=1),
+    )
+
+
+class MmapVectorStore(VectorStore):
+    """
+    In-process vector store over the files written by `VectorStoreWriter`.
+
+    Each rev is a link under `root` to a directory holding `embeddings.npy`,
+    `ids.npy` and `manifest.json`. Embeddings are memory-mapped read-only, so
+    server processes on one host share their pages through the OS page cache.
+    Search is an exact dot-product scan. A rev is reopened when its link points
+    to a new directory, which is what a rebuild does.
+    """
+
+    def __init__(self, root: str, chunk_rows: int = 65536):
+        self.root = root
+        self.chunk_rows = chunk_rows
+        self._revs: Dict[str, Tuple[tuple, np.ndarray, np.ndarray]] = {}
+
+    def open(self, rev: str) -> Tuple[np.ndarray, np.ndarray]:
+        try:
+            link = rev_path(self.root, rev)
+        except ValueError:
+            raise KeyError(f"No vector store for rev {rev}") from None
+        # A rebuild may remove the directory just resolved; resolve it again
+        for attempt in range(2):
+            path = os.path.realpath(link)
+            try:
+                version = (
+                    path,
+                    os.stat(os.path.join(path, "manifest.json")).st_mtime_ns,
+                )
+                cached = self._revs.get(rev)
+                if cached is not None and cached[0] == version:
+                    return cached[1], cached[2]
+                with open(os.path.join(path, "manifest.json")) as f:
+                    count = json.load(f)["count"]
+                embeddings = np.load(
+                    os.path.join(path, "embeddings.npy"), mmap_mode="r"
+                )
+                ids = np.load(os.path.join(path, "ids.npy"), mmap_mode="r")
+                break
+            except FileNotFoundError:
+                if attempt:
+                    raise KeyError(f"No vector store for rev {rev}") from None
+        self._revs[rev] = (version, ids[:count], embeddings[:count])
+        return ids[:count], embeddings[:count]
+
+    def _search(self, rev, vectors, limit) -> List[List[Point]]:
+        ids, embeddings = self.open(rev)
+        if len(ids) == 0:
+            return [[] for _ in vectors]
+        indices, scores = top_k(
+            embeddings, np.stack(vectors), limit, chunk_rows=self.chunk_rows
+        )
+        return [
+            [
+                Point(id=int(i), score=float(score), payload={"id": str(ids[i])})
+                for i, score in zip(row_indices, row_scores)
+            ]
+            for row_indices, row_scores in zip(indices, scores)
+        ]
+
+    async def search(self, rev, vector, limit, with_payload=False):
+        return (await asyncio.to_thread(self._search, rev, [vector], limit))[0]
+
+    async def search_batch(self, rev, vectors, limit, with_payload=False):
+        if not len(vectors):
+            return []
+        return await asyncio.to_thread(self._search, rev, list(vectors), limit)
+
+    async def close(self):
+        self._revs.clear()
+
+
+class VectorStoreWriter:
+    """
+    Write the embeddings of a rev in the `MmapVectorStore` format.
+
+    Rows are appended into a preallocated memory-mapped file of `capacity`
+    rows in a new directory. On `close`, the rev's link is atomically replaced
+    by one to that directory, and the previous directory is removed. Readers
+    always find a complete rev, and those that still map the old files keep
+    working.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        rev: str,
+        capacity: int,
+        dim: int,
+        dtype: str = "float32",
+    ):
+        self.root = root
+        self.rev = rev
+        self.target = rev_path(root, rev)
+        self.path = os.path.join(root, f".{rev}.{time.time_ns()}.{os.getpid()}")
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path)
+        self.embeddings = np.lib.format.open_memmap(
+            os.path.join(self.path, "embeddings.npy"),
+            mode="w+",
+            dtype=dtype,
+            shape=(capacity, dim),
+        )
+        self.ids: List[str] = []
+
+    def append(self, ids: Sequence[str], embeddings: np.ndarray):
+        start = len(self.ids)
+        if start + len(ids) > len(self.embeddings):
+            raise ValueError(
+                f"Writing more than {len(self.embeddings)} vectors for rev {self.rev}"
+            )
+        self.embeddings[start : start + len(ids)] = embeddings
+        self.ids.extend(ids)
+
+    def close(self, **metadata) -> dict:
+        self.embeddings.flush()
+        np.save(os.path.join(self.path, "ids.npy"), np.array(self.ids, dtype=str))
+        manifest = {
+            "rev": self.rev,
+            "count": len(self.ids),
+            "dim": self.embeddings.shape[1],
+            "dtype": str(self.embeddings.dtype),
+            "created_at": time.time(),
+            **metadata,
+        }
+        with open(os.path.join(self.path, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+        del self.embeddings
+        old = None
+        if os.path.islink(self.target):
+            old = os.path.realpath(self.target)
+        elif os.path.exists(self.target):
+            # A rev written before revs were links; moved aside once
+            old = f"{self.path}.old"
+            os.replace(self.target, old)
+        link = f"{self.path}.link"
+        os.symlink(os.path.basename(self.path), link)
+        os.replace(link, self.target)
+        if old is not None:
+            shutil.rmtree(old, ignore_errors=True)
+        return manifest
@@ -0,0 +1,41 @@
+from state_search_be.api import merge_results
+from state_search_be.state_search.v1.state_search_pb2 import ScoredTheorem, Theorem
+
+
+def hit(name, score, rev):
+    return ScoredTheorem(
+        theorem=Theorem(id=f"{rev}/{name}", name=name, rev=rev), score=score
+    )
+
+
+def test_merge_keeps_the_best_hit_of_each_name_with_all_its_revs():
+    revs = ["v1", "v2", "v3"]
+    results = [
+        [hit("a", 0.75, "v1"), hit("b", 0.5, "v1")],
+        [hit("a", 0.875, "v2"), hit("c", 0.625, "v2")],
+        [hit("b", 0.25, "v3"), hit("a", 0.125, "v3")],
+    ]
+    merged = merge_results(revs, results, 10)
+    assert [(m.theorem.name, m.theorem.rev, m.score) for m in merged] == [
+        ("a", "v2", 0.875),
+        ("c", "v2", 0.625),
+        ("b", "v1", 0.5),
+    ]
+    assert [list(m.revs) for m in merged] == [["v1", "v2", "v3"], ["v2"], ["v1", "v3"]]
+
+
+def test_merge_truncates_to_nresult():
+    results = [[hit(name, score, "v") for name, score in zip("abcde", [5, 4, 3, 2, 1])]]
+    merged = merge_results(["v"], results, 2)
+    assert [m.theorem.name for m in merged] == ["a", "b"]
+
+
+def test_merge_leaves_the_rev_results_untouched():
+    results = [[hit("a", 0.25, "v1")], [hit("a", 0.75, "v2")]]
+    merge_results(["v1", "v2"], results, 10)
+    assert results[0][0].theorem.rev == "v1" and not results[0][0].revs
+    assert results[1][0].score == 0.75 and not results[1][0].revs
+
+
+def test_merge_of_no_results():
+    assert merge_results(["v1", "v2"], [[], []], 10) == []
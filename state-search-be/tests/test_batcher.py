@@ -0,0 +1,85 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from state_search_be.batcher import EmbeddingBatcher
+
+
+def test_concurrent_queries_share_batches_and_get_their_own_rows():
+    batches = []
+
+    async def encode(queries):
+        batches.append(list(queries))
+        await asyncio.sleep(0.01)
+        return np.array([[len(query), i] for i, query in enumerate(queries)])
+
+    async def main():
+        batcher = EmbeddingBatcher(encode, max_batch_size=8, max_wait_ms=20)
+        queries = ["x" * i for i in range(1, 21)]
+        results = await asyncio.gather(*[batcher.embed(query) for query in queries])
+        await batcher.close()
+        return queries, results
+
+    queries, results = asyncio.run(main())
+    assert [int(row[0]) for row in results] == [len(query) for query in queries]
+    assert [len(batch) for batch in batches] == [8, 8, 4]
+
+
+def test_at_most_max_inflight_batches_run_at_once():
+    running = peak = 0
+
+    async def encode(queries):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return np.zeros((len(queries), 1))
+
+    async def main():
+        batcher = EmbeddingBatcher(
+            encode, max_batch_size=2, max_wait_ms=0, max_inflight=3
+        )
+        await asyncio.gather(*[batcher.embed(str(i)) for i in range(30)])
+        await batcher.close()
+
+    asyncio.run(main())
+    assert peak == 3
+
+
+def test_encode_errors_reach_every_caller_of_the_batch():
+    async def encode(queries):
+        raise RuntimeError("model failed")
+
+    async def main():
+        batcher = EmbeddingBatcher(encode, max_batch_size=4, max_wait_ms=10)
+        results = await asyncio.gather(
+            *[batcher.embed(str(i)) for i in range(4)], return_exceptions=True
+        )
+        await batcher.close()
+        return results
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_cancelled_callers_are_not_encoded():
+    encoded = []
+
+    async def encode(queries):
+        encoded.extend(queries)
+        return np.zeros((len(queries), 1))
+
+    async def main():
+        batcher = EmbeddingBatcher(encode, max_batch_size=8, max_wait_ms=20)
+        gone = asyncio.ensure_future(batcher.embed("gone"))
+        await asyncio.sleep(0)
+        gone.cancel()
+        await batcher.embed("kept")
+        await batcher.close()
+        with pytest.raises(asyncio.CancelledError):
+            await gone
+
+    asyncio.run(main())
+    assert encoded == ["kept"]
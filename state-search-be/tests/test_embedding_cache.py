@@ -0,0 +1,86 @@
+import asyncio
+
+import numpy as np
+
+from state_search_be.embedding_cache import EmbeddingCache
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = EmbeddingCache(maxsize=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    cache.get("a")
+    cache.put("c", [3.0])
+    assert cache.get("b") is None
+    assert cache.get("a")[0] == 1.0 and cache.get("c")[0] == 3.0
+    assert len(cache) == 2
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    cache = EmbeddingCache(ttl=10)
+    cache.put("a", [1.0])
+    now[0] += 5
+    assert cache.get("a") is not None
+    now[0] += 6
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cached_embeddings_are_read_only_float32():
+    embedding = EmbeddingCache().put("a", np.array([1, 2], dtype=np.float64))
+    assert embedding.dtype == np.float32 and not embedding.flags.writeable
+
+
+def test_zero_maxsize_disables_caching():
+    cache = EmbeddingCache(maxsize=0)
+    cache.put("a", [1.0])
+    assert cache.get("a") is None
+
+
+def test_get_many_counts_every_lookup():
+    cache = EmbeddingCache()
+    cache.put("a", [1.0])
+    found, missing = cache.get_many(["a", "b", "a", "c", "b"])
+    assert list(found) == ["a"] and missing == ["b", "c"]
+    assert cache.stats() == {"size": 1, "hits": 3, "misses": 2}
+
+
+def test_concurrent_misses_share_one_computation():
+    calls = []
+
+    async def embed(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return [float(len(key))]
+
+    async def main():
+        cache = EmbeddingCache()
+        results = await asyncio.gather(
+            *[cache.get_or_embed("abc", embed) for _ in range(5)]
+        )
+        again = await cache.get_or_embed("abc", embed)
+        return cache, results, again
+
+    cache, results, again = asyncio.run(main())
+    assert calls == ["abc"]
+    assert all(result is results[0] for result in results) and again is results[0]
+    assert cache.stats() == {"size": 1, "hits": 5, "misses": 1}
+
+
+def test_cancelled_caller_does_not_cancel_the_computation():
+    async def embed(key):
+        await asyncio.sleep(0.01)
+        return [1.0]
+
+    async def main():
+        cache = EmbeddingCache()
+        first = asyncio.ensure_future(cache.get_or_embed("a", embed))
+        second = asyncio.ensure_future(cache.get_or_embed("a", embed))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, cache
+
+    result, cache = asyncio.run(main())
+    assert result[0] == 1.0 and cache.get("a") is not None
@@ -0,0 +1,53 @@
+import numpy as np
+
+from state_search_be.embedding_store import CorpusEmbeddingStore, model_identity
+
+
+def test_keys_separate_models_and_texts(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    store_a = CorpusEmbeddingStore(path, "model-a")
+    store_b = CorpusEmbeddingStore(path, "model-b")
+    key = store_a.key("<VAR>n : Nat", "<GOAL>n = n")
+    assert key == store_a.key("<VAR>n : Nat", "<GOAL>n = n")
+    assert key != store_b.key("<VAR>n : Nat", "<GOAL>n = n")
+    # The separator keeps text moving between context and goal apart
+    assert store_a.key("ab", "c") != store_a.key("a", "bc")
+
+    store_a.put_many([(key, np.array([1, 2], dtype=np.float64))])
+    assert store_b.get_many([store_b.key("<VAR>n : Nat", "<GOAL>n = n")]) == {}
+    found = store_a.get_many([key])
+    assert found[key].dtype == np.float32 and found[key].tolist() == [1, 2]
+    store_a.close()
+    store_b.close()
+
+
+def test_get_many_batches_large_lookups(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    store = CorpusEmbeddingStore(path, "model")
+    keys = [store.key(f"<VAR>x{i}", "<GOAL>") for i in range(2500)]
+    store.put_many((key, [float(i)]) for i, key in enumerate(keys) if i % 2)
+    store.close()
+
+    store = CorpusEmbeddingStore(path, "model")
+    found = store.get_many(keys + keys[:10])
+    assert set(found) == set(keys[1::2])
+    assert all(found[keys[i]].tolist() == [float(i)] for i in range(1, 2500, 2))
+    # Vectors are replaced, not duplicated
+    store.put_many([(keys[1], [-1.0])])
+    assert store.get_many([keys[1]])[keys[1]].tolist() == [-1.0]
+    store.close()
+
+
+def test_model_identity_follows_files_and_options(tmp_path):
+    model = tmp_path / "model"
+    (model / ".cache").mkdir(parents=True)
+    (model / "config.json").write_text("{}")
+    (model / "model.safetensors").write_bytes(b"weights")
+    identity = model_identity(str(model), pooling_method="mean")
+    assert identity == model_identity(str(model), pooling_method="mean")
+    assert identity != model_identity(str(model), pooling_method="cls")
+    # Hidden directories, such as download caches, do not count
+    (model / ".cache" / "lock").write_text("x")
+    assert identity == model_identity(str(model), pooling_method="mean")
+    (model / "model.safetensors").write_bytes(b"retrained")
+    assert identity != model_identity(str(model), pooling_method="mean")
@@ -0,0 +1,490 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from state_search_be.graph_store import (
+    CsrGraph,
+    DbGraph,
+    bounded_bfs,
+    decode_page_token,
+    encode_page_token,
+    sample_key,
+    shortest_paths,
+)
+from state_search_be.state_search.v1.state_search_pb2 import LeanNode
+
+
+def make_graph(edges, edge_only=()):
+    """A `CsrGraph` over `(source, target, edge_type)` triples."""
+    names = sorted({name for edge in edges for name in edge[:2]} | set(edge_only))
+    ids = {name: i for i, name in enumerate(names)}
+    edge_types = sorted({edge[2] for edge in edges})
+    attrs, offsets = b"", [0]
+    for name in names:
+        if name not in edge_only:
+            attrs += LeanNode(name=name).SerializeToString()
+        offsets.append(len(attrs))
+    return CsrGraph(
+        names,
+        attrs,
+        np.array(offsets, dtype=np.int64),
+        np.array([ids[s] for s, _, _ in edges], dtype=np.int32),
+        np.array([ids[t] for _, t, _ in edges], dtype=np.int32),
+        np.array([edge_types.index(t) for _, _, t in edges], dtype=np.uint8),
+        edge_types,
+    )
+
+
+def dict_expander(edges):
+    adjacency = {"dependency": {}, "dependent": {}}
+    for s, t in edges:
+        adjacency["dependency"].setdefault(s, set()).add(t)
+        adjacency["dependent"].setdefault(t, set()).add(s)
+
+    async def expand(frontier, direction):
+        return [sorted(adjacency[direction].get(node, ())) for node in frontier]
+
+    return expand
+
+
+def simple_paths(edges, source, target):
+    children = {}
+    for s, t in edges:
+        children.setdefault(s, set()).add(t)
+    paths = []
+
+    def walk(path):
+        if path[-1] == target:
+            paths.append(path)
+            return
+        for child in children.get(path[-1], ()):
+            if child not in path:
+                walk(path + [child])
+
+    walk([source])
+    return paths
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_shortest_paths_match_enumeration(seed):
+    rng = random.Random(seed)
+    n = rng.randrange(5, 12)
+    edges = {
+        (rng.randrange(n), rng.randrange(n)) for _ in range(rng.randrange(n, 3 * n))
+    }
+    source, target = rng.sample(range(n), 2)
+    k = rng.randrange(1, 6)
+    paths, truncated = asyncio.run(
+        shortest_paths(source, target, dict_expander(edges), k, 10**6)
+    )
+    expected = simple_paths(edges, source, target)
+    assert not truncated
+    assert len(paths) == min(k, len(expected))
+    assert len({tuple(path) for path in paths}) == len(paths)
+    for path in paths:
+        assert path[0] == source and path[-1] == target
+        assert len(set(path)) == len(path)
+        assert all(hop in edges for hop in zip(path, path[1:]))
+    assert [len(path) for path in paths] == sorted(len(p) for p in expected)[:k]
+
+
+def test_shortest_paths_stop_at_the_budget():
+    edges = {(i, i + 1) for i in range(100)}
+    paths, truncated = asyncio.run(shortest_paths(0, 100, dict_expander(edges), 1, 10))
+    assert paths == [] and truncated
+    paths, truncated = asyncio.run(shortest_paths(0, 100, dict_expander(edges), 1, 200))
+    assert paths == [list(range(101))] and not truncated
+
+
+def test_shortest_paths_to_self_and_unreachable():
+    edges = {(0, 1), (2, 1)}
+    assert asyncio.run(shortest_paths(0, 0, dict_expander(edges), 3, 100)) == (
+        [[0]],
+        False,
+    )
+    assert asyncio.run(shortest_paths(0, 2, dict_expander(edges), 3, 100)) == (
+        [],
+        False,
+    )
+
+
+def test_bounded_bfs_stops_at_max_depth():
+    edges = {(i, i + 1) for i in range(5)} | {(2, 0)}
+    expand = dict_expander(edges)
+    assert asyncio.run(bounded_bfs(0, expand, "dependency", 2, 100)) == (
+        {0: 0, 1: 1, 2: 2},
+        False,
+    )
+    assert asyncio.run(bounded_bfs(3, expand, "dependent", 10, 100)) == (
+        {3: 0, 2: 1, 1: 2, 0: 3},
+        False,
+    )
+    assert asyncio.run(bounded_bfs(0, expand, "dependency", 0, 100)) == ({0: 0}, False)
+
+
+def test_bounded_bfs_truncates_at_max_nodes():
+    edges = {(0, i) for i in range(1, 6)} | {(1, 6)}
+    expand = dict_expander(edges)
+    depths, truncated = asyncio.run(bounded_bfs(0, expand, "dependency", 5, 3))
+    assert depths == {0: 0, 1: 1, 2: 1} and truncated
+    # Reaching every node within the limit is not a truncation
+    depths, truncated = asyncio.run(bounded_bfs(0, expand, "dependency", 5, 7))
+    assert len(depths) == 7 and depths[6] == 2 and not truncated
+
+
+TRAVERSAL_EDGES = [
+    ("a", "b", "proof"),
+    ("a", "c", "type"),
+    ("b", "c", "proof"),
+    ("b", "c", "type"),
+    ("c", "d", "proof"),
+    ("d", "a", "proof"),
+    ("b", "e", "type"),
+    ("x", "a", "proof"),
+]
+
+
+def traverse(graph, *args):
+    traversal = asyncio.run(graph.traverse(*args))
+    return (
+        {node.name: depth for node, depth in zip(traversal.nodes, traversal.depths)},
+        sorted(edge.id for edge in traversal.edges),
+        traversal.truncated,
+    )
+
+
+def test_traverse_returns_depths_and_induced_edges():
+    graph = make_graph(TRAVERSAL_EDGES, edge_only=["e"])
+    depths, edges, truncated = traverse(graph, "a", "dependency", 1, 100)
+    assert depths == {"a": 0, "b": 1, "c": 1} and not truncated
+    assert edges == ["proof_a->b", "proof_b->c", "type_a->c", "type_b->c"]
+    # The edge-only node is visited and keeps its edges, but is not returned
+    depths, edges, truncated = traverse(graph, "a", "dependency", 2, 100)
+    assert depths == {"a": 0, "b": 1, "c": 1, "d": 2} and not truncated
+    assert edges == [
+        "proof_a->b",
+        "proof_b->c",
+        "proof_c->d",
+        "proof_d->a",
+        "type_a->c",
+        "type_b->c",
+        "type_b->e",
+    ]
+    depths, edges, _ = traverse(graph, "a", "dependent", 10, 100)
+    assert depths == {"a": 0, "d": 1, "x": 1, "c": 2, "b": 3}
+    assert "proof_x->a" in edges and "type_b->e" not in edges
+
+
+def test_traverse_follows_only_the_requested_edge_types():
+    graph = make_graph(TRAVERSAL_EDGES)
+    depths, edges, _ = traverse(graph, "a", "dependency", 10, 100, ["proof"])
+    assert depths == {"a": 0, "b": 1, "c": 2, "d": 3}
+    assert edges == ["proof_a->b", "proof_b->c", "proof_c->d", "proof_d->a"]
+    depths, edges, _ = traverse(graph, "a", "dependency", 10, 100, ["type"])
+    assert depths == {"a": 0, "c": 1}
+    assert edges == ["type_a->c"]
+
+
+def test_traverse_is_truncated_at_max_nodes():
+    graph = make_graph(TRAVERSAL_EDGES)
+    depths, edges, truncated = traverse(graph, "a", "dependency", 10, 2)
+    assert depths == {"a": 0, "b": 1} and edges == ["proof_a->b"] and truncated
+    assert asyncio.run(graph.traverse("missing", "dependency", 10, 2)) is None
+
+
+def dependency_paths(graph, *args):
+    paths, truncated = asyncio.run(graph.dependency_paths(*args))
+    return [
+        ([node.name for node in path.nodes], [edge.id for edge in path.edges])
+        for path in paths
+    ], truncated
+
+
+def test_dependency_paths_list_the_edges_of_each_hop():
+    graph = make_graph(TRAVERSAL_EDGES, edge_only=["e"])
+    assert dependency_paths(graph, "a", "d", 5, 1000) == (
+        [
+            (["a", "c", "d"], ["type_a->c", "proof_c->d"]),
+            (
+                ["a", "b", "c", "d"],
+                ["proof_a->b", "proof_b->c", "type_b->c", "proof_c->d"],
+            ),
+        ],
+        False,
+    )
+    assert dependency_paths(graph, "a", "d", 5, 1000, ["proof"]) == (
+        [(["a", "b", "c", "d"], ["proof_a->b", "proof_b->c", "proof_c->d"])],
+        False,
+    )
+    assert asyncio.run(graph.dependency_paths("a", "e", 5, 1000)) is None
+
+
+class FakeDb:
+    """Serves the paged `LeanNode` and `LeanEdge` reads of `CsrGraph.load`."""
+
+    def __init__(self, nodes, edges):
+        self.nodes = sorted(nodes)
+        self.edges = [
+            {"id": f"{t}_{s}->{d}", "source": s, "target": d, "edge_type": t}
+            for s, d, t in edges
+        ]
+
+    async def query_raw(self, sql, cursor, limit):
+        if '"LeanNode"' in sql:
+            rows = [
+                {
+                    "name": name,
+                    "const_category": "",
+                    "const_type": "",
+                    "module": "M",
+                    "doc_string": "",
+                    "informal_name": "",
+                    "informal_statement": "",
+                }
+                for name in self.nodes
+                if name > cursor
+            ]
+        else:
+            rows = sorted(
+                (edge for edge in self.edges if edge["id"] > cursor),
+                key=lambda edge: edge["id"],
+            )
+        return rows[:limit]
+
+
+def test_load_of_an_empty_graph():
+    graph = asyncio.run(CsrGraph.load(FakeDb([], [])))
+    assert graph.names == [] and graph.num_edges == 0
+    assert asyncio.run(graph.neighborhood("a", "dependency", 10)) is None
+    assert asyncio.run(graph.reachability([("a", "b")], 10)) == [(False, False)]
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 1000])
+def test_load_interns_names_in_code_point_order(page_size):
+    edges = [
+        ("b", "a", "proof"),
+        ("b", "Z", "type"),
+        ("a", "edge_only", "proof"),
+        ("Z", "b", "proof"),
+    ]
+    db = FakeDb(["b", "a", "Z", "lonely"], edges)
+    graph = asyncio.run(CsrGraph.load(db, page_size=page_size))
+    assert graph.names == ["Z", "a", "b", "edge_only", "lonely"]
+    assert graph.edge_types == ["proof", "type"]
+    assert graph.node(graph.ids["edge_only"]) is None
+    assert graph.node(graph.ids["lonely"]).name == "lonely"
+    neighborhood = asyncio.run(graph.neighborhood("b", "dependency", 10))
+    assert [node.name for node in neighborhood.nodes] == ["Z", "a"]
+    assert sorted(edge.id for edge in neighborhood.edges) == [
+        "proof_b->a",
+        "type_b->Z",
+    ]
+
+
+class FakeEdgeDb:
+    """Serves the `LeanNode` and `LeanEdge` lookups of `DbGraph.reachability`."""
+
+    def __init__(self, nodes, edges):
+        self.edge_queries = 0
+
+        async def find_nodes(where):
+            return [
+                SimpleNamespace(name=name)
+                for name in where["name"]["in"]
+                if name in nodes
+            ]
+
+        async def find_edges(where):
+            self.edge_queries += 1
+            (center, names), *_ = where.items()
+            return [
+                SimpleNamespace(source=s, target=t, edge_type="proof")
+                for s, t in edges
+                if {"source": s, "target": t}[center] in names["in"]
+            ]
+
+        self.leannode = SimpleNamespace(find_many=find_nodes)
+        self.leanedge = SimpleNamespace(find_many=find_edges)
+
+
+def test_db_reachability_answers_from_the_saved_index(tmp_path):
+    path = str(tmp_path / "index.npz")
+    indexed = [("a", "b"), ("b", "c")]
+    graph = make_graph([(s, t, "proof") for s, t in indexed])
+    graph.reachability_index.save(path, graph.names)
+    # Uploaded since the index was built
+    edges = indexed + [("c", "d")]
+    db = FakeEdgeDb({"a", "b", "c", "d"}, edges)
+    db_graph = DbGraph(db, path)
+    pairs = [("a", "c"), ("c", "a"), ("a", "a"), ("a", "missing")]
+    results = asyncio.run(db_graph.reachability(pairs, 100))
+    assert results == [(True, False), (False, False), (True, False), (False, False)]
+    assert db.edge_queries == 0
+    # Pairs with a node the index lacks are traversed
+    assert asyncio.run(db_graph.reachability([("a", "d")], 100)) == [(True, False)]
+    assert db.edge_queries > 0
+
+    # A rebuilt index is picked up
+    graph = make_graph([(t, s, "proof") for s, t in edges])
+    graph.reachability_index.save(path, graph.names)
+    results = asyncio.run(db_graph.reachability([("a", "c"), ("c", "a")], 100))
+    assert results == [(False, False), (True, False)]
+
+
+def test_db_reachability_without_an_index_traverses(tmp_path):
+    db = FakeEdgeDb({"a", "b", "c"}, [("a", "b"), ("b", "c")])
+    db_graph = DbGraph(db, str(tmp_path / "missing.npz"))
+    results = asyncio.run(db_graph.reachability([("a", "c"), ("c", "a")], 100))
+    assert results == [(True, False), (False, False)]
+    assert asyncio.run(db_graph.reachability([("a", "c")], 1)) == [(False, True)]
+
+
+# Computed by Postgres as ('x' || left(md5(value), 16))::bit(64)::bigint
+POSTGRES_SAMPLE_KEYS = {
+    "": -3162216497309240828,
+    "0": -3473083983811222033,
+    "42": -6786705937655499993,
+    "Nat.add_comm": 1107792855042362432,
+    "_root_.foo": -7177754204536122146,
+    "Nat.succ_le_iff": 5453822610640543703,
+    "∀ x, x = x": -3887184178167458789,
+}
+
+
+def test_sample_key_matches_postgres():
+    assert {value: sample_key(value) for value in POSTGRES_SAMPLE_KEYS} == (
+        POSTGRES_SAMPLE_KEYS
+    )
+
+
+def hub_graph():
+    edges = [("hub", "hub", "proof"), ("hub", "zz", "proof"), ("x", "hub", "type")]
+    for i in range(30):
+        edges.append(("hub", f"N.{i}", "proof"))
+        if i % 3 == 0:
+            edges.append(("hub", f"N.{i}", "type"))
+    return make_graph(edges, edge_only=["zz"])
+
+
+@pytest.mark.parametrize("seed", [0, 1, 42])
+def test_neighborhood_samples_the_lowest_keys_for_the_seed(seed):
+    graph = hub_graph()
+    neighbors = [f"N.{i}" for i in range(30)] + ["zz"]
+    expected = sorted(
+        neighbors, key=lambda name: sample_key(name) ^ sample_key(str(seed))
+    )[:10]
+    sample = asyncio.run(graph.neighborhood("hub", "dependency", 10, seed))
+    sampled = {edge.target for edge in sample.edges} - {"hub"}
+    assert sampled == set(expected)
+    # The edge-only neighbor has edges but no node
+    assert [node.name for node in sample.nodes] == sorted(set(expected) - {"zz"})
+    again = asyncio.run(graph.neighborhood("hub", "dependency", 10, seed))
+    assert again == sample
+
+
+def test_neighborhood_keeps_the_center_and_self_loops_and_counts_everything():
+    graph = hub_graph()
+    samples = [
+        asyncio.run(graph.neighborhood("hub", "dependency", 5, seed))
+        for seed in range(5)
+    ]
+    assert len({tuple(node.name for node in s.nodes) for s in samples}) > 1
+    for sample in samples:
+        assert sample.node.name == "hub"
+        assert "hub" not in {node.name for node in sample.nodes}
+        assert "proof_hub->hub" in {edge.id for edge in sample.edges}
+        assert sample.neighbor_count == 31
+        assert sample.edge_count == 42
+        # Both edges to a sampled neighbor are kept
+        for node in sample.nodes:
+            count = 2 if int(node.name[2:]) % 3 == 0 else 1
+            assert sum(edge.target == node.name for edge in sample.edges) == count
+
+    full = asyncio.run(graph.neighborhood("hub", "dependency", 100))
+    assert len(full.nodes) == 30 and len(full.edges) == 42
+    assert full.neighbor_count == 31 and full.edge_count == 42
+    dependents = asyncio.run(graph.neighborhood("hub", "dependent", 100))
+    assert [node.name for node in dependents.nodes] == ["x"]
+    assert sorted(edge.id for edge in dependents.edges) == [
+        "proof_hub->hub",
+        "type_x->hub",
+    ]
+    assert (dependents.neighbor_count, dependents.edge_count) == (1, 2)
+
+
+# Names that sort differently by code point and by a linguistic collation
+NAMES = ["NAT", "Nat.Add", "Nat.add", "Nat.add_comm", "Nat_x", "_root_.foo", "nat"]
+
+
+def random_edges(rng):
+    names = NAMES + [f"N.{i}" for i in range(40)]
+    edges = set()
+    for _ in range(400):
+        source, target = rng.choice(names), rng.choice(names)
+        edges.add((source, target, rng.choice(["proof", "type"])))
+    edges.add(("hub", "hub", "proof"))
+    for name in names:
+        edges.add(("hub", name, rng.choice(["proof", "type"])))
+        edges.add((name, "hub", "proof"))
+    return sorted(edges)
+
+
+def read_pages(graph, name, direction, page_size):
+    pages, after = [], ""
+    while True:
+        page = asyncio.run(graph.neighborhood_page(name, direction, page_size, after))
+        pages.append(page)
+        if page.last is None:
+            return pages
+        after = page.last
+
+
+@pytest.mark.parametrize("direction", ["dependency", "dependent"])
+@pytest.mark.parametrize("page_size", [1, 3, 10, 1000])
+def test_pages_concatenate_to_the_neighborhood(direction, page_size):
+    graph = make_graph(random_edges(random.Random(0)), edge_only=["Nat_x"])
+    for name in ["hub", "Nat.add", "N.3"]:
+        pages = read_pages(graph, name, direction, page_size)
+        full = asyncio.run(graph.neighborhood(name, direction, 10**6))
+        assert [node for page in pages for node in page.nodes] == full.nodes
+        # Self-loops come with the first page, out of name order
+        assert sorted(edge.id for page in pages for edge in page.edges) == sorted(
+            edge.id for edge in full.edges
+        )
+        neighbor = "target" if direction == "dependency" else "source"
+        names = [
+            getattr(edge, neighbor)
+            for page in pages
+            for edge in page.edges
+            if getattr(edge, neighbor) != name
+        ]
+        # Neighbors come in code point order, a page at a time
+        assert names == sorted(names)
+        for page in pages:
+            assert len({getattr(edge, neighbor) for edge in page.edges} - {name}) <= (
+                page_size
+            )
+        # Self-loops only come with the first page
+        assert all(
+            edge.source != edge.target for page in pages[1:] for edge in page.edges
+        )
+
+
+def test_page_of_unknown_or_edge_only_node():
+    graph = make_graph([("a", "b", "proof")], edge_only=["b"])
+    assert asyncio.run(graph.neighborhood_page("missing", "dependency", 10)) is None
+    assert asyncio.run(graph.neighborhood_page("b", "dependent", 10)) is None
+    page = asyncio.run(graph.neighborhood_page("a", "dependency", 10))
+    assert page.nodes == [] and len(page.edges) == 1 and page.last is None
+
+
+def test_page_tokens_are_bound_to_their_request():
+    token = encode_page_token("Nat.add", "dependent", "Nat.add_comm")
+    assert decode_page_token(token, "Nat.add", "dependent") == "Nat.add_comm"
+    with pytest.raises(ValueError):
+        decode_page_token(token, "Nat.add", "dependency")
+    with pytest.raises(ValueError):
+        decode_page_token("not a token", "Nat.add", "dependent")
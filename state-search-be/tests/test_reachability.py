@@ -0,0 +1,100 @@
+import random
+
+import numpy as np
+import pytest
+
+from state_search_be.reachability import (
+    ReachabilityIndex,
+    strongly_connected_components,
+)
+
+
+def to_csr(n, edges):
+    edges = sorted(set(edges))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount([s for s, _ in edges], minlength=n), out=indptr[1:])
+    return indptr, np.array([t for _, t in edges], dtype=np.int32)
+
+
+def closure(n, edges):
+    children = [[] for _ in range(n)]
+    for s, t in edges:
+        children[s].append(t)
+    reach = []
+    for start in range(n):
+        seen, stack = {start}, [start]
+        while stack:
+            for child in children[stack.pop()]:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        reach.append(seen)
+    return reach
+
+
+def random_dag(rng, n, m):
+    edges = set()
+    while len(edges) < m:
+        s, t = rng.sample(range(n), 2)
+        edges.add((max(s, t), min(s, t)))
+    return list(edges)
+
+
+def random_digraph(rng, n, m):
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+
+
+GRAPHS = [
+    ("dag", lambda rng: (200, random_dag(rng, 200, 500))),
+    ("sparse_dag", lambda rng: (300, random_dag(rng, 300, 250))),
+    ("cyclic", lambda rng: (200, random_digraph(rng, 200, 300))),
+    ("dense_cyclic", lambda rng: (100, random_digraph(rng, 100, 400))),
+    ("chain", lambda rng: (50, [(i + 1, i) for i in range(49)])),
+    ("empty", lambda rng: (10, [])),
+]
+
+
+@pytest.mark.parametrize("name,make", GRAPHS, ids=[name for name, _ in GRAPHS])
+@pytest.mark.parametrize("num_landmarks", [256, 4])
+def test_reachable_matches_transitive_closure(name, make, num_landmarks):
+    rng = random.Random(name)
+    n, edges = make(rng)
+    index = ReachabilityIndex.build(*to_csr(n, edges), num_landmarks=num_landmarks)
+    reach = closure(n, edges)
+    for source in range(n):
+        for target in range(n):
+            assert index.reachable(source, target) == (target in reach[source]), (
+                source,
+                target,
+            )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_components_are_mutually_reachable_and_topologically_numbered(seed):
+    rng = random.Random(seed)
+    n, edges = 150, random_digraph(rng, 150, 250)
+    component, count = strongly_connected_components(*to_csr(n, edges))
+    reach = closure(n, edges)
+    assert sorted(set(component.tolist())) == list(range(count))
+    for a in range(n):
+        for b in range(n):
+            same = a in reach[b] and b in reach[a]
+            assert (component[a] == component[b]) == same
+    for s, t in edges:
+        assert component[s] >= component[t]
+
+
+@pytest.mark.parametrize("n", [0, 1, 50])
+def test_saved_index_answers_like_the_built_one(tmp_path, n):
+    rng = random.Random(n)
+    edges = random_digraph(rng, n, 2 * n) if n else []
+    names = [f"Nat.lemma_{i}" if i % 7 else f"émoji_{i}" for i in range(n)]
+    index = ReachabilityIndex.build(*to_csr(n, edges))
+    path = str(tmp_path / "index.npz")
+    index.save(path, names)
+    loaded_names, loaded = ReachabilityIndex.load(path)
+    assert loaded_names == names
+    assert loaded.nbytes == index.nbytes
+    for source in range(n):
+        for target in range(n):
+            assert loaded.reachable(source, target) == index.reachable(source, target)
@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+
+from prisma.errors import PrismaError
+
+from state_search_be.rev_registry import RevRegistry
+
+
+class FakeDb:
+    """The `Rev` table, and the revs of the `Theorem` table."""
+
+    def __init__(self, rows, theorem_revs):
+        self.rows = {rev: SimpleNamespace(rev=rev, updateAt=0) for rev in rows}
+        self.theorem_revs = theorem_revs
+        self.fail_upsert = False
+        self.fail_find = False
+        self.rev = self
+        self.theorem = self
+
+    async def find_many(self, order=None):
+        if self.fail_find:
+            raise PrismaError("database is down")
+        return [SimpleNamespace(**vars(self.rows[rev])) for rev in sorted(self.rows)]
+
+    async def query_raw(self, sql):
+        return [{"rev": rev} for rev in self.theorem_revs]
+
+    async def count(self, where):
+        return 10
+
+    async def upsert(self, where, data):
+        if self.fail_upsert:
+            raise PrismaError("read-only")
+        self.touch(where["rev"])
+
+    def touch(self, rev):
+        row = self.rows.setdefault(rev, SimpleNamespace(rev=rev, updateAt=0))
+        row.updateAt += 1
+
+
+def test_first_refresh_registers_the_revs_of_the_theorem_table():
+    db = FakeDb(["v2"], ["v1", "v2", "v3"])
+    registry = RevRegistry(db)
+    assert asyncio.run(registry.revs()) == ["v1", "v2", "v3"]
+    assert {rev: row.updateAt for rev, row in db.rows.items()} == {
+        "v1": 1,
+        "v2": 0,
+        "v3": 1,
+    }
+
+
+def test_changed_and_removed_revs_are_reported():
+    db = FakeDb(["v1", "v2", "v3"], [])
+    changed = []
+    registry = RevRegistry(db, on_change=changed.append)
+    asyncio.run(registry.refresh())
+    assert changed == []
+    db.touch("v1")
+    del db.rows["v2"]
+    db.touch("v4")
+    asyncio.run(registry.refresh())
+    assert sorted(changed) == ["v1", "v2"]
+    assert asyncio.run(registry.revs()) == ["v1", "v3", "v4"]
+    asyncio.run(registry.refresh())
+    assert sorted(changed) == ["v1", "v2"]
+
+
+def test_revs_of_the_theorem_table_are_listed_until_backfill_succeeds():
+    db = FakeDb(["v1"], ["v1", "v2"])
+    db.fail_upsert = True
+    registry = RevRegistry(db)
+    assert asyncio.run(registry.revs()) == ["v1", "v2"]
+    assert registry.info["v2"] is None
+    db.fail_upsert = False
+    db.theorem_revs = ["v1", "v2", "v3"]
+    asyncio.run(registry.refresh())
+    assert asyncio.run(registry.revs()) == ["v1", "v2", "v3"] and "v3" in db.rows
+    # Once backfilled, only the Rev table counts
+    db.theorem_revs = ["v9"]
+    asyncio.run(registry.refresh())
+    assert asyncio.run(registry.revs()) == ["v1", "v2", "v3"]
+
+
+def test_failed_refresh_keeps_the_last_revs():
+    db = FakeDb(["v1"], ["v1"])
+    db.fail_find = True
+    registry = RevRegistry(db)
+    assert asyncio.run(registry.revs()) == []
+    db.fail_find = False
+    asyncio.run(registry.refresh())
+    db.fail_find = True
+    asyncio.run(registry.refresh())
+    assert asyncio.run(registry.revs()) == ["v1"]
+
+
+def test_stale_revs_refresh_in_the_background():
+    db = FakeDb(["v1"], [])
+
+    async def main():
+        registry = RevRegistry(db, ttl=0)
+        assert await registry.revs() == ["v1"]
+        db.touch("v2")
+        # Answered from memory while the refresh runs
+        assert await registry.revs() == ["v1"]
+        await registry._refreshing
+        return await registry.revs()
+
+    assert asyncio.run(main()) == ["v1", "v2"]
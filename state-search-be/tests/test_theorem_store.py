@@ -0,0 +1,107 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from state_search_be.theorem_store import TheoremStore, to_code
+
+
+def theorem(i, rev, goal_length=1):
+    return SimpleNamespace(
+        id=f"{rev}-{i:03d}",
+        name=f"Nat.thm_{i}",
+        args=["(n : Nat)"],
+        goal="x" * goal_length,
+        module="Mathlib.Nat",
+        formal_type="∀ n, n = n",
+    )
+
+
+class FakeDb:
+    """Serves the paged theorem reads of `iter_theorem_pages`."""
+
+    def __init__(self, revs):
+        self.revs = revs
+        self.theorem = self
+        self.loads = []
+
+    async def find_many(self, where, order, take, cursor=None, skip=0):
+        rows = sorted(self.revs.get(where["rev"], []), key=lambda row: row.id)
+        if cursor is None:
+            self.loads.append(where["rev"])
+        else:
+            rows = [row for row in rows if row.id > cursor["id"]]
+        return rows[:take]
+
+
+@pytest.mark.parametrize("page_size", [1, 3, 1000])
+def test_results_round_trip_in_the_requested_order(page_size):
+    # Goals of 1 and 300 characters give frames with one and two byte lengths
+    rows = [theorem(i, "v", 1 if i % 2 else 300) for i in range(7)]
+    store = TheoremStore(FakeDb({"v": rows}), page_size=page_size)
+    ids = ["v-005", "unknown", "v-000", "v-003", "v-000"]
+    response = asyncio.run(store.results("v", ids))
+    assert [result.id for result in response.results] == [
+        "v-005",
+        "v-000",
+        "v-003",
+        "v-000",
+    ]
+    for result in response.results:
+        row = rows[int(result.id[2:])]
+        assert result.name == row.name and result.rev == "v"
+        assert result.code == to_code(row.name, row.args, row.goal)
+        assert result.module == row.module
+        assert result.formal_type == row.formal_type
+    assert asyncio.run(store.results("v", [])).results == []
+
+
+def test_unknown_ids_reload_a_rev_at_most_once_per_interval(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    db = FakeDb({"v": [theorem(0, "v")]})
+    store = TheoremStore(db, min_reload_interval=60)
+    asyncio.run(store.results("v", ["v-000"]))
+    db.revs["v"].append(theorem(1, "v"))
+    now[0] += 10
+    assert asyncio.run(store.results("v", ["v-001"])).results == []
+    now[0] += 60
+    assert [r.id for r in asyncio.run(store.results("v", ["v-001"])).results] == [
+        "v-001"
+    ]
+    # Known ids never reload
+    now[0] += 600
+    asyncio.run(store.results("v", ["v-000", "v-001"]))
+    assert db.loads == ["v", "v"]
+
+
+def test_invalidated_revs_are_reloaded():
+    db = FakeDb({"v": [theorem(0, "v")]})
+    store = TheoremStore(db)
+    asyncio.run(store.results("v", ["v-000"]))
+    store.invalidate("v")
+    asyncio.run(store.results("v", ["v-000"]))
+    assert db.loads == ["v", "v"]
+
+
+def test_least_recently_searched_rev_is_evicted():
+    db = FakeDb({rev: [theorem(0, rev)] for rev in "abc"})
+    store = TheoremStore(db, max_revs=2)
+    for rev in ["a", "b", "a", "c", "a", "b"]:
+        response = asyncio.run(store.results(rev, [f"{rev}-000"]))
+        assert [result.rev for result in response.results] == [rev]
+    # "b" was evicted by "c", and "c" then by "b"
+    assert db.loads == ["a", "b", "c", "b"]
+
+
+def test_concurrent_misses_load_a_rev_once():
+    db = FakeDb({"v": [theorem(i, "v") for i in range(3)]})
+    store = TheoremStore(db, page_size=1)
+
+    async def main():
+        return await asyncio.gather(
+            *[store.results("v", [f"v-00{i}"]) for i in range(3)]
+        )
+
+    assert [len(response.results) for response in asyncio.run(main())] == [1, 1, 1]
+    assert db.loads == ["v"]
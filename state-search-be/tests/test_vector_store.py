@@ -0,0 +1,69 @@
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from state_search_be.vector_store import (
+    MmapVectorStore,
+    VectorStoreWriter,
+    read_manifest,
+    rev_path,
+    top_k,
+)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 64, 1000])
+@pytest.mark.parametrize("limit", [1, 5, 300])
+def test_top_k_matches_a_full_sort(chunk_rows, limit):
+    rng = np.random.default_rng(chunk_rows)
+    matrix = rng.standard_normal((200, 16)).astype(np.float16)
+    queries = rng.standard_normal((4, 16)).astype(np.float32)
+    indices, scores = top_k(matrix, queries, limit, chunk_rows=chunk_rows)
+    expected = queries @ matrix.astype(np.float32).T
+    k = min(limit, len(matrix))
+    assert indices.shape == scores.shape == (len(queries), k)
+    for row, (row_indices, row_scores) in enumerate(zip(indices, scores)):
+        assert len(set(row_indices.tolist())) == k
+        np.testing.assert_allclose(
+            row_scores, expected[row, row_indices], rtol=1e-5, atol=1e-5
+        )
+        np.testing.assert_allclose(
+            row_scores, np.sort(expected[row])[::-1][:k], rtol=1e-5, atol=1e-5
+        )
+
+
+@pytest.mark.parametrize("rev", ["", ".", "..", ".hidden", "a/b", "../x", "a\0b"])
+def test_rev_path_rejects_revs_leaving_the_root(rev):
+    with pytest.raises(ValueError):
+        rev_path("/data", rev)
+
+
+def write_rev(root, rev, ids, embeddings):
+    writer = VectorStoreWriter(root, rev, capacity=len(ids) + 2, dim=2)
+    writer.append(ids, embeddings)
+    return writer.close(model="test")
+
+
+def test_written_revs_are_searched_and_replaced(tmp_path):
+    root = str(tmp_path)
+    write_rev(root, "v1", ["a", "b"], np.array([[1, 0], [0, 1]]))
+    store = MmapVectorStore(root, chunk_rows=1)
+    hits = asyncio.run(store.search("v1", np.array([0.2, 1.0]), 1))
+    assert [hit.payload["id"] for hit in hits] == ["b"]
+    old = os.path.realpath(rev_path(root, "v1"))
+
+    write_rev(root, "v1", ["c"], np.array([[1, 1]]))
+    assert read_manifest(root, "v1")["count"] == 1
+    assert not os.path.exists(old)
+    results = asyncio.run(
+        store.search_batch("v1", [np.array([1.0, 0.0]), np.array([0.0, 1.0])], 5)
+    )
+    assert [[hit.payload["id"] for hit in hits] for hits in results] == [["c"], ["c"]]
+
+
+def test_unknown_or_invalid_revs_are_missing(tmp_path):
+    store = MmapVectorStore(str(tmp_path))
+    for rev in ["missing", "../etc"]:
+        with pytest.raises(KeyError):
+            store.open(rev)